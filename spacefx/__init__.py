@@ -1,9 +1,17 @@
-from spacefx import protos
-from spacefx import _sdk_client
-from spacefx import client
-from spacefx import logging
-from spacefx import position
-from spacefx import link
-from spacefx import sensor
-
-logger = logging.__SpaceFxLogger
+import importlib
+
+# Submodules are imported on first access rather than here, so that importing spacefx.protos (or anything else that
+# doesn't need the SDK, such as spacefx._sensor_worker in sensor data worker processes) doesn't start the .NET runtime
+__all__ = ["protos", "client", "diagnostics", "health", "logging", "position", "link", "sensor", "logger"]
+
+
+def __getattr__(name):
+    if name == "logger":
+        return importlib.import_module(f"{__name__}.logging").__SpaceFxLogger
+    if name in __all__ or name == "_sdk_client":
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,103 @@
+import ctypes
+import ctypes.util
+import os
+import struct
+from typing import Iterator, List, Optional, Tuple
+
+# Event masks from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_BUFFER_SIZE = 64 * 1024
+
+_libc = None
+
+
+def _load_libc():
+    global _libc
+    if _libc is None:
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        # Touch the symbols now so a missing inotify implementation fails at init rather than mid-watch
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        _libc = libc
+    return _libc
+
+
+def is_available() -> bool:
+    """
+    Returns True if the running kernel and libc support inotify
+    """
+    try:
+        _load_libc()
+        return True
+    except (OSError, AttributeError):
+        return False
+
+
+class Inotify:
+    """
+    Thin ctypes wrapper around the Linux inotify API
+
+    Only the pieces needed by the xfer inbox watcher are exposed: add a watch, remove a watch,
+    and read a batch of events from the (non-blocking) file descriptor.
+    """
+
+    def __init__(self):
+        libc = _load_libc()
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+        self.fd = fd
+
+    def add_watch(self, path: str, mask: int) -> int:
+        wd = _libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed for '{path}': {os.strerror(errno)}")
+        return wd
+
+    def rm_watch(self, wd: int):
+        _libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self) -> List[Tuple[int, int, int, Optional[str]]]:
+        """
+        Reads all pending events.  Returns a list of (wd, mask, cookie, name) tuples
+        """
+        try:
+            buffer = os.read(self.fd, _READ_BUFFER_SIZE)
+        except BlockingIOError:
+            return []
+        return list(_parse_events(buffer))
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def _parse_events(buffer: bytes) -> Iterator[Tuple[int, int, int, Optional[str]]]:
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(buffer):
+        wd, mask, cookie, name_length = _EVENT_HEADER.unpack_from(buffer, offset)
+        offset += _EVENT_HEADER.size
+        name = buffer[offset:offset + name_length].rstrip(b"\0")
+        offset += name_length
+        yield wd, mask, cookie, os.fsdecode(name) if name else None
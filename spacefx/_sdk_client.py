@@ -66,6 +66,8 @@ import Microsoft.Azure.SpaceFx
 # And you can create an instance of the Client class like this
 __sdk_client = Microsoft.Azure.SpaceFx.SDK.Client
 __sdk_core = Microsoft.Azure.SpaceFx.Core
+__sdk_diagnostics = Microsoft.Azure.SpaceFx.SDK.Diagnostics
+__sdk_health = Microsoft.Azure.SpaceFx.SDK.Health
 __sdk_link = Microsoft.Azure.SpaceFx.SDK.Link
 __sdk_logging = Microsoft.Azure.SpaceFx.SDK.Logging
 __sdk_position = Microsoft.Azure.SpaceFx.SDK.Position
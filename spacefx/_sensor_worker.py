@@ -0,0 +1,62 @@
+"""
+Worker process side of spacefx.sensor.SensorDataProcessPool.
+
+This module is imported in every worker process, so it must only depend on the protobuf classes.  Importing the rest of
+spacefx here would start the .NET runtime and register the SDK event handlers in each worker.
+"""
+import time
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional, Tuple
+
+from spacefx.protos.sensor.Sensor_pb2 import SensorData
+
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+_worker_callback: Optional[Callable[[SensorData], Any]] = None
+
+
+def init_worker(shm_name: str, callback_function: Callable[[SensorData], Any]):
+    """
+    ProcessPoolExecutor initializer: attaches to the pool's shared memory ring and stores the callback
+    """
+    global _worker_shm, _worker_callback
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_callback = callback_function
+
+
+def process_ring_region(offset: int, length: int) -> Tuple[Any, float]:
+    """
+    Parses the SensorData written to [offset, offset + length) of the shared memory ring and runs the callback on it.
+    Returns the callback's result and how long it took in seconds
+    """
+    sensor_data = SensorData()
+    sensor_data.ParseFromString(_worker_shm.buf[offset:offset + length])
+    return _timed_callback(sensor_data)
+
+
+def process_bytes(sensor_data_bytes: bytes) -> Tuple[Any, float]:
+    """
+    Parses a SensorData that didn't fit in the shared memory ring and runs the callback on it.
+    Returns the callback's result and how long it took in seconds
+    """
+    sensor_data = SensorData()
+    sensor_data.ParseFromString(sensor_data_bytes)
+    return _timed_callback(sensor_data)
+
+
+def process_spilled(sensor_data_header: bytes, payload_path: str, payload_length: int) -> Tuple[Any, float]:
+    """
+    Reads a payload spilled to payload_path into the SensorData header and runs the callback on it.
+    Returns the callback's result and how long it took in seconds
+    """
+    sensor_data = SensorData()
+    sensor_data.ParseFromString(sensor_data_header)
+    with open(payload_path, "rb") as payload_file:
+        sensor_data.data.value = payload_file.read(payload_length)
+    return _timed_callback(sensor_data)
+
+
+def _timed_callback(sensor_data: SensorData) -> Tuple[Any, float]:
+    # Timed here, since the profiler and spacefx.diagnostics.timed_call only see the parent process
+    start = time.perf_counter()
+    result = _worker_callback(sensor_data)
+    return result, time.perf_counter() - start
@@ -0,0 +1,522 @@
+"""
+Load generator for payload apps built on the Microsoft Azure Orbital Space SDK
+
+Drives a mix of sensor tasking, logging, telemetry, link and position requests through the public spacefx APIs
+and reports throughput, latency percentiles, CPU and memory usage.  The log_batch and telemetry_batch workloads send
+--batch-size records per request, so compare their records/s against the log and telemetry workloads.
+
+Usage:
+    python -m spacefx.bench --duration 60 --concurrency 8 --mix log=5,telemetry=3,sensor_tasking=1,position=1
+    python -m spacefx.bench --target standin --standin-latency-ms 2 --output run.json
+    python -m spacefx.bench --mix log=1,log_batch=1 --batch-size 500
+    python -m spacefx.bench --baseline run.json --max-regression-pct 10
+    python -m spacefx.bench --allocation-calls 1000 --output allocations.json
+
+--target live (the default) builds the SDK client and sends every request to the deployed host services.
+--target standin replaces the SDK's host service classes (the objects in spacefx._sdk_client) with an in-process
+stand-in that answers after a configurable delay.  The spacefx API functions and the .NET response conversion still
+run, but the SDK's messaging (heartbeat checks, DirectToApp and waiting for the response) doesn't, so the results
+measure the Python and pythonnet side of each request without a cluster.
+
+--allocation-calls N adds an allocation pass after the timed run: each workload is called N times on one thread while
+tracemalloc watches the Python heap and GC.GetTotalAllocatedBytes counts the .NET heap.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from threading import Event, Lock, Thread
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+from spacefx.protos.common.Common_pb2 import StatusCodes
+
+WORKLOADS = ("sensor_tasking", "log", "telemetry", "link", "position", "log_batch", "telemetry_batch")
+BATCH_WORKLOADS = ("log_batch", "telemetry_batch")
+PERCENTILES = (50, 90, 99)
+# tracemalloc.reset_peak() is new in Python 3.9
+_HAS_RESET_PEAK = hasattr(tracemalloc, "reset_peak")
+
+
+class _OperationStats:
+    def __init__(self):
+        self.lock = Lock()
+        self.latencies_ms: List[float] = []
+        self.errors = 0
+        self.last_error: Optional[str] = None
+
+    def record(self, latency_ms: float, error: Optional[Exception] = None):
+        with self.lock:
+            if error is None:
+                self.latencies_ms.append(latency_ms)
+            else:
+                self.errors += 1
+                self.last_error = f"{type(error).__name__}: {error}"
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * percentile / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    """
+    Parses a request mix such as "log=5,telemetry=2,position" into workload weights.  A workload without a weight gets 1.
+    """
+    weights = {}
+    for entry in filter(None, (part.strip() for part in mix.split(","))):
+        name, _, weight = entry.partition("=")
+        if name not in WORKLOADS:
+            raise argparse.ArgumentTypeError(f"Unknown workload '{name}'.  Expected one of: {', '.join(WORKLOADS)}")
+        weights[name] = int(weight) if weight else 1
+        if weights[name] < 0:
+            raise argparse.ArgumentTypeError(f"Weight for '{name}' must be 0 or greater")
+    if not any(weights.values()):
+        raise argparse.ArgumentTypeError("The request mix needs at least one workload with a weight above 0")
+    return weights
+
+
+class _CompletedTask:
+    """
+    Stands in for the System.Threading.Tasks.Task the SDK returns.  The response is ready by the time the call returns.
+    """
+
+    def __init__(self, result):
+        self.Result = result
+
+    def Wait(self, *_):
+        return True
+
+
+class StandInHostServices:
+    """
+    In-process stand-in for the SDK's host service classes.
+
+    install() replaces the Logging, Sensor, Link and Position objects in spacefx._sdk_client before the spacefx API modules
+    import them, so the benchmark still calls spacefx.logging.send_log_message, spacefx.sensor.sensor_tasking and the rest
+    unmodified, including their argument conversion and the real __sdk_utils.ConvertProtoToBytes on the response.  What it
+    skips is the SDK's messaging: waiting for the host service's heartbeat, DirectToApp through the Dapr sidecar and waiting
+    for the response.  Each call sleeps for latency_ms (+/- jitter_pct) instead and returns a SUCCESSFUL .NET response.
+
+    The .NET runtime and SDK assembly are still loaded, but the SDK client is not built, so no cluster is needed.
+    """
+
+    def __init__(self, latency_ms: float = 1.0, jitter_pct: float = 20.0):
+        self.latency_ms = latency_ms
+        self.jitter_pct = jitter_pct
+
+    def install(self):
+        """
+        Swaps the stand-in into spacefx._sdk_client.  Must run before spacefx.logging, sensor, link or position are imported.
+        """
+        imported = [name for name in ("spacefx.client", "spacefx.logging", "spacefx.sensor", "spacefx.link", "spacefx.position") if name in sys.modules]
+        if imported:
+            raise RuntimeError(f"The stand-in must be installed before {', '.join(imported)} is imported")
+
+        from spacefx import _sdk_client
+        import Microsoft.Azure.SpaceFx.MessageFormats.Common as common
+        import Microsoft.Azure.SpaceFx.MessageFormats.HostServices.Link as link
+        import Microsoft.Azure.SpaceFx.MessageFormats.HostServices.Position as position
+        import Microsoft.Azure.SpaceFx.MessageFormats.HostServices.Sensor as sensor
+        from System import TimeSpan
+
+        self._common = common
+        self._time_span = TimeSpan
+
+        respond = self._respond
+        batch = self._send_batch
+        services = {
+            "__sdk_logging": SimpleNamespace(
+                SendLogMessage=lambda *args, **kwargs: respond(common.LogMessageResponse),
+                SendTelemetry=lambda *args, **kwargs: respond(common.TelemetryMetricResponse),
+                SendMultiTelemetry=lambda *args, **kwargs: respond(common.TelemetryMultiMetricResponse),
+                SendLogMessages=lambda batch_bytes, *args, **kwargs: batch(batch_bytes),
+                SendTelemetryBatch=lambda batch_bytes, *args, **kwargs: batch(batch_bytes),
+            ),
+            "__sdk_sensor": SimpleNamespace(
+                GetAvailableSensors=lambda *args, **kwargs: respond(sensor.SensorsAvailableResponse),
+                SensorTaskingPreCheck=lambda sensorId, **kwargs: respond(sensor.TaskingPreCheckResponse, SensorID=sensorId),
+                SensorTasking=lambda sensorId, **kwargs: respond(sensor.TaskingResponse, SensorID=sensorId),
+            ),
+            "__sdk_link": SimpleNamespace(
+                SendFileToApp=lambda destinationAppId, file, **kwargs: self._send_file(link.LinkResponse, file),
+            ),
+            "__sdk_position": SimpleNamespace(
+                LastKnownPosition=lambda *args, **kwargs: respond(position.PositionResponse),
+            ),
+        }
+        for name, service in services.items():
+            setattr(_sdk_client, name, service)
+
+    def _wait(self):
+        if self.latency_ms > 0:
+            jitter = 1 + random.uniform(-self.jitter_pct, self.jitter_pct) / 100
+            time.sleep(self.latency_ms * jitter / 1000)
+
+    def _respond(self, response_type, **fields) -> _CompletedTask:
+        self._wait()
+        response = response_type()
+        response.ResponseHeader = self._common.ResponseHeader()
+        response.ResponseHeader.Status = self._common.StatusCodes.Successful
+        for name, value in fields.items():
+            setattr(response, name, value)
+        return _CompletedTask(response)
+
+    def _send_file(self, response_type, filepath: str) -> _CompletedTask:
+        # The SDK copies the file into the outbox before sending the request
+        with open(filepath, "rb") as link_file:
+            link_file.read()
+        return self._respond(response_type)
+
+    def _send_batch(self, batch_bytes) -> _CompletedTask:
+        # One round trip per batch, mirroring Logging.SendLogMessages
+        requested = _count_delimited(bytes(batch_bytes))
+        start = time.perf_counter()
+        self._wait()
+        return _CompletedTask(SimpleNamespace(Requested=requested, Sent=requested, Failed=0, Errors=[],
+                                              Duration=self._time_span.FromSeconds(time.perf_counter() - start)))
+
+
+def _count_delimited(buffer: bytes) -> int:
+    # Counts the length-delimited messages in buffer by walking their varint length prefixes
+    count = position = 0
+    while position < len(buffer):
+        length = shift = 0
+        while True:
+            byte = buffer[position]
+            position += 1
+            length |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        position += length
+        count += 1
+    return count
+
+
+def build_operations(args: argparse.Namespace, link_file: str) -> Dict[str, Callable[[int], object]]:
+    """
+    Returns a callable per workload.  Each is called with a sequence number and performs one request.
+    """
+    log_message = "x" * args.payload_bytes
+    log_batch = [log_message] * args.batch_size
+
+    import spacefx
+    if args.target == "standin":
+        StandInHostServices(latency_ms=args.standin_latency_ms, jitter_pct=args.standin_jitter_pct).install()
+        link_destination = args.link_destination or "standin-app"
+    else:
+        spacefx.client.build()
+        link_destination = args.link_destination or spacefx.client.get_app_id()
+
+    send_log_message = spacefx.logging.send_log_message
+    send_telemetry = spacefx.logging.send_telemetry
+    send_log_messages = spacefx.logging.send_log_messages
+    send_telemetry_batch = spacefx.logging.send_telemetry_batch
+    sensor_tasking = spacefx.sensor.sensor_tasking
+    send_file_to_app = spacefx.link.send_file_to_app
+    request_position = spacefx.position.request_position
+
+    timeout = args.response_timeout_seconds
+    return {
+        "sensor_tasking": lambda sequence: sensor_tasking(args.sensor_id, response_timeout_seconds=timeout),
+        "log": lambda sequence: send_log_message(log_message, response_timeout_seconds=timeout),
+        "telemetry": lambda sequence: send_telemetry("spacefx_bench", sequence, response_timeout_seconds=timeout),
+        "link": lambda sequence: send_file_to_app(link_destination, link_file, overwrite_destination_file=True, response_timeout_seconds=timeout),
+        "position": lambda sequence: request_position(response_timeout_seconds=timeout),
+        "log_batch": lambda sequence: send_log_messages(log_batch, response_timeout_seconds=timeout),
+        "telemetry_batch": lambda sequence: send_telemetry_batch([("spacefx_bench", sequence)] * args.batch_size, response_timeout_seconds=timeout),
+    }
+
+
+def measure_allocations(operations: Dict[str, Callable[[int], object]], names: List[str], calls: int) -> Dict[str, dict]:
+    """
+    Calls each operation `calls` times on this thread and returns the bytes allocated per call.  py_peak_bytes_per_call is the
+    average high-water mark of the Python heap during a call (the transient churn), py_retained_bytes_per_call is how much the
+    heap grew per call, and dotnet_bytes_per_call is the .NET allocation counter's growth per call.
+    The .NET counter is process-wide, so background traffic such as heartbeats is included.
+    """
+    from System import GC
+
+    allocations = {}
+    tracemalloc.start()
+    try:
+        for name in names:
+            operation = operations[name]
+            # One untimed call so lazy imports and first-call caches aren't counted
+            operation(0)
+
+            peak_total = 0
+            retained_total = 0
+            dotnet_start = GC.GetTotalAllocatedBytes(True)
+
+            for sequence in range(1, calls + 1):
+                before, _ = tracemalloc.get_traced_memory()
+                if _HAS_RESET_PEAK:
+                    tracemalloc.reset_peak()
+                else:
+                    # Python 3.8 has no reset_peak(), and restarting tracing is the only other way to reset the peak
+                    tracemalloc.stop()
+                    tracemalloc.start()
+                    before = 0
+                operation(sequence)
+                current, peak = tracemalloc.get_traced_memory()
+                peak_total += peak - before
+                retained_total += current - before
+
+            dotnet_end = GC.GetTotalAllocatedBytes(True)
+
+            allocations[name] = {
+                "calls": calls,
+                "py_peak_bytes_per_call": peak_total / calls,
+                "py_retained_bytes_per_call": retained_total / calls,
+                "dotnet_bytes_per_call": (dotnet_end - dotnet_start) / calls,
+            }
+    finally:
+        tracemalloc.stop()
+
+    return allocations
+
+
+def run(args: argparse.Namespace) -> dict:
+    """
+    Runs the benchmark described by args and returns the report
+    """
+    weights = args.mix if isinstance(args.mix, dict) else parse_mix(args.mix)
+    names = [name for name, weight in weights.items() if weight > 0]
+    cumulative_weights = []
+    total_weight = 0
+    for name in names:
+        total_weight += weights[name]
+        cumulative_weights.append(total_weight)
+
+    with tempfile.NamedTemporaryFile(prefix="spacefx-bench-", suffix=".bin", delete=False) as link_file:
+        link_file.write(os.urandom(args.link_file_bytes))
+
+    try:
+        operations = build_operations(args, link_file.name)
+        stats = {name: _OperationStats() for name in names}
+        stop_event = Event()
+        measuring = Event()
+        sequence_lock = Lock()
+        sequence = [0]
+
+        def worker(worker_index: int):
+            rng = random.Random(args.seed + worker_index)
+            while not stop_event.is_set():
+                name = rng.choices(names, cum_weights=cumulative_weights)[0]
+                with sequence_lock:
+                    sequence[0] += 1
+                    request_number = sequence[0]
+
+                start = time.perf_counter()
+                error = None
+                try:
+                    response = operations[name](request_number)
+                    status = getattr(getattr(response, "responseHeader", None), "status", StatusCodes.SUCCESSFUL)
+                    if status != StatusCodes.SUCCESSFUL and not args.accept_any_status:
+                        error = RuntimeError(f"status {StatusCodes.Name(status)}")
+                    elif getattr(response, "failed", 0):
+                        error = RuntimeError(f"{response.failed} of {response.requested} records failed: {response.errors[0]}")
+                except Exception as e:
+                    error = e
+                latency_ms = (time.perf_counter() - start) * 1000
+
+                if measuring.is_set():
+                    stats[name].record(latency_ms, error)
+
+        threads = [Thread(target=worker, args=(index,), name=f"spacefx-bench-{index}", daemon=True) for index in range(args.concurrency)]
+        for thread in threads:
+            thread.start()
+
+        time.sleep(args.warmup)
+
+        usage_start = resource.getrusage(resource.RUSAGE_SELF)
+        wall_start = time.perf_counter()
+        measuring.set()
+        time.sleep(args.duration)
+        measuring.clear()
+        wall_seconds = time.perf_counter() - wall_start
+        usage_end = resource.getrusage(resource.RUSAGE_SELF)
+
+        stop_event.set()
+        for thread in threads:
+            thread.join(timeout=args.response_timeout_seconds)
+
+        allocations = measure_allocations(operations, names, args.allocation_calls) if args.allocation_calls > 0 else {}
+    finally:
+        os.remove(link_file.name)
+
+    cpu_seconds = (usage_end.ru_utime - usage_start.ru_utime) + (usage_end.ru_stime - usage_start.ru_stime)
+    report = {
+        "config": {
+            "target": args.target,
+            "mix": weights,
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "payload_bytes": args.payload_bytes,
+            "batch_size": args.batch_size,
+            "link_file_bytes": args.link_file_bytes,
+            "allocation_calls": args.allocation_calls,
+        },
+        "wall_seconds": wall_seconds,
+        "cpu_seconds": cpu_seconds,
+        "cpu_percent": 100 * cpu_seconds / wall_seconds if wall_seconds else 0.0,
+        # ru_maxrss is reported in kilobytes on Linux
+        "max_rss_bytes": usage_end.ru_maxrss * 1024,
+        "rss_bytes": _rss_bytes(),
+        "operations": {},
+    }
+
+    total_requests = 0
+    for name, operation_stats in stats.items():
+        latencies = sorted(operation_stats.latencies_ms)
+        total_requests += len(latencies)
+        records = len(latencies) * (args.batch_size if name in BATCH_WORKLOADS else 1)
+        report["operations"][name] = {
+            "requests": len(latencies),
+            "errors": operation_stats.errors,
+            "last_error": operation_stats.last_error,
+            "throughput_per_second": len(latencies) / wall_seconds if wall_seconds else 0.0,
+            "records_per_second": records / wall_seconds if wall_seconds else 0.0,
+            "latency_ms": {
+                "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+                **{f"p{percentile}": _percentile(latencies, percentile) for percentile in PERCENTILES},
+                "max": latencies[-1] if latencies else 0.0,
+            },
+        }
+        if name in allocations:
+            report["operations"][name]["allocations"] = allocations[name]
+    report["throughput_per_second"] = total_requests / wall_seconds if wall_seconds else 0.0
+
+    return report
+
+
+def compare(report: dict, baseline: dict, max_regression_pct: float) -> List[str]:
+    """
+    Compares a report against a baseline report.  Returns a description of every regression larger than max_regression_pct.
+    """
+    regressions = []
+
+    def check(label: str, current: float, previous: float, higher_is_better: bool):
+        if not previous:
+            return
+        change_pct = 100 * (current - previous) / previous
+        if (higher_is_better and change_pct < -max_regression_pct) or (not higher_is_better and change_pct > max_regression_pct):
+            regressions.append(f"{label}: {previous:.2f} -> {current:.2f} ({change_pct:+.1f}%)")
+
+    check("total throughput/s", report["throughput_per_second"], baseline.get("throughput_per_second", 0), higher_is_better=True)
+    check("max RSS bytes", report["max_rss_bytes"], baseline.get("max_rss_bytes", 0), higher_is_better=False)
+
+    for name, operation in report["operations"].items():
+        previous = baseline.get("operations", {}).get(name)
+        if previous is None:
+            continue
+        check(f"{name} throughput/s", operation["throughput_per_second"], previous["throughput_per_second"], higher_is_better=True)
+        if "records_per_second" in previous:
+            check(f"{name} records/s", operation["records_per_second"], previous["records_per_second"], higher_is_better=True)
+        for percentile in PERCENTILES:
+            check(f"{name} p{percentile} ms", operation["latency_ms"][f"p{percentile}"], previous["latency_ms"][f"p{percentile}"], higher_is_better=False)
+        if "allocations" in operation and "allocations" in previous:
+            for key in ("py_peak_bytes_per_call", "dotnet_bytes_per_call"):
+                if operation["allocations"][key] is not None and previous["allocations"][key] is not None:
+                    check(f"{name} {key}", operation["allocations"][key], previous["allocations"][key], higher_is_better=False)
+
+    return regressions
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"Target: {report['config']['target']}  Concurrency: {report['config']['concurrency']}  Duration: {report['wall_seconds']:.1f}s",
+        f"Throughput: {report['throughput_per_second']:.1f} req/s  CPU: {report['cpu_percent']:.1f}%  "
+        f"RSS: {report['rss_bytes'] / 2 ** 20:.1f} MiB (max {report['max_rss_bytes'] / 2 ** 20:.1f} MiB)",
+        "",
+        f"{'operation':<16}{'requests':>10}{'errors':>8}{'req/s':>10}{'records/s':>11}{'mean ms':>10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+    ]
+    for name, operation in report["operations"].items():
+        latency = operation["latency_ms"]
+        lines.append(f"{name:<16}{operation['requests']:>10}{operation['errors']:>8}{operation['throughput_per_second']:>10.1f}{operation['records_per_second']:>11.1f}"
+                     f"{latency['mean']:>10.2f}{latency['p50']:>10.2f}{latency['p90']:>10.2f}{latency['p99']:>10.2f}{latency['max']:>10.2f}")
+        if operation["last_error"]:
+            lines.append(f"    last error: {operation['last_error']}")
+
+    allocations = {name: operation["allocations"] for name, operation in report["operations"].items() if "allocations" in operation}
+    if allocations:
+        lines += ["", f"{'operation':<16}{'calls':>10}{'py peak B/call':>16}{'py kept B/call':>16}{'.NET B/call':>14}"]
+        for name, allocation in allocations.items():
+            dotnet_bytes = "n/a" if allocation["dotnet_bytes_per_call"] is None else f"{allocation['dotnet_bytes_per_call']:.0f}"
+            lines.append(f"{name:<16}{allocation['calls']:>10}{allocation['py_peak_bytes_per_call']:>16.0f}{allocation['py_retained_bytes_per_call']:>16.1f}{dotnet_bytes:>14}")
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m spacefx.bench", description="Load generator for Microsoft Azure Orbital Space SDK payload apps")
+    parser.add_argument("--target", choices=("live", "standin"), default="live", help="send requests to the deployed host services, or to an in-process stand-in for the SDK's host service classes.  "
+                             "The stand-in still runs the spacefx API functions but skips the SDK's messaging")
+    parser.add_argument("--mix", type=parse_mix, default="log=1,telemetry=1,sensor_tasking=1,position=1", help=f"comma separated workload=weight pairs.  Workloads: {', '.join(WORKLOADS)}")
+    parser.add_argument("--concurrency", type=int, default=4, help="number of threads sending requests")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to measure for")
+    parser.add_argument("--warmup", type=float, default=5, help="seconds to run before measuring")
+    parser.add_argument("--payload-bytes", type=int, default=256, help="size of each log message")
+    parser.add_argument("--batch-size", type=int, default=100, help="records sent per request by the log_batch and telemetry_batch workloads")
+    parser.add_argument("--link-file-bytes", type=int, default=64 * 1024, help="size of the file sent by the link workload")
+    parser.add_argument("--link-destination", default=None, help="app id the link workload sends files to.  Defaults to this app")
+    parser.add_argument("--sensor-id", default="DemoTemperatureSensor", help="sensor tasked by the sensor_tasking workload")
+    parser.add_argument("--response-timeout-seconds", type=int, default=30, help="response timeout passed to each request")
+    parser.add_argument("--accept-any-status", action="store_true", help="don't count responses that aren't SUCCESSFUL as errors")
+    parser.add_argument("--standin-latency-ms", type=float, default=1.0, help="--target standin only.  Delay before each response")
+    parser.add_argument("--standin-jitter-pct", type=float, default=20.0, help="--target standin only.  Random variation applied to the delay")
+    parser.add_argument("--seed", type=int, default=0, help="seed for choosing requests from the mix")
+    parser.add_argument("--allocation-calls", type=int, default=0, help="after the timed run, call each workload this many times and report bytes allocated per call.  0 disables")
+    parser.add_argument("--output", default=None, help="write the report to this JSON file")
+    parser.add_argument("--baseline", default=None, help="compare the run against a report previously written with --output")
+    parser.add_argument("--max-regression-pct", type=float, default=10.0, help="allowed regression against --baseline before exiting with an error")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.concurrency < 1:
+        raise SystemExit("--concurrency must be at least 1")
+
+    report = run(args)
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+        print(f"\nReport written to '{args.output}'")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(report, baseline, args.max_regression_pct)
+        if regressions:
+            print(f"\nRegressions against '{args.baseline}' (more than {args.max_regression_pct}%):")
+            for regression in regressions:
+                print(f"    {regression}")
+            return 1
+        print(f"\nNo regressions against '{args.baseline}' (more than {args.max_regression_pct}%)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
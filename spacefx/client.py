@@ -2,6 +2,7 @@ from time import sleep
 
 from spacefx._sdk_client import __sdk_client
 from spacefx._sdk_client import __sdk_core
+from spacefx import sensor
 
 
 def build():
@@ -17,6 +18,17 @@ def build():
     return __sdk_client.Build()
 
 
+def shutdown(wait_for_sensor_data: bool = True):
+    """
+    Stops the SDK Client and disposes of all resources, including any sensor data worker processes
+
+    Args:
+        wait_for_sensor_data (bool, optional): wait for queued sensor data to finish processing in worker processes.  Defaults to True
+    """
+    sensor._shutdown_process_pools(wait=wait_for_sensor_data)
+    __sdk_client.Shutdown()
+
+
 def services_online() -> []:
     """
     Returns the services that have transmitted heartbeats to this service
@@ -0,0 +1,269 @@
+import logging
+import signal
+import sys
+import time
+import traceback
+from collections import Counter
+from itertools import count
+from threading import Event, Lock, Thread, get_ident
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from System import TimeSpan
+
+from spacefx._sdk_client import __sdk_diagnostics
+
+# Upper bound (in milliseconds) of each histogram bucket.  The last bucket counts everything slower.
+BUCKET_UPPER_BOUNDS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf"))
+
+# Distinct stacks kept per callback by the profiler, so a long profiling session can't grow without bound
+_MAX_STACKS_PER_CALLBACK = 100
+
+_slow_callback_threshold_seconds = 1.0
+_emit_telemetry = False
+
+_stats_lock = Lock()
+_callback_stats: Dict[str, dict] = {}
+
+_logger = logging.getLogger(__name__)
+
+# Call id -> (thread ident, callback name, start time) for every callback currently running.  Keyed per call rather than
+# per thread so a callback that calls timed_call itself doesn't replace the outer entry
+_in_flight_lock = Lock()
+_in_flight: Dict[int, Tuple[int, str, float]] = {}
+_call_ids = count()
+
+_profiler_lock = Lock()
+_profiler_thread: Optional[Thread] = None
+_profiler_stop_event = Event()
+_slow_callback_stacks: Dict[str, Counter] = {}
+
+
+def configure(slow_callback_threshold_seconds: Optional[float] = None, emit_telemetry: Optional[bool] = None, track_dotnet_callbacks: Optional[bool] = None):
+    """
+    Configures slow callback detection for both the Python subscriber callbacks and the .NET event handlers.
+    Any argument left as None keeps its current value.
+
+    Args:
+        slow_callback_threshold_seconds (float, optional): callbacks running longer than this are logged, and sampled by the profiler when it's enabled.  Defaults to 1 second
+        emit_telemetry (bool, optional): send the duration of slow callbacks to hostsvc-logging as telemetry.  Disabled by default
+        track_dotnet_callbacks (bool, optional): time the .NET event handlers each message is dispatched to.  Disabled by default, since it adds work to every message
+    """
+    global _slow_callback_threshold_seconds, _emit_telemetry
+
+    if slow_callback_threshold_seconds is not None:
+        _slow_callback_threshold_seconds = slow_callback_threshold_seconds
+        __sdk_diagnostics.SlowCallbackThreshold = TimeSpan.FromSeconds(slow_callback_threshold_seconds)
+    if emit_telemetry is not None:
+        _emit_telemetry = emit_telemetry
+        __sdk_diagnostics.EmitTelemetry = emit_telemetry
+    if track_dotnet_callbacks is not None:
+        __sdk_diagnostics.TrackCallbacks = track_dotnet_callbacks
+
+
+def get_callback_stats() -> List[dict]:
+    """
+    Returns timing statistics for every callback the SDK has dispatched to: Python subscribers, and .NET event handlers while
+    track_dotnet_callbacks is enabled (see configure)
+
+    Returns:
+        response (List[dict]): one dict per callback with the keys source ("python" or "dotnet"), name, count, slow_count,
+            in_flight, mean_ms, max_ms, and buckets (a list of (upper bound in ms, count) tuples)
+    """
+    with _stats_lock:
+        stats = [_format_stats("python", name, entry) for name, entry in _callback_stats.items()]
+
+    with _in_flight_lock:
+        in_flight = Counter(name for _, name, _ in _in_flight.values())
+    # Include callbacks that are running for the first time, so one that never returns still shows up
+    known_names = {entry["name"] for entry in stats}
+    stats.extend(_format_stats("python", name, _new_stats_entry()) for name in in_flight if name not in known_names)
+    for entry in stats:
+        entry["in_flight"] = in_flight.get(entry["name"], 0)
+
+    for dotnet_stats in __sdk_diagnostics.GetCallbackStats():
+        stats.append({
+            "source": "dotnet",
+            "name": dotnet_stats.Name,
+            "count": dotnet_stats.Count,
+            "slow_count": dotnet_stats.SlowCount,
+            "in_flight": dotnet_stats.InFlight,
+            "mean_ms": dotnet_stats.MeanMs,
+            "max_ms": dotnet_stats.MaxMs,
+            "buckets": list(zip(BUCKET_UPPER_BOUNDS_MS, list(dotnet_stats.BucketCounts)))
+        })
+
+    return stats
+
+
+def reset_callback_stats():
+    """
+    Clears the timing statistics and any stacks captured by the profiler
+    """
+    with _stats_lock:
+        _callback_stats.clear()
+    with _profiler_lock:
+        _slow_callback_stacks.clear()
+    __sdk_diagnostics.ResetCallbackStats()
+
+
+def enable_profiler(interval_seconds: float = 0.05):
+    """
+    Starts sampling the stacks of Python callbacks that have been running longer than the slow callback threshold.
+    Can be toggled while the app is running.
+
+    Args:
+        interval_seconds (float, optional): how often running callbacks are sampled.  Defaults to 50 milliseconds
+    """
+    global _profiler_thread
+
+    with _profiler_lock:
+        if _profiler_thread is not None and _profiler_thread.is_alive():
+            return
+        _profiler_stop_event.clear()
+        _profiler_thread = Thread(target=_sample_slow_callbacks, args=(interval_seconds,), name="spacefx-callback-profiler", daemon=True)
+        _profiler_thread.start()
+
+
+def disable_profiler():
+    """
+    Stops the profiler.  Stacks captured so far remain available from get_slow_callback_stacks.
+    """
+    global _profiler_thread
+
+    _profiler_stop_event.set()
+    with _profiler_lock:
+        profiler_thread, _profiler_thread = _profiler_thread, None
+    if profiler_thread is not None:
+        profiler_thread.join()
+
+
+def is_profiler_enabled() -> bool:
+    return _profiler_thread is not None and _profiler_thread.is_alive()
+
+
+def install_profiler_signal_handler(signal_number: int = signal.SIGUSR2):
+    """
+    Toggles the profiler whenever the process receives signal_number, i.e. `kill -USR2 <pid>` from inside the pod.
+    Must be called from the main thread.
+    """
+    def _toggle_profiler(signum, frame):
+        # Signal handlers run on the main thread between bytecodes, so don't block here waiting for the sampler to stop
+        if is_profiler_enabled():
+            Thread(target=disable_profiler, daemon=True).start()
+        else:
+            enable_profiler()
+
+    signal.signal(signal_number, _toggle_profiler)
+
+
+def get_slow_callback_stacks() -> Dict[str, List[Tuple[str, int]]]:
+    """
+    Returns the stacks captured by the profiler
+
+    Returns:
+        response (Dict[str, List[Tuple[str, int]]]): callback name -> (formatted stack, number of samples) pairs, most sampled first
+    """
+    with _profiler_lock:
+        return {name: stacks.most_common() for name, stacks in _slow_callback_stacks.items()}
+
+
+def callback_name(prefix: str, callback: Callable) -> str:
+    return f"{prefix}:{getattr(callback, '__module__', None)}.{getattr(callback, '__qualname__', repr(callback))}"
+
+
+def timed_call(name: str, callback: Callable, *args) -> Any:
+    """
+    Calls callback(*args), recording its duration under name and reporting it if it's slow
+    """
+    call_id = next(_call_ids)
+    start = time.perf_counter()
+    with _in_flight_lock:
+        _in_flight[call_id] = (get_ident(), name, start)
+
+    try:
+        return callback(*args)
+    finally:
+        elapsed = time.perf_counter() - start
+        with _in_flight_lock:
+            _in_flight.pop(call_id, None)
+        record(name, elapsed)
+
+
+def record(name: str, elapsed_seconds: float):
+    """
+    Records the duration of a callback that was timed elsewhere, i.e. in a sensor data worker process, and reports it if it's slow
+    """
+    elapsed_ms = elapsed_seconds * 1000
+    is_slow = elapsed_seconds > _slow_callback_threshold_seconds
+
+    with _stats_lock:
+        entry = _callback_stats.get(name)
+        if entry is None:
+            entry = _callback_stats[name] = _new_stats_entry()
+        entry["count"] += 1
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+        entry["buckets"][_bucket_index(elapsed_ms)] += 1
+        if is_slow:
+            entry["slow_count"] += 1
+
+    if not is_slow:
+        return
+
+    _logger.warning("Callback '%s' took %.1f ms, which is over the slow callback threshold of %s seconds", name, elapsed_ms, _slow_callback_threshold_seconds)
+
+    if _emit_telemetry:
+        Thread(target=_send_slow_callback_telemetry, args=(name, elapsed_ms), daemon=True).start()
+
+
+def _send_slow_callback_telemetry(name: str, elapsed_ms: float):
+    from spacefx import logging as spacefx_logging
+    try:
+        spacefx_logging.send_telemetry(f"slow_callback_ms:{name}", int(elapsed_ms))
+    except Exception as e:
+        _logger.warning("Failed to send slow callback telemetry for '%s': %s", name, e)
+
+
+def _new_stats_entry() -> dict:
+    return {"count": 0, "slow_count": 0, "total_ms": 0.0, "max_ms": 0.0, "buckets": [0] * len(BUCKET_UPPER_BOUNDS_MS)}
+
+
+def _bucket_index(elapsed_ms: float) -> int:
+    for index, upper_bound in enumerate(BUCKET_UPPER_BOUNDS_MS):
+        if elapsed_ms <= upper_bound:
+            return index
+    return len(BUCKET_UPPER_BOUNDS_MS) - 1
+
+
+def _format_stats(source: str, name: str, entry: dict) -> dict:
+    return {
+        "source": source,
+        "name": name,
+        "count": entry["count"],
+        "slow_count": entry["slow_count"],
+        "in_flight": 0,
+        "mean_ms": entry["total_ms"] / entry["count"] if entry["count"] else 0.0,
+        "max_ms": entry["max_ms"],
+        "buckets": list(zip(BUCKET_UPPER_BOUNDS_MS, entry["buckets"]))
+    }
+
+
+def _sample_slow_callbacks(interval_seconds: float):
+    while not _profiler_stop_event.wait(interval_seconds):
+        now = time.perf_counter()
+        with _in_flight_lock:
+            slow = [(ident, name) for ident, name, start in _in_flight.values() if now - start > _slow_callback_threshold_seconds]
+        if not slow:
+            continue
+
+        frames = sys._current_frames()
+        for ident, name in slow:
+            frame = frames.get(ident)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            with _profiler_lock:
+                stacks = _slow_callback_stacks.setdefault(name, Counter())
+                if stack in stacks or len(stacks) < _MAX_STACKS_PER_CALLBACK:
+                    stacks[stack] += 1
+        del frames
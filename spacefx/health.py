@@ -0,0 +1,105 @@
+from typing import Callable, Dict, List, Optional
+
+from System import Func, Boolean, TimeSpan
+
+from spacefx._sdk_client import __sdk_health
+
+# Keep a reference to each registered python function for as long as the check is registered
+_registered_checks: Dict[str, Callable[[], bool]] = {}
+
+
+def register_check(check_function: Callable[[], bool], name: Optional[str] = None, timeout_seconds: Optional[float] = None):
+    """
+    Registers a health check that is evaluated in the background.  Cluster health probes are answered from the cached result,
+    so a slow health check never blocks the probe itself.
+
+    Args:
+        check_function (Callable[[], bool]): function returning True when the app is healthy.  Exceptions are treated as unhealthy
+        name (str, optional): unique name of the health check.  Defaults to the function's name
+        timeout_seconds (float, optional): how long the check can run before it's considered failed.  Defaults to the configured default timeout
+    """
+    name = name or check_function.__name__
+
+    def _run_check() -> bool:
+        return bool(check_function())
+
+    timeout = TimeSpan.FromSeconds(timeout_seconds) if timeout_seconds is not None else None
+    __sdk_health.RegisterCheck(name, Func[Boolean](_run_check), timeout)
+    _registered_checks[name] = _run_check
+
+
+def check(function: Optional[Callable[[], bool]] = None, name: Optional[str] = None, timeout_seconds: Optional[float] = None):
+    """
+    Decorator that registers the decorated function as a background health check
+
+    Usage:
+        @spacefx.health.check
+        def camera_connected() -> bool:
+            ...
+
+        @spacefx.health.check(name="disk", timeout_seconds=2)
+        def disk_has_space() -> bool:
+            ...
+    """
+    def _decorator(check_function: Callable[[], bool]) -> Callable[[], bool]:
+        register_check(check_function, name=name, timeout_seconds=timeout_seconds)
+        return check_function
+
+    if function is not None:
+        return _decorator(function)
+    return _decorator
+
+
+def unregister_check(name: str) -> bool:
+    """
+    Removes a previously registered health check
+
+    Returns:
+        removed (bool): True if a check with that name was registered
+    """
+    _registered_checks.pop(name, None)
+    return __sdk_health.UnregisterCheck(name)
+
+
+def configure(check_interval_seconds: Optional[float] = None, staleness_threshold_seconds: Optional[float] = None,
+              default_timeout_seconds: Optional[float] = None, emit_telemetry: Optional[bool] = None):
+    """
+    Configures the background health monitor.  Any argument left as None keeps its current value.
+
+    Args:
+        check_interval_seconds (float, optional): how often the health checks are evaluated.  Defaults to 5 seconds
+        staleness_threshold_seconds (float, optional): how old a cached result can be before the app is reported as unhealthy.  Defaults to 30 seconds
+        default_timeout_seconds (float, optional): how long a check can run before it's considered failed.  Defaults to 10 seconds
+        emit_telemetry (bool, optional): send each check's duration to hostsvc-logging as a telemetry metric.  Disabled by default
+    """
+    if check_interval_seconds is not None:
+        __sdk_health.CheckInterval = TimeSpan.FromSeconds(check_interval_seconds)
+    if staleness_threshold_seconds is not None:
+        __sdk_health.StalenessThreshold = TimeSpan.FromSeconds(staleness_threshold_seconds)
+    if default_timeout_seconds is not None:
+        __sdk_health.DefaultCheckTimeout = TimeSpan.FromSeconds(default_timeout_seconds)
+    if emit_telemetry is not None:
+        __sdk_health.EmitTelemetry = emit_telemetry
+
+
+def is_healthy() -> bool:
+    """
+    Returns the cached health of the app, as reported to the cluster health probe
+    """
+    return __sdk_health.IsHealthy()
+
+
+def get_health_report() -> List[dict]:
+    """
+    Returns the cached result of each health check
+
+    Returns:
+        response (List[dict]): one dict per check with the keys name, is_healthy, message, duration_ms, and last_checked (ISO 8601 UTC)
+    """
+    return [{
+        "name": result.Name,
+        "is_healthy": result.IsHealthy,
+        "message": result.Message,
+        "duration_ms": result.Duration.TotalMilliseconds,
+        "last_checked": result.LastChecked.ToString("o")
+    } for result in __sdk_health.GetResults()]
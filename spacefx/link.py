@@ -1,7 +1,22 @@
+import asyncio
+import fnmatch
+import logging
+import os
+import select
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Event, Lock, Thread, current_thread
+from typing import Callable, Dict, List, Optional, Tuple
+
 from spacefx.protos.link.Link_pb2 import LinkResponse
 
+import Microsoft.Azure.SpaceFx.MessageFormats.HostServices.Link
+from System import Action, AggregateException, TimeoutException, TimeSpan
+
+from spacefx import _inotify
 from spacefx._sdk_client import __sdk_link, __sdk_core, __sdk_utils
 
+_logger = logging.getLogger(__name__)
+
 
 def get_xfer_directories() -> dict[str]:
     """
@@ -99,3 +114,566 @@ def crosslink_file(destination_app_id: str, filepath: str, overwrite_destination
     response.ParseFromString(result_bytes)
 
     return response
+
+
+def _to_link_response(dotnet_response) -> LinkResponse:
+    response = LinkResponse()
+    response.ParseFromString(bytes(__sdk_utils.ConvertProtoToBytes(dotnet_response)))
+    return response
+
+
+class LinkTransfer:
+    """
+    Handle for a file handed to hostsvc-link that may not have completed yet.  Downlinks can stay Pending until the next
+    ground contact, so rather than blocking a thread per file, transfers are tracked by the SDK and the handle can be:
+
+        - polled: done(), last_response, left_outbox
+        - waited on: result(timeout_seconds)
+        - awaited: `response = await transfer`
+        - called back: add_progress_callback / add_done_callback
+
+    Returned by start_file_to_app, start_downlink_file and start_crosslink_file.
+    """
+
+    def __init__(self, transfer):
+        self._transfer = transfer
+        # Keep the .NET delegates alive for as long as the handle is
+        self._delegates = []
+
+    def __repr__(self) -> str:
+        return f"LinkTransfer(tracking_id='{self.tracking_id}', done={self.done()})"
+
+    @property
+    def tracking_id(self) -> str:
+        return self._transfer.TrackingId
+
+    @property
+    def last_response(self) -> Optional[LinkResponse]:
+        """
+        The most recent LinkResponse heard for this transfer (Pending or final), or None if nothing has been heard yet
+        """
+        last_response = self._transfer.LastResponse
+        return _to_link_response(last_response) if last_response is not None else None
+
+    @property
+    def left_outbox(self) -> bool:
+        """
+        True once the file has been seen to leave the outbox, meaning hostsvc-link has picked it up
+        """
+        return self._transfer.LeftOutbox
+
+    def done(self) -> bool:
+        return self._transfer.IsCompleted
+
+    def result(self, timeout_seconds: Optional[float] = None) -> LinkResponse:
+        """
+        Blocks until a final (non-Pending) LinkResponse is heard
+
+        Args:
+            timeout_seconds (float, optional): how long to wait.  Waits until the transfer's own deadline if omitted
+        Returns:
+            response (LinkResponse): the final LinkResponse
+        Raises:
+            TimeoutError: Raises a TimeoutError if the transfer isn't done within timeout_seconds, or no final LinkResponse was heard by its deadline
+            RuntimeError: Raises a RuntimeError if the transfer failed in the SDK, i.e. the client shut down before it completed
+        """
+        completion = self._transfer.Completion
+        try:
+            if timeout_seconds is None:
+                completion.Wait()
+            elif not completion.Wait(TimeSpan.FromSeconds(timeout_seconds)):
+                raise TimeoutError(f"Link transfer '{self.tracking_id}' did not complete within {timeout_seconds} seconds")
+        except AggregateException as e:
+            # Task.Wait wraps the transfer's exception.  Surface it as the matching python exception rather than a .NET one
+            error = e.InnerException if e.InnerException is not None else e
+            if isinstance(error, TimeoutException):
+                raise TimeoutError(str(error.Message)) from None
+            raise RuntimeError(f"Link transfer '{self.tracking_id}' failed: {error.Message}") from None
+
+        return _to_link_response(completion.Result)
+
+    def add_progress_callback(self, callback_function: Callable[[LinkResponse], None]):
+        """
+        Calls callback_function with each Pending LinkResponse heard for this transfer
+        """
+        def _progress(dotnet_response):
+            callback_function(_to_link_response(dotnet_response))
+
+        delegate = Action[Microsoft.Azure.SpaceFx.MessageFormats.HostServices.Link.LinkResponse](_progress)
+        self._delegates.append(delegate)
+        self._transfer.OnProgress(delegate)
+
+    def add_done_callback(self, callback_function: Callable[["LinkTransfer"], None]):
+        """
+        Calls callback_function with this handle once the transfer completes, successfully or not.  Called right away if it already has.
+        """
+        def _done(_):
+            callback_function(self)
+
+        delegate = Action[__sdk_link.LinkTransfer](_done)
+        self._delegates.append(delegate)
+        self._transfer.OnCompleted(delegate)
+
+    def __await__(self):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def _resolve(_):
+            if future.cancelled():
+                return
+            try:
+                future.set_result(self.result(timeout_seconds=0))
+            except Exception as e:
+                future.set_exception(e)
+
+        self.add_done_callback(lambda _: loop.call_soon_threadsafe(_resolve, None))
+        return future.__await__()
+
+
+def get_link_transfers() -> List[LinkTransfer]:
+    """
+    Returns a handle for every transfer still waiting for a final LinkResponse
+    """
+    return [LinkTransfer(transfer) for transfer in __sdk_link.GetTransfers()]
+
+
+def _start_transfer(_task, progress_callback: Optional[Callable[[LinkResponse], None]], completion_callback: Optional[Callable[[LinkTransfer], None]]) -> LinkTransfer:
+    _task.Wait()
+
+    transfer = LinkTransfer(_task.Result)
+    if progress_callback is not None:
+        transfer.add_progress_callback(progress_callback)
+    if completion_callback is not None:
+        transfer.add_done_callback(completion_callback)
+    return transfer
+
+
+def start_file_to_app(destination_app_id: str, filepath: str, overwrite_destination_file=False, response_timeout_seconds=30,
+                      progress_callback: Optional[Callable[[LinkResponse], None]] = None, completion_callback: Optional[Callable[[LinkTransfer], None]] = None) -> LinkTransfer:
+    """
+    Sends a file to the destination service's inbox without waiting for it to complete.  See send_file_to_app
+    Args:
+        destination_app_id (str): The app id of the service to which the message will be sent to
+        filepath (str): Local file path of the input file to be pushed to hostsvc-link
+        overwrite_destination_file (bool, optional): Flag to overwrite the file if it already exists at it's destination
+        response_timeout_seconds (int, optional): the number of seconds to wait for a final LinkResponse before the transfer times out
+        progress_callback (Callable[[LinkResponse], None], optional): called with each Pending LinkResponse
+        completion_callback (Callable[[LinkTransfer], None], optional): called with the handle once the transfer completes
+    Returns:
+        transfer (LinkTransfer): a handle that can be polled, waited on, or awaited for the final LinkResponse
+    """
+    _task = __sdk_link.StartFileToApp(
+        destinationAppId=destination_app_id,
+        file=filepath,
+        overwriteDestinationFile=overwrite_destination_file,
+        responseTimeoutSecs=response_timeout_seconds
+    )
+    return _start_transfer(_task, progress_callback, completion_callback)
+
+
+def start_downlink_file(destination_app_id: str, filepath: str, overwrite_destination_file=False, response_timeout_seconds=30,
+                        progress_callback: Optional[Callable[[LinkResponse], None]] = None, completion_callback: Optional[Callable[[LinkTransfer], None]] = None) -> LinkTransfer:
+    """
+    Downlinks a file at the next available opportunity without waiting for it to complete.  Pass a response_timeout_seconds long enough
+    to cover the wait for a ground contact.  See downlink_file
+    Args:
+        destination_app_id (str): The app id of the service to which the message will be sent to
+        filepath (str): Local file path of the input file to be pushed to hostsvc-link
+        overwrite_destination_file (bool, optional): Flag to overwrite the file if it already exists at it's destination
+        response_timeout_seconds (int, optional): the number of seconds to wait for a final LinkResponse before the transfer times out
+        progress_callback (Callable[[LinkResponse], None], optional): called with each Pending LinkResponse
+        completion_callback (Callable[[LinkTransfer], None], optional): called with the handle once the transfer completes
+    Returns:
+        transfer (LinkTransfer): a handle that can be polled, waited on, or awaited for the final LinkResponse
+    """
+    _task = __sdk_link.StartDownlinkFile(
+        destinationAppId=destination_app_id,
+        file=filepath,
+        overwriteDestinationFile=overwrite_destination_file,
+        responseTimeoutSecs=response_timeout_seconds
+    )
+    return _start_transfer(_task, progress_callback, completion_callback)
+
+
+def start_crosslink_file(destination_app_id: str, filepath: str, overwrite_destination_file=False, response_timeout_seconds=30,
+                         progress_callback: Optional[Callable[[LinkResponse], None]] = None, completion_callback: Optional[Callable[[LinkTransfer], None]] = None) -> LinkTransfer:
+    """
+    Crosslinks a file to the destination service's inbox without waiting for it to complete.  See crosslink_file
+    Args:
+        destination_app_id (str): The app id of the service to which the message will be sent to
+        filepath (str): Local file path of the input file to be pushed to hostsvc-link
+        overwrite_destination_file (bool, optional): Flag to overwrite the file if it already exists at it's destination
+        response_timeout_seconds (int, optional): the number of seconds to wait for a final LinkResponse before the transfer times out
+        progress_callback (Callable[[LinkResponse], None], optional): called with each Pending LinkResponse
+        completion_callback (Callable[[LinkTransfer], None], optional): called with the handle once the transfer completes
+    Returns:
+        transfer (LinkTransfer): a handle that can be polled, waited on, or awaited for the final LinkResponse
+    """
+    _task = __sdk_link.StartCrosslinkFile(
+        destinationAppId=destination_app_id,
+        file=filepath,
+        overwriteDestinationFile=overwrite_destination_file,
+        responseTimeoutSecs=response_timeout_seconds
+    )
+    return _start_transfer(_task, progress_callback, completion_callback)
+
+
+class InboxSubscription:
+    """
+    Watches the xfer inbox (or any directory) and reports files once they have been fully written.
+
+    On Linux the subscription is driven by inotify: a file is reported when it is closed after writing
+    (IN_CLOSE_WRITE) or renamed into the directory (IN_MOVED_TO).  The directory is only listed again if the
+    kernel's event queue overflows, to pick up the files whose events were dropped.
+    When inotify is unavailable (or use_inotify=False), or the watch is lost at runtime, the directory is scanned every
+    scan_interval_seconds and a file is reported once its size and modification time are unchanged between two scans.
+
+    Files can be consumed either by a callback (run on a bounded pool of handler threads) or by iterating
+    the subscription with `async for`.
+
+    Args:
+        directory (str): the directory to watch
+        callback_function (Callable[[str], None], optional): called with the full path of each new file
+        patterns (List[str], optional): glob patterns (fnmatch) matched against the file name.  All files are reported if omitted
+        recursive (bool, optional): also watch subdirectories, including ones created after the subscription starts.  Defaults to True
+        max_workers (int, optional): the number of threads available to run callback_function.  Defaults to 4
+        max_pending (int, optional): the number of files that can be queued for callback_function before the watcher waits for a handler to free up.  Defaults to 64
+        use_inotify (bool, optional): set to False to force the scan fallback
+        scan_interval_seconds (float, optional): how often the scan fallback lists the directory.  Defaults to 2 seconds
+    """
+
+    def __init__(self, directory: str, callback_function: Optional[Callable[[str], None]] = None, patterns: Optional[List[str]] = None,
+                 recursive: bool = True, max_workers: int = 4, max_pending: int = 64, use_inotify: bool = True, scan_interval_seconds: float = 2.0):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        self.directory = os.path.abspath(directory)
+        self.callback_function = callback_function
+        self.patterns = list(patterns) if patterns else None
+        self.recursive = recursive
+        self.scan_interval_seconds = scan_interval_seconds
+        self.use_inotify = use_inotify and _inotify.is_available()
+
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = BoundedSemaphore(max_pending)
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+        self._async_queues: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._async_queues_lock = Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "InboxSubscription":
+        """
+        Starts watching the directory.  Files already present are not reported.
+        """
+        if self.is_running:
+            return self
+
+        if not os.path.isdir(self.directory):
+            raise FileNotFoundError(f"Directory '{self.directory}' not found.  Check path")
+
+        self._stop_event.clear()
+        # The executor is shut down by stop(), so each start gets a fresh one
+        if self.callback_function is not None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="spacefx-inbox")
+        target = self._watch_inotify if self.use_inotify else self._watch_scan
+        self._thread = Thread(target=target, name="spacefx-inbox-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, wait_for_handlers: bool = True):
+        """
+        Stops watching the directory and ends any `async for` loops over the subscription
+
+        Args:
+            wait_for_handlers (bool, optional): wait for in-flight callbacks to finish.  Defaults to True
+        """
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not current_thread():
+            self._thread.join()
+        self._thread = None
+
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait_for_handlers)
+
+        self._notify_async_queues(None)
+        with self._async_queues_lock:
+            self._async_queues = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def __aiter__(self):
+        return self._iterate_async()
+
+    async def _iterate_async(self):
+        queue: asyncio.Queue = asyncio.Queue()
+        registration = (asyncio.get_running_loop(), queue)
+        with self._async_queues_lock:
+            self._async_queues.append(registration)
+
+        self.start()
+
+        try:
+            while True:
+                path = await queue.get()
+                if path is None:
+                    return
+                yield path
+        finally:
+            with self._async_queues_lock:
+                if registration in self._async_queues:
+                    self._async_queues.remove(registration)
+
+    def _matches(self, file_name: str) -> bool:
+        if self.patterns is None:
+            return True
+        return any(fnmatch.fnmatch(file_name, pattern) for pattern in self.patterns)
+
+    def _dispatch(self, path: str):
+        if not self._matches(os.path.basename(path)):
+            return
+
+        self._notify_async_queues(path)
+
+        executor = self._executor
+        if executor is None:
+            return
+
+        # Block the watcher (and let the kernel queue absorb events) rather than growing an unbounded backlog
+        while not self._pending.acquire(timeout=0.5):
+            if self._stop_event.is_set():
+                return
+
+        try:
+            executor.submit(self._run_callback, path)
+        except RuntimeError:
+            # Executor was shut down underneath us
+            self._pending.release()
+
+    def _notify_async_queues(self, path: Optional[str]):
+        with self._async_queues_lock:
+            registrations = list(self._async_queues)
+
+        for registration in registrations:
+            loop, queue = registration
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, path)
+            except RuntimeError:
+                # The subscriber's event loop has closed.  Drop it rather than letting the error stop the watcher
+                with self._async_queues_lock:
+                    if registration in self._async_queues:
+                        self._async_queues.remove(registration)
+
+    def _run_callback(self, path: str):
+        try:
+            self.callback_function(path)
+        except Exception as e:
+            _logger.error("Error processing inbox file '%s': %s", path, e)
+        finally:
+            self._pending.release()
+
+    def _watch_inotify(self):
+        # Files already in the directory are never reported, but they're listed once so an overflow rescan or a
+        # fall back to scanning can tell them apart from files that arrived while events were lost
+        reported = self._scan()
+
+        try:
+            notifier = _inotify.Inotify()
+        except OSError as e:
+            _logger.warning("Unable to start inotify for '%s' (%s).  Scanning every %s seconds instead", self.directory, e, self.scan_interval_seconds)
+            self._watch_scan(reported)
+            return
+
+        try:
+            self._watch_events(notifier, reported)
+        except Exception as e:
+            _logger.exception("Inbox watcher for '%s' failed: %s", self.directory, e)
+        finally:
+            notifier.close()
+
+        if not self._stop_event.is_set():
+            _logger.warning("Inbox watcher for '%s' can no longer use inotify.  Scanning every %s seconds instead", self.directory, self.scan_interval_seconds)
+            self._watch_scan(reported)
+
+    def _watch_events(self, notifier: "_inotify.Inotify", reported: Dict[str, Tuple[int, int]]):
+        """
+        Dispatches files as inotify reports them.  Returns when the subscription stops, or when the top-level directory
+        can't be watched (it's missing, or was deleted or moved away) so the caller can fall back to scanning
+        """
+        watch_mask = (_inotify.IN_CLOSE_WRITE | _inotify.IN_MOVED_TO | _inotify.IN_CREATE | _inotify.IN_DELETE | _inotify.IN_MOVED_FROM |
+                      _inotify.IN_DELETE_SELF | _inotify.IN_MOVE_SELF)
+        watched_directories: Dict[int, str] = {}
+
+        def report(path: str):
+            try:
+                stat = os.stat(path, follow_symlinks=False)
+            except FileNotFoundError:
+                return
+            signature = (stat.st_size, stat.st_mtime_ns)
+            # An overflow rescan may already have reported this version of the file
+            if reported.get(path) == signature:
+                return
+            reported[path] = signature
+            self._dispatch(path)
+
+        def watch(directory: str) -> bool:
+            try:
+                # Adding a watch for a directory that's already watched returns its existing descriptor
+                watched_directories[notifier.add_watch(directory, watch_mask | _inotify.IN_ONLYDIR)] = directory
+                return True
+            except OSError as e:
+                _logger.warning("Unable to watch '%s': %s", directory, e)
+                return False
+
+        def add_directory(directory: str):
+            # A directory created after startup can receive files before its watch is in place, so it gets a single listing
+            if not watch(directory):
+                return
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            add_directory(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            report(entry.path)
+            except FileNotFoundError:
+                return
+
+        def rescan():
+            # Events were dropped, so watch any directories whose creation was missed and report anything new or changed
+            if self.recursive:
+                for root, directories, _ in os.walk(self.directory):
+                    for directory in directories:
+                        watch(os.path.join(root, directory))
+
+            current = self._scan()
+            for path in current:
+                report(path)
+            for path in [path for path in reported if path not in current]:
+                del reported[path]
+
+        if not watch(self.directory):
+            return
+        top_wd = next(iter(watched_directories))
+
+        if self.recursive:
+            for root, directories, _ in os.walk(self.directory):
+                for directory in directories:
+                    watch(os.path.join(root, directory))
+
+        poller = select.poll()
+        poller.register(notifier.fd, select.POLLIN)
+
+        while not self._stop_event.is_set():
+            if not poller.poll(250):
+                continue
+
+            for wd, mask, _, name in notifier.read_events():
+                if mask & _inotify.IN_Q_OVERFLOW:
+                    _logger.warning("Inbox watcher event queue overflowed for '%s'.  Rescanning for files that weren't reported", self.directory)
+                    rescan()
+                    continue
+
+                parent = watched_directories.get(wd)
+                if parent is None:
+                    continue
+
+                if mask & (_inotify.IN_IGNORED | _inotify.IN_DELETE_SELF | _inotify.IN_MOVE_SELF):
+                    watched_directories.pop(wd, None)
+                    if wd == top_wd:
+                        _logger.warning("Inbox directory '%s' was deleted or moved", self.directory)
+                        return
+                    continue
+
+                if name is None:
+                    continue
+
+                path = os.path.join(parent, name)
+
+                if mask & _inotify.IN_ISDIR:
+                    if self.recursive and mask & (_inotify.IN_CREATE | _inotify.IN_MOVED_TO):
+                        add_directory(path)
+                    continue
+
+                if mask & (_inotify.IN_DELETE | _inotify.IN_MOVED_FROM):
+                    reported.pop(path, None)
+                elif mask & (_inotify.IN_CLOSE_WRITE | _inotify.IN_MOVED_TO):
+                    report(path)
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        directories = [self.directory]
+        while directories:
+            try:
+                with os.scandir(directories.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.recursive:
+                                directories.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+            except FileNotFoundError:
+                # Directory was removed between listing and opening it
+                continue
+        return snapshot
+
+    def _watch_scan(self, reported: Optional[Dict[str, Tuple[int, int]]] = None):
+        # reported is handed over by the inotify watcher when it falls back to scanning, so files it already reported aren't reported twice
+        if reported is None:
+            reported = self._scan()
+        previous: Dict[str, Tuple[int, int]] = {}
+
+        try:
+            while not self._stop_event.wait(self.scan_interval_seconds):
+                current = self._scan()
+                for path, signature in current.items():
+                    # Only report a file once it has stopped changing between two scans
+                    if reported.get(path) != signature and previous.get(path) == signature:
+                        reported[path] = signature
+                        self._dispatch(path)
+
+                reported = {path: signature for path, signature in reported.items() if path in current}
+                previous = current
+        except Exception as e:
+            _logger.exception("Inbox watcher for '%s' stopped unexpectedly: %s", self.directory, e)
+
+
+def subscribe_to_inbox(callback_function: Optional[Callable[[str], None]] = None, patterns: Optional[List[str]] = None, recursive: bool = True,
+                       max_workers: int = 4, max_pending: int = 64, use_inotify: bool = True, scan_interval_seconds: float = 2.0) -> InboxSubscription:
+    """
+    Subscribes to files arriving in this app's xfer inbox via hostsvc-link (crosslinks, uplinks, and app-to-app transfers)
+
+    Args:
+        callback_function (Callable[[str], None], optional): called with the full path of each file once it has been fully written
+        patterns (List[str], optional): glob patterns matched against the file name, i.e. ["*.jpg", "*.tif"].  All files are reported if omitted
+        recursive (bool, optional): also report files landing in subdirectories of the inbox.  Defaults to True
+        max_workers (int, optional): the number of threads available to run callback_function.  Defaults to 4
+        max_pending (int, optional): the number of files that can be queued for callback_function before new files wait for a handler.  Defaults to 64
+        use_inotify (bool, optional): set to False to force the directory scan fallback
+        scan_interval_seconds (float, optional): how often the scan fallback lists the inbox.  Defaults to 2 seconds
+    Returns:
+        subscription (InboxSubscription): a started subscription.  Call stop() to end it, or use it with `async for` to receive file paths
+    """
+    subscription = InboxSubscription(
+        directory=get_xfer_directories()["inbox"],
+        callback_function=callback_function,
+        patterns=patterns,
+        recursive=recursive,
+        max_workers=max_workers,
+        max_pending=max_pending,
+        use_inotify=use_inotify,
+        scan_interval_seconds=scan_interval_seconds
+    )
+    return subscription.start()
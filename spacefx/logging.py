@@ -1,13 +1,15 @@
-from typing import Union
-import uuid
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Union
 import logging
 
 from spacefx.protos.common.Common_pb2 import \
+    LogMessage, \
     LogMessageResponse, \
+    TelemetryMetric, \
     TelemetryMetricResponse, \
     TelemetryMultiMetricResponse
 
 import Microsoft.Azure.SpaceFx.MessageFormats.Common
+from System import Array, Byte
 from spacefx._sdk_client import __sdk_logging, __sdk_utils
 
 
@@ -25,11 +27,15 @@ def send_log_message(message: str, log_level: Microsoft.Azure.SpaceFx.MessageFor
     Raises:
         TimeoutError: Raises a TimeoutError if no LogResponse message was heard during the timeout period
     """
-    log_message = Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage()
-    log_message.LogLevel = Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage.Types.LOG_LEVEL(log_level.value__)
-    log_message.Message = message
+    # The SDK builds the request from a pool and assigns its tracking id, so nothing is allocated on this side of the bridge for it
+    _task = __sdk_logging.SendLogMessage(message, Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage.Types.LOG_LEVEL(log_level.value__), response_timeout_seconds, wait_for_response)
+    _task.Wait()
 
-    return send_complex_log_message(log_message=log_message, response_timeout_seconds=response_timeout_seconds, wait_for_response=wait_for_response)
+    response = LogMessageResponse()
+    result_bytes = bytes(__sdk_utils.ConvertProtoToBytes(_task.Result))
+    response.ParseFromString(result_bytes)
+
+    return response
 
 
 def send_complex_log_message(log_message: Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage, response_timeout_seconds:int = 30, wait_for_response:bool = False) -> LogMessageResponse:
@@ -46,10 +52,7 @@ def send_complex_log_message(log_message: Microsoft.Azure.SpaceFx.MessageFormats
     Raises:
         TimeoutError: Raises a TimeoutError if no LogResponse message was heard during the timeout period
     """
-    log_message.RequestHeader = log_message.RequestHeader or Microsoft.Azure.SpaceFx.MessageFormats.Common.RequestHeader()
-    log_message.RequestHeader.TrackingId = log_message.RequestHeader.TrackingId or str(uuid.uuid4())
-    log_message.RequestHeader.CorrelationId = log_message.RequestHeader.CorrelationId or log_message.RequestHeader.TrackingId
-
+    # A missing RequestHeader, TrackingId or CorrelationId is filled in by the SDK
     _task = __sdk_logging.SendLogMessage(logMessage=log_message, responseTimeoutSecs=response_timeout_seconds, wait_for_response=wait_for_response)
     _task.Wait()
 
@@ -87,10 +90,8 @@ def send_telemetry(metric_name_or_object: Union[str, Microsoft.Azure.SpaceFx.Mes
 
     elif isinstance(metric_name_or_object, Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMeTelemetryMetricssage):
         # Send log message
+        # A missing RequestHeader, TrackingId or CorrelationId is filled in by the SDK
         telemetry_message = metric_name_or_object
-        telemetry_message.RequestHeader = telemetry_message.RequestHeader or Microsoft.Azure.SpaceFx.MessageFormats.Common.RequestHeader()
-        telemetry_message.RequestHeader.TrackingId = telemetry_message.RequestHeader.TrackingId or str(uuid.uuid4())
-        telemetry_message.RequestHeader.CorrelationId = telemetry_message.RequestHeader.CorrelationId or telemetry_message.RequestHeader.TrackingId
 
         # Assuming similar logic to send the log message and wait for response
         _task = __sdk_logging.SendTelemetry(telemetryMessage=telemetry_message, responseTimeoutSecs=response_timeout_seconds, wait_for_response=wait_for_response)
@@ -116,10 +117,7 @@ def send_telemetrymulti(telemetry_multi: Microsoft.Azure.SpaceFx.MessageFormats.
         TimeoutError: Raises a TimeoutError if no response message was heard during the timeout period
     """
 
-        # Send log message
-    telemetry_multi.RequestHeader = telemetry_multi.RequestHeader or Microsoft.Azure.SpaceFx.MessageFormats.Common.RequestHeader()
-    telemetry_multi.RequestHeader.TrackingId = telemetry_multi.RequestHeader.TrackingId or str(uuid.uuid4())
-    telemetry_multi.RequestHeader.CorrelationId = telemetry_multi.RequestHeader.CorrelationId or telemetry_multi.RequestHeader.TrackingId
+    # A missing RequestHeader, TrackingId or CorrelationId is filled in by the SDK
 
     # Assuming similar logic to send the log message and wait for response
     _task = __sdk_logging.SendMultiTelemetry(telemetryMessage=telemetry_multi, responseTimeoutSecs=response_timeout_seconds, wait_for_response=wait_for_response)
@@ -131,9 +129,132 @@ def send_telemetrymulti(telemetry_multi: Microsoft.Azure.SpaceFx.MessageFormats.
     response.ParseFromString(result_bytes)
     return response
 
+class BatchSendResult(NamedTuple):
+    """
+    Summary of a batch sent with send_log_messages or send_telemetry_batch
+
+    Attributes:
+        requested (int): the number of records in the batch
+        sent (int): the number of records handed to hostsvc-logging
+        failed (int): the number of records that couldn't be sent
+        errors (List[str]): a description of each failure
+        duration_seconds (float): how long the batch took to send
+    """
+    requested: int
+    sent: int
+    failed: int
+    errors: List[str]
+    duration_seconds: float
+
+
+LogRecord = Union[str, Tuple[str, Union[int, str, Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage.Types.LOG_LEVEL]], dict, LogMessage]
+
+
+def _to_log_level(log_level) -> int:
+    if hasattr(log_level, "value__"):
+        # Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage.Types.LOG_LEVEL
+        return int(log_level.value__)
+    if isinstance(log_level, str):
+        return LogMessage.LOG_LEVEL.Value(log_level.upper())
+    return int(log_level)
+
+
+def _write_varint(buffer: bytearray, value: int):
+    # Base 128 varint, as used by protobuf for the length prefix of a delimited message
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _serialize_delimited(messages) -> bytes:
+    buffer = bytearray()
+    for message in messages:
+        serialized = message.SerializeToString()
+        _write_varint(buffer, len(serialized))
+        buffer += serialized
+    return bytes(buffer)
+
+
+def _to_log_message(record: LogRecord, default_log_level: int) -> LogMessage:
+    if isinstance(record, LogMessage):
+        return record
+    if isinstance(record, str):
+        return LogMessage(message=record, logLevel=default_log_level)
+    if isinstance(record, dict):
+        return LogMessage(message=record["message"], logLevel=_to_log_level(record.get("log_level", default_log_level)))
+    message, log_level = record
+    return LogMessage(message=message, logLevel=_to_log_level(log_level))
+
+
+def _serialize_log_records(records: Iterable[LogRecord], default_log_level=Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage.Types.LOG_LEVEL.Trace) -> bytes:
+    default_level = _to_log_level(default_log_level)
+    return _serialize_delimited(_to_log_message(record, default_level) for record in records)
+
+
+def _serialize_telemetry(metrics: Union[Dict[str, int], Iterable[Tuple[str, int]]]) -> bytes:
+    items = metrics.items() if isinstance(metrics, dict) else metrics
+    return _serialize_delimited(TelemetryMetric(metricName=metric_name, metricValue=metric_value) for metric_name, metric_value in items)
+
+
+def _to_batch_send_result(result) -> BatchSendResult:
+    return BatchSendResult(
+        requested=result.Requested,
+        sent=result.Sent,
+        failed=result.Failed,
+        errors=list(result.Errors),
+        duration_seconds=result.Duration.TotalSeconds
+    )
+
+
+def send_log_messages(records: Iterable[LogRecord], default_log_level: Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage.Types.LOG_LEVEL = Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage.Types.LOG_LEVEL.Trace, response_timeout_seconds: int = 30) -> BatchSendResult:
+    """
+    Sends many messages to the Logging Host Service in a single call.  The batch is serialized once in Python and crosses into .NET
+    as one buffer, which is much cheaper per record than calling send_log_message in a loop.  Responses are not waited for.
+
+    Args:
+        records (Iterable): each record is a message (str), a (message, log_level) tuple, a dict with "message" and optional "log_level" keys,
+            or a LogMessage proto.  log_level can be a LOG_LEVEL, its name (i.e. "INFO"), or its value
+        default_log_level (LOG_LEVEL, optional): log level for records that don't specify one
+        response_timeout_seconds (int, optional): the number of seconds to wait for the Logging Host Service to come online
+    Returns:
+        response (BatchSendResult): how many records were sent and any failures
+    Raises:
+        InvalidOperationException: Raises if the Logging Host Service isn't online
+    """
+    batch = _serialize_log_records(records, default_log_level)
+
+    _task = __sdk_logging.SendLogMessages(Array[Byte](batch), response_timeout_seconds)
+    _task.Wait()
+
+    return _to_batch_send_result(_task.Result)
+
+
+def send_telemetry_batch(metrics: Union[Dict[str, int], Iterable[Tuple[str, int]]], response_timeout_seconds: int = 30) -> BatchSendResult:
+    """
+    Sends many telemetry metrics to the Logging Host Service in a single call.  See send_log_messages
+
+    Args:
+        metrics (Union[Dict[str, int], Iterable[Tuple[str, int]]]): metric name -> value, or (metric name, value) pairs when a metric is sent more than once
+        response_timeout_seconds (int, optional): the number of seconds to wait for the Logging Host Service to come online
+    Returns:
+        response (BatchSendResult): how many metrics were sent and any failures
+    Raises:
+        InvalidOperationException: Raises if the Logging Host Service isn't online
+    """
+    batch = _serialize_telemetry(metrics)
+
+    _task = __sdk_logging.SendTelemetryBatch(Array[Byte](batch), response_timeout_seconds)
+    _task.Wait()
+
+    return _to_batch_send_result(_task.Result)
+
 # This is inteded to be used as a drop-in replacement for the default python logger class
 # Use via spacefx.logger rather than accessing the logger directly
 class __SpaceFxLogger(logging.getLoggerClass()):
+    # How long debug(), info(), etc. wait for the Logging Host Service to come online; set per logger to change it
+    response_timeout_seconds: int = 30
+
     def __init__(self, name="SpaceFxLogger", level=logging.NOTSET):
         super().__init__(name, level)
         handler = logging.StreamHandler()
@@ -166,8 +287,10 @@ class __SpaceFxLogger(logging.getLoggerClass()):
         self.send_log_message(msg, Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage.Types.LOG_LEVEL.Critical)
         super().critical(msg, *args, **kwargs)
 
-    def send_log_message(self, msg, level: Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage.Types.LOG_LEVEL):
-        logMsg = Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage()
-        logMsg.Message = msg
-        logMsg.LogLevel = level
-        send_complex_log_message(logMsg)
+    def send_log_message(self, msg, level: Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage.Types.LOG_LEVEL, response_timeout_seconds: int = None):
+        _forward_log_message(msg, level, self.response_timeout_seconds if response_timeout_seconds is None else response_timeout_seconds)
+
+
+def _forward_log_message(message: str, log_level: Microsoft.Azure.SpaceFx.MessageFormats.Common.LogMessage.Types.LOG_LEVEL, response_timeout_seconds: int = 30):
+    # The logger never looks at the LogMessageResponse, so skip converting it to a python proto
+    __sdk_logging.SendLogMessage(message, log_level, response_timeout_seconds, False).Wait()
@@ -1,7 +1,20 @@
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from threading import Event, Lock, Thread
+from typing import Deque, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from spacefx.protos.common.Common_pb2 import StatusCodes
 from spacefx.protos.position.Position_pb2 import PositionResponse
 
 from spacefx._sdk_client import __sdk_position, __sdk_utils
 
+_logger = logging.getLogger(__name__)
+
 
 def request_position(response_timeout_seconds=30) -> PositionResponse:
     """
@@ -23,3 +36,296 @@ def request_position(response_timeout_seconds=30) -> PositionResponse:
     response.ParseFromString(result_bytes)
 
     return response
+
+
+class InterpolatedPositions(NamedTuple):
+    """
+    Positions estimated for a batch of timestamps.  Rows for timestamps the cache couldn't cover are NaN.
+
+    Attributes:
+        times (np.ndarray): requested timestamps as seconds since the unix epoch, shape (N,)
+        points (np.ndarray): x, y, z of each position, shape (N, 3)
+        attitudes (np.ndarray): x, y, z, k of each attitude quaternion, shape (N, 4)
+    """
+    times: np.ndarray
+    points: np.ndarray
+    attitudes: np.ndarray
+
+
+TimestampLike = Union[float, int, datetime, Timestamp]
+
+
+def _to_epoch_seconds(timestamp: TimestampLike) -> float:
+    if isinstance(timestamp, Timestamp):
+        return timestamp.seconds + timestamp.nanos / 1e9
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.timestamp()
+    return float(timestamp)
+
+
+class PositionCache:
+    """
+    Keeps a ring buffer of recent PositionResponses from hostsvc-position and answers position queries locally.
+
+    A background thread requests the position every poll_interval_seconds.  Queries for a timestamp inside the buffer
+    are interpolated (linear or cubic Hermite) from the buffered samples, so geotagging many frames per second doesn't
+    send a PositionRequest per frame.  Timestamps up to max_staleness_seconds outside the buffer are linearly
+    extrapolated from the nearest two samples; anything further out triggers a live request before answering.
+    Concurrent queries share a single live request, and a live request that doesn't cover the query (i.e. hostsvc-position
+    is unreachable or has nothing newer) isn't repeated until min_live_request_interval_seconds has passed; queries in
+    between are answered from the buffer, with NaN rows for what it can't cover.
+
+    Hermite interpolation uses finite-difference velocities: central differences between samples, and second-order one-sided
+    differences on the first and last segment (exact for constant acceleration).  Hermite needs at least 3 samples; with fewer,
+    and for extrapolation, interpolation is linear.
+
+    Args:
+        poll_interval_seconds (float, optional): how often to request the position in the background.  Defaults to 1 second
+        buffer_size (int, optional): the number of samples to keep.  Defaults to 64
+        max_staleness_seconds (float, optional): how far outside the buffered samples a timestamp can be before falling back to a live request.  Defaults to 5 seconds
+        interpolation (str, optional): "linear" or "hermite".  Defaults to "linear"
+        response_timeout_seconds (int, optional): the number of seconds to wait for each PositionResponse
+        min_live_request_interval_seconds (float, optional): the minimum time between live requests triggered by queries.  Defaults to 1 second
+    """
+
+    def __init__(self, poll_interval_seconds: float = 1.0, buffer_size: int = 64, max_staleness_seconds: float = 5.0,
+                 interpolation: str = "linear", response_timeout_seconds: int = 30, min_live_request_interval_seconds: float = 1.0):
+        if buffer_size < 2:
+            raise ValueError("buffer_size must be at least 2")
+        if interpolation not in ("linear", "hermite"):
+            raise ValueError(f"Unknown interpolation '{interpolation}'.  Expected 'linear' or 'hermite'")
+
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+        self.interpolation = interpolation
+        self.response_timeout_seconds = response_timeout_seconds
+        self.min_live_request_interval_seconds = min_live_request_interval_seconds
+
+        self._samples: Deque[PositionResponse] = deque(maxlen=buffer_size)
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._lock = Lock()
+        self._live_request_lock = Lock()
+        self._live_request_done: Optional[Event] = None
+        self._last_live_request = float("-inf")
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+
+    def start(self) -> "PositionCache":
+        """
+        Starts polling hostsvc-position in the background
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return self
+
+        self._stop_event.clear()
+        self._thread = Thread(target=self._poll, name="spacefx-position-cache", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops polling hostsvc-position.  Buffered samples remain available.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def add_sample(self, response: PositionResponse) -> bool:
+        """
+        Adds a PositionResponse to the buffer.  Responses that aren't SUCCESSFUL, or that are older than the newest sample, are ignored.
+
+        Returns:
+            added (bool): True if the response was added
+        """
+        if response.responseHeader.status != StatusCodes.SUCCESSFUL or not response.position.HasField("positionTime"):
+            return False
+
+        with self._lock:
+            if self._samples and _to_epoch_seconds(response.position.positionTime) <= _to_epoch_seconds(self._samples[-1].position.positionTime):
+                return False
+            self._samples.append(response)
+            self._arrays = None
+        return True
+
+    def latest(self) -> Optional[PositionResponse]:
+        """
+        Returns the newest buffered PositionResponse, or None if nothing has been buffered yet
+        """
+        with self._lock:
+            return self._samples[-1] if self._samples else None
+
+    def positions_at(self, timestamps: Union[Sequence[TimestampLike], np.ndarray]) -> InterpolatedPositions:
+        """
+        Estimates the position at each of the supplied timestamps
+
+        Args:
+            timestamps (Sequence[float | datetime | Timestamp] | np.ndarray): seconds since the unix epoch, datetimes (naive datetimes are treated as UTC), or protobuf Timestamps
+        Returns:
+            positions (InterpolatedPositions): the estimated points and attitudes.  Rows that couldn't be covered, even after a live request, are NaN
+        """
+        if isinstance(timestamps, np.ndarray):
+            times = timestamps.astype(np.float64, copy=False).ravel()
+        else:
+            times = np.fromiter((_to_epoch_seconds(timestamp) for timestamp in timestamps), dtype=np.float64)
+
+        sample_times, sample_points, sample_attitudes = self._get_arrays()
+        if not self._covers(sample_times, times).all():
+            self._request_live()
+            sample_times, sample_points, sample_attitudes = self._get_arrays()
+
+        points = np.full((times.size, 3), np.nan)
+        attitudes = np.full((times.size, 4), np.nan)
+        covered = self._covers(sample_times, times)
+
+        if sample_times.size == 1:
+            points[covered] = sample_points[0]
+            attitudes[covered] = sample_attitudes[0]
+        elif covered.any():
+            points[covered] = _interpolate_points(sample_times, sample_points, times[covered], self.interpolation)
+            attitudes[covered] = _interpolate_attitudes(sample_times, sample_attitudes, times[covered])
+
+        return InterpolatedPositions(times=times, points=points, attitudes=attitudes)
+
+    def position_at(self, timestamp: TimestampLike) -> PositionResponse:
+        """
+        Estimates the position at a single timestamp
+
+        Args:
+            timestamp (float | datetime | Timestamp): seconds since the unix epoch, a datetime (naive datetimes are treated as UTC), or a protobuf Timestamp
+        Returns:
+            response (PositionResponse): a SUCCESSFUL PositionResponse whose position is estimated for the timestamp
+        Raises:
+            LookupError: the timestamp is too far from any position heard from hostsvc-position, even after a live request
+        """
+        estimate = self.positions_at(np.array([_to_epoch_seconds(timestamp)]))
+        if np.isnan(estimate.points[0]).any():
+            raise LookupError(f"No position within {self.max_staleness_seconds} seconds of {estimate.times[0]} is available from hostsvc-position")
+
+        response = PositionResponse()
+        response.responseHeader.status = StatusCodes.SUCCESSFUL
+        response.position.positionTime.FromNanoseconds(int(round(estimate.times[0] * 1e9)))
+        response.position.point.x, response.position.point.y, response.position.point.z = (float(value) for value in estimate.points[0])
+        response.position.attitude.x, response.position.attitude.y, response.position.attitude.z, response.position.attitude.k = (float(value) for value in estimate.attitudes[0])
+        return response
+
+    def _covers(self, sample_times: np.ndarray, times: np.ndarray) -> np.ndarray:
+        if sample_times.size == 0:
+            return np.zeros(times.shape, dtype=bool)
+        return (times >= sample_times[0] - self.max_staleness_seconds) & (times <= sample_times[-1] + self.max_staleness_seconds)
+
+    def _get_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        with self._lock:
+            if self._arrays is None:
+                self._arrays = (
+                    np.array([_to_epoch_seconds(sample.position.positionTime) for sample in self._samples], dtype=np.float64),
+                    np.array([(sample.position.point.x, sample.position.point.y, sample.position.point.z) for sample in self._samples], dtype=np.float64).reshape(-1, 3),
+                    np.array([(sample.position.attitude.x, sample.position.attitude.y, sample.position.attitude.z, sample.position.attitude.k) for sample in self._samples], dtype=np.float64).reshape(-1, 4)
+                )
+            return self._arrays
+
+    def _request_live(self, force: bool = False):
+        # Concurrent callers share the request already in flight.  Otherwise a new request is only made once
+        # min_live_request_interval_seconds have passed since the last one, whether or not it was any use.
+        with self._live_request_lock:
+            live_request_done = self._live_request_done
+            if live_request_done is None:
+                if not force and time.monotonic() - self._last_live_request < self.min_live_request_interval_seconds:
+                    return
+                self._live_request_done = Event()
+
+        if live_request_done is not None:
+            live_request_done.wait()
+            return
+
+        try:
+            self.add_sample(request_position(response_timeout_seconds=self.response_timeout_seconds))
+        except Exception as e:
+            _logger.error("Error requesting position: %s", e)
+        finally:
+            with self._live_request_lock:
+                live_request_done, self._live_request_done = self._live_request_done, None
+                self._last_live_request = time.monotonic()
+            live_request_done.set()
+
+    def _poll(self):
+        while not self._stop_event.is_set():
+            self._request_live(force=True)
+            self._stop_event.wait(self.poll_interval_seconds)
+
+
+def _interpolate_points(sample_times: np.ndarray, sample_points: np.ndarray, times: np.ndarray, interpolation: str) -> np.ndarray:
+    # Index of the sample segment each timestamp falls in.  Timestamps outside the buffer use the nearest segment, which linearly extrapolates.
+    segment = np.clip(np.searchsorted(sample_times, times, side="right") - 1, 0, sample_times.size - 2)
+    t0 = sample_times[segment]
+    dt = sample_times[segment + 1] - t0
+    s = ((times - t0) / dt)[:, np.newaxis]
+    p0 = sample_points[segment]
+    p1 = sample_points[segment + 1]
+
+    linear = p0 + s * (p1 - p0)
+    if interpolation == "linear" or sample_times.size < 3:
+        return linear
+
+    # Cubic Hermite with finite-difference velocities.  Only used inside the buffer; extrapolation stays linear.
+    # Second-order one-sided differences at the ends keep the edge segments as accurate as the interior ones.
+    velocities = np.gradient(sample_points, sample_times, axis=0, edge_order=2)
+    m0 = velocities[segment] * dt[:, np.newaxis]
+    m1 = velocities[segment + 1] * dt[:, np.newaxis]
+    s2 = s * s
+    s3 = s2 * s
+    hermite = (2 * s3 - 3 * s2 + 1) * p0 + (s3 - 2 * s2 + s) * m0 + (-2 * s3 + 3 * s2) * p1 + (s3 - s2) * m1
+
+    inside = ((times >= sample_times[0]) & (times <= sample_times[-1]))[:, np.newaxis]
+    return np.where(inside, hermite, linear)
+
+
+def _interpolate_attitudes(sample_times: np.ndarray, sample_attitudes: np.ndarray, times: np.ndarray) -> np.ndarray:
+    # Normalized linear interpolation of the attitude quaternions, taking the short way around
+    segment = np.clip(np.searchsorted(sample_times, times, side="right") - 1, 0, sample_times.size - 2)
+    s = np.clip((times - sample_times[segment]) / (sample_times[segment + 1] - sample_times[segment]), 0.0, 1.0)[:, np.newaxis]
+    q0 = sample_attitudes[segment]
+    q1 = sample_attitudes[segment + 1]
+    q1 = np.where((np.sum(q0 * q1, axis=1) < 0)[:, np.newaxis], -q1, q1)
+
+    attitudes = q0 + s * (q1 - q0)
+    norms = np.linalg.norm(attitudes, axis=1, keepdims=True)
+    return np.divide(attitudes, norms, out=attitudes, where=norms > 0)
+
+
+_shared_position_cache: Optional[PositionCache] = None
+_shared_position_cache_lock = Lock()
+
+
+def get_position_cache(**kwargs) -> PositionCache:
+    """
+    Returns the shared PositionCache for this app, starting it on first use.  Keyword arguments are passed to PositionCache
+    the first time the cache is created and ignored afterwards.
+    """
+    global _shared_position_cache
+    with _shared_position_cache_lock:
+        if _shared_position_cache is None:
+            _shared_position_cache = PositionCache(**kwargs).start()
+        return _shared_position_cache
+
+
+def position_at(timestamp: TimestampLike) -> PositionResponse:
+    """
+    Estimates the position at a timestamp from the shared PositionCache.  See PositionCache.position_at
+    """
+    return get_position_cache().position_at(timestamp)
+
+
+def positions_at(timestamps: Union[Sequence[TimestampLike], np.ndarray]) -> InterpolatedPositions:
+    """
+    Estimates the position at a batch of timestamps from the shared PositionCache.  See PositionCache.positions_at
+    """
+    return get_position_cache().positions_at(timestamps)
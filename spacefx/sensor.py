@@ -1,5 +1,16 @@
-from typing import Dict, TypeVar, Callable
-from threading import Thread
+import atexit
+import logging
+import mmap
+import multiprocessing
+import os
+import queue
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Any as AnyType, Deque, Dict, List, Optional, TypeVar, Callable
+from threading import Lock, Thread, current_thread
 
 from google.protobuf.any_pb2 import Any
 
@@ -14,10 +25,16 @@ from System import String, Array, Byte
 
 import Google.Protobuf.WellKnownTypes
 
+from spacefx import _sensor_worker, diagnostics
 from spacefx._sdk_client import __sdk_sensor, __sdk_core, __sdk_client, __sdk_utils
 
 T = TypeVar("T")
+_logger = logging.getLogger(__name__)
 _sensor_data_subscribers = []
+_lazy_sensor_data_subscribers = []
+_sensor_data_process_pools: List["SensorDataProcessPool"] = []
+_sensor_data_events_registered = False
+_sensor_data_events_lock = Lock()
 
 
 def get_xfer_directories() -> dict[str]:
@@ -147,27 +164,461 @@ def sensor_tasking(sensor_id: str, request_data:Any = None, metadata: Dict[str,
     return response
 
 
-def subscribe_to_sensor_data(callback_function: Callable[[T], None]):
+def subscribe_to_sensor_data(callback_function: Callable[[T], None], execution_mode: str = "thread", processes: Optional[int] = None, ordered: bool = False,
+                             result_callback: Optional[Callable[[AnyType], None]] = None, ring_size_bytes: int = 64 * 1024 * 1024, mp_context: str = "spawn",
+                             lazy: bool = False) -> Optional["SensorDataProcessPool"]:
     """
     Trigger a subscription to the sensor data event to process any incoming sensor data messages
+
+    Args:
+        callback_function (Callable[[SensorData], Any]): called with each SensorData message
+        execution_mode (str, optional): "thread" runs callback_function on a new thread per message.  "process" runs it in a pool of worker
+            processes so CPU-heavy processing isn't limited to one core by the GIL; callback_function must then be a module-level function, and its module is re-imported in each worker, so it
+            shouldn't call spacefx.client.build() at import time.  Defaults to "thread"
+        processes (int, optional): "process" mode only.  The number of worker processes.  Defaults to the number of CPUs
+        ordered (bool, optional): "process" mode only.  Deliver results to result_callback in the order the messages arrived.  Defaults to False
+        result_callback (Callable[[Any], None], optional): "process" mode only.  Called in this process with each value returned by callback_function
+        ring_size_bytes (int, optional): "process" mode only.  Size of the shared memory ring used to hand messages to the workers.  Defaults to 64 MiB
+        mp_context (str, optional): "process" mode only.  The multiprocessing start method.  Defaults to "spawn", since forking after the .NET runtime has started is unsafe
+        lazy (bool, optional): "thread" mode only.  Messages spilled to disk (see configure_sensor_data_spill) are passed to callback_function as a
+            SensorDataHandle instead of being read into a SensorData.  Smaller messages are still passed as SensorData.  Defaults to False
+    Returns:
+        pool (SensorDataProcessPool): the worker pool in "process" mode, otherwise None
     """
-    global _sensor_data_subscribers
-    _sensor_data_subscribers.append(callback_function)
+    global _sensor_data_subscribers, _lazy_sensor_data_subscribers, _sensor_data_process_pools
+
+    if execution_mode == "thread":
+        _sensor_data_subscribers.append(callback_function)
+        if lazy:
+            _lazy_sensor_data_subscribers.append(callback_function)
+        _update_sensor_data_events()
+        return None
+
+    if execution_mode != "process":
+        raise ValueError(f"Unknown execution_mode '{execution_mode}'.  Expected 'thread' or 'process'")
+
+    pool = SensorDataProcessPool(
+        callback_function=callback_function,
+        processes=processes,
+        ordered=ordered,
+        result_callback=result_callback,
+        ring_size_bytes=ring_size_bytes,
+        mp_context=mp_context
+    )
+    _sensor_data_process_pools.append(pool)
+    _update_sensor_data_events()
+    return pool
+
+
+class _RingRegion:
+    __slots__ = ("start", "end", "done")
+
+    def __init__(self, start: int, end: int):
+        self.start = start
+        self.end = end
+        self.done = False
+
+
+class SensorDataProcessPool:
+    """
+    Runs a sensor data callback in a pool of worker processes.
+
+    Each serialized SensorData is written once into a shared memory ring and the workers are only sent its (offset, length),
+    then parse the message in place.  A ring region is reused once its message and every message before it have been processed.
+    Messages that don't fit in the free space of the ring are sent to the workers directly instead of waiting for space.
+    The workers time each callback and the durations are recorded in spacefx.diagnostics alongside the thread mode callbacks.
+    Results are handed to result_callback on a dedicated delivery thread, so a slow result_callback never holds up the executor.
+    If a worker process dies the pool is broken, so it's shut down and stops receiving messages.
+
+    Use subscribe_to_sensor_data(..., execution_mode="process") rather than creating this class directly.
+    """
+
+    def __init__(self, callback_function: Callable[[SensorData], AnyType], processes: Optional[int] = None, ordered: bool = False,
+                 result_callback: Optional[Callable[[AnyType], None]] = None, ring_size_bytes: int = 64 * 1024 * 1024, mp_context: str = "spawn"):
+        if ring_size_bytes < 1:
+            raise ValueError("ring_size_bytes must be at least 1")
+
+        self.ordered = ordered
+        self.result_callback = result_callback
+        self._callback_name = diagnostics.callback_name("SensorData", callback_function)
+
+        self._shm = shared_memory.SharedMemory(create=True, size=ring_size_bytes)
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_sensor_worker.init_worker,
+            initargs=(self._shm.name, callback_function)
+        )
+        self._lock = Lock()
+        self._regions: Deque[_RingRegion] = deque()
+        self._pending_results: Deque[Future] = deque()
+        self._closed = False
+
+        # Completed futures are queued for the delivery thread in the order their results should be delivered.  None stops it
+        self._delivery_queue: "queue.SimpleQueue[Optional[Future]]" = queue.SimpleQueue()
+        self._delivery_thread = Thread(target=self._deliver_results, name="spacefx-sensor-pool-delivery", daemon=True)
+        self._delivery_thread.start()
+
+    def submit(self, sensor_data_bytes: bytes):
+        """
+        Queues a serialized SensorData message for processing
+        """
+        with self._lock:
+            if self._closed:
+                return
+
+            try:
+                region = self._allocate(len(sensor_data_bytes))
+                if region is not None:
+                    self._shm.buf[region.start:region.end] = sensor_data_bytes
+                    future = self._executor.submit(_sensor_worker.process_ring_region, region.start, region.end - region.start)
+                else:
+                    future = self._executor.submit(_sensor_worker.process_bytes, sensor_data_bytes)
+            except BrokenProcessPool as e:
+                future, error = None, e
+            else:
+                if self.ordered:
+                    self._pending_results.append(future)
+
+        if future is None:
+            self._shutdown_broken(error)
+            return
+
+        future.add_done_callback(partial(self._on_done, region))
+
+    def submit_spilled(self, sensor_data_header: bytes, handle: "SensorDataHandle"):
+        """
+        Queues a SensorData message whose payload was spilled to a file.  The workers read the payload from the file
+        themselves, and one reference to the handle is released once the message has been processed
+        """
+        with self._lock:
+            if self._closed:
+                handle.release()
+                return
+
+            try:
+                future = self._executor.submit(_sensor_worker.process_spilled, sensor_data_header, handle.payload_path, handle.payload_length)
+            except Exception as e:
+                future, error = None, e
+            else:
+                if self.ordered:
+                    self._pending_results.append(future)
+
+        if future is None:
+            handle.release()
+            if not isinstance(error, BrokenProcessPool):
+                raise error
+            self._shutdown_broken(error)
+            return
+
+        future.add_done_callback(lambda _: handle.release())
+        future.add_done_callback(partial(self._on_done, None))
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stops the worker processes and releases the shared memory ring
+
+        Args:
+            wait (bool, optional): wait for queued messages to finish processing.  Defaults to True
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        if self in _sensor_data_process_pools:
+            _sensor_data_process_pools.remove(self)
+            _update_sensor_data_events()
+
+        self._executor.shutdown(wait=wait)
+        self._shm.close()
+        self._shm.unlink()
+
+        # The delivery thread drains whatever has already completed before it stops.  A result_callback can shut the pool down,
+        # in which case this is running on the delivery thread and mustn't wait for itself
+        self._delivery_queue.put(None)
+        if wait and current_thread() is not self._delivery_thread:
+            self._delivery_thread.join()
+
+    def _shutdown_broken(self, error: BaseException):
+        if self._closed:
+            return
+        _logger.error("Sensor data worker pool for '%s' is broken and is being shut down: %s", self._callback_name, error)
+        # Don't wait: the remaining futures have already failed, and this can run on the delivery thread
+        self.shutdown(wait=False)
+
+    def _allocate(self, length: int) -> Optional[_RingRegion]:
+        # Caller holds self._lock.  Regions are allocated contiguously, so the free space is either
+        # [end of newest, end of ring) + [0, start of oldest) or, once wrapped, [end of newest, start of oldest)
+        size = self._shm.size
+        if length == 0 or length > size:
+            return None
+
+        start = None
+        if not self._regions:
+            start = 0
+        else:
+            oldest = self._regions[0].start
+            newest_end = self._regions[-1].end
+            if self._regions[-1].start >= oldest:
+                if size - newest_end >= length:
+                    start = newest_end
+                elif oldest >= length:
+                    start = 0
+            elif oldest - newest_end >= length:
+                start = newest_end
+
+        if start is None:
+            return None
+
+        region = _RingRegion(start, start + length)
+        self._regions.append(region)
+        return region
+
+    def _on_done(self, region: Optional[_RingRegion], future: Future):
+        # Runs on the executor's management thread, so it only does bookkeeping and leaves delivery to the delivery thread
+        with self._lock:
+            if region is not None:
+                region.done = True
+                while self._regions and self._regions[0].done:
+                    self._regions.popleft()
+
+            if not self.ordered:
+                self._delivery_queue.put(future)
+                return
+
+            # Queued under the lock so results reach the delivery thread in arrival order
+            while self._pending_results and self._pending_results[0].done():
+                self._delivery_queue.put(self._pending_results.popleft())
+
+    def _deliver_results(self):
+        while True:
+            future = self._delivery_queue.get()
+            if future is None:
+                return
+            self._deliver(future)
+
+    def _deliver(self, future: Future):
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool):
+            self._shutdown_broken(error)
+            return
+        if error is not None:
+            _logger.error("Error processing sensor data: %s", error)
+            return
+
+        result, elapsed_seconds = future.result()
+        diagnostics.record(self._callback_name, elapsed_seconds)
+
+        if self.result_callback is not None:
+            try:
+                diagnostics.timed_call(diagnostics.callback_name("SensorDataResult", self.result_callback), self.result_callback, result)
+            except Exception as e:
+                _logger.error("Error in sensor data result callback: %s", e)
+
+
+def _shutdown_process_pools(wait: bool = True):
+    """
+    Internal function to stop every SensorDataProcessPool.  Called when the SDK Client shuts down and at interpreter exit
+    """
+    for pool in list(_sensor_data_process_pools):
+        pool.shutdown(wait=wait)
+
+
+def _update_sensor_data_events():
+    """
+    Internal function to register the client's sensor data events only while there is a subscriber or process pool, so the
+    client doesn't copy or spill SensorData messages that nothing in Python is listening for
+    """
+    global _sensor_data_events_registered
+
+    with _sensor_data_events_lock:
+        has_subscribers = bool(_sensor_data_subscribers or _sensor_data_process_pools)
+        if has_subscribers == _sensor_data_events_registered:
+            return
+
+        if has_subscribers:
+            __sdk_client.SensorDataEventPython += _sensor_data_handler
+            __sdk_client.SensorDataSpilledEventPython += _sensor_data_spill_handler
+        else:
+            __sdk_client.SensorDataEventPython -= _sensor_data_handler
+            __sdk_client.SensorDataSpilledEventPython -= _sensor_data_spill_handler
+        _sensor_data_events_registered = has_subscribers
+
+
+def configure_sensor_data_spill(threshold_bytes: int, directory: Optional[str] = None):
+    """
+    Spills the payload of large SensorData messages to a file instead of copying it through memory on its way to Python.
+    Subscribers registered with lazy=True receive a SensorDataHandle that memory-maps the payload, so a frame is only held
+    in memory once.  Other subscribers receive a SensorData read from the file, and process pool workers read the file themselves.
+    Messages are only spilled while there is at least one sensor data subscriber.
+
+    Args:
+        threshold_bytes (int): messages larger than this are spilled.  0 disables spilling
+        directory (str, optional): where spilled payloads are written.  Defaults to 'tmp/sensordata' under the xfer root directory
+    """
+    if threshold_bytes < 0:
+        raise ValueError("threshold_bytes must be 0 or greater")
+
+    __sdk_client.SensorDataSpillThresholdBytes = threshold_bytes
+    __sdk_client.SensorDataSpillDirectory = directory
+
+
+class SensorDataHandle:
+    """
+    A SensorData message whose payload (SensorData.data.value) was spilled to a file.
+
+    The payload is memory-mapped on first access to `data` and the file is deleted once every subscriber has returned,
+    so subscribers that need the payload afterwards must copy it.
+
+    Attributes:
+        header (SensorData): the message with an empty payload.  header.data.type_url is still set
+        payload_path (str): the file holding the payload
+        payload_length (int): the size of the payload in bytes
+    """
+
+    def __init__(self, header: SensorData, payload_path: str, payload_length: int, references: int = 1):
+        self.header = header
+        self.payload_path = payload_path
+        self.payload_length = payload_length
+        self._references = references
+        self._lock = Lock()
+        self._mmap: Optional[mmap.mmap] = None
+        self._data: Optional[memoryview] = None
+        self._sensor_data: Optional[SensorData] = None
+        self._closed = False
+
+    @property
+    def type_url(self) -> str:
+        return self.header.data.type_url
+
+    @property
+    def data(self) -> memoryview:
+        """
+        Read-only view of the payload, backed by a memory map of the spilled file
+        """
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"SensorData payload '{self.payload_path}' has already been released")
+
+            if self._data is None:
+                if self.payload_length == 0:
+                    self._data = memoryview(b"")
+                else:
+                    with open(self.payload_path, "rb") as payload_file:
+                        self._mmap = mmap.mmap(payload_file.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._data = memoryview(self._mmap)
+            return self._data
+
+    def to_sensor_data(self) -> SensorData:
+        """
+        Reads the payload into a full SensorData message.  The message is built once and shared between callers.
+        """
+        if self._sensor_data is None:
+            sensor_data = SensorData()
+            sensor_data.CopyFrom(self.header)
+            sensor_data.data.value = bytes(self.data)
+            with self._lock:
+                if self._sensor_data is None:
+                    self._sensor_data = sensor_data
+        return self._sensor_data
+
+    def release(self):
+        """
+        Releases one reference to the payload.  The memory map is closed and the file deleted when the last reference is released.
+        """
+        with self._lock:
+            self._references -= 1
+            if self._references > 0 or self._closed:
+                return
+            self._closed = True
+
+            try:
+                if self._data is not None:
+                    self._data.release()
+                if self._mmap is not None:
+                    self._mmap.close()
+            except BufferError:
+                # A subscriber kept a view of the payload.  The map is unmapped once that view is garbage collected.
+                pass
+            self._data = None
+            self._mmap = None
+
+        try:
+            os.remove(self.payload_path)
+        except FileNotFoundError:
+            pass
+
+
+def _run_spilled_sensor_data_callback(callback: Callable, handle: SensorDataHandle, lazy: bool):
+    try:
+        diagnostics.timed_call(diagnostics.callback_name("SensorData", callback), callback, handle if lazy else handle.to_sensor_data())
+    finally:
+        handle.release()
+
+
+def _sensor_data_spill_handler(sensor_data_header, payload_path, payload_length):
+    """
+    Internal function to manage incoming sensorData messages whose payload was spilled to a file by the client app
+    """
+    global _sensor_data_subscribers, _lazy_sensor_data_subscribers, _sensor_data_process_pools
+
+    payload_path = str(payload_path)
+    handle = None
+    # References still owned by this function.  Any that weren't handed to a pool or a subscriber thread are released at the end
+    unreleased = 1
+
+    try:
+        sensor_data_header_bytes = bytes(sensor_data_header)
+        header = SensorData()
+        header.ParseFromString(sensor_data_header_bytes)
+
+        callbacks = list(_sensor_data_subscribers)
+        pools = list(_sensor_data_process_pools)
+        unreleased = len(callbacks) + len(pools) + 1
+        handle = SensorDataHandle(header, payload_path, int(payload_length), references=unreleased)
+
+        for pool in pools:
+            # submit_spilled always takes its reference, releasing it itself if the pool can't take the message
+            unreleased -= 1
+            pool.submit_spilled(sensor_data_header_bytes, handle)
+
+        for callback in callbacks:
+            Thread(target=_run_spilled_sensor_data_callback, args=(callback, handle, callback in _lazy_sensor_data_subscribers)).start()
+            unreleased -= 1
+    except Exception as e:
+        _logger.error("Error parsing spilled sensor data: %s", e)
+    finally:
+        if handle is not None:
+            for _ in range(unreleased):
+                handle.release()
+        elif os.path.exists(payload_path):
+            os.remove(payload_path)
 
 
 def _sensor_data_handler(sensor_data):
     """
     Internal function to manage incoming sensorData message from the client app and do the proto transformation
     """
-    global _sensor_data_subscribers
-    response = SensorData()
+    global _sensor_data_subscribers, _sensor_data_process_pools
 
     try:
-        response.ParseFromString(bytes(sensor_data))
-        for callback in _sensor_data_subscribers:
-            Thread(target=callback, args=(response,)).start()
+        sensor_data_bytes = bytes(sensor_data)
+
+        for pool in list(_sensor_data_process_pools):
+            pool.submit(sensor_data_bytes)
+
+        if _sensor_data_subscribers:
+            response = SensorData()
+            response.ParseFromString(sensor_data_bytes)
+            for callback in _sensor_data_subscribers:
+                Thread(target=diagnostics.timed_call, args=(diagnostics.callback_name("SensorData", callback), callback, response)).start()
     except Exception as e:
-        print(f"Error parsing sensor data: {e}")
+        _logger.error("Error parsing sensor data: %s", e)
 
 
-__sdk_client.SensorDataEventPython += _sensor_data_handler
+__sdk_client.ShutdownEventPython += _shutdown_process_pools
+atexit.register(_shutdown_process_pools)
@@ -1,4 +1,5 @@
-﻿using Dapr.Client.Autogen.Grpc.v1;
+﻿using System.Diagnostics;
+using Dapr.Client.Autogen.Grpc.v1;
 
 namespace Microsoft.Azure.SpaceFx.SDK;
 public class Client {
@@ -44,8 +45,19 @@ public class Client {
     public static EventHandler<MessageFormats.HostServices.Link.LinkResponse>? LinkResponseEvent;
     public delegate void SensorDataEventPythonHandler(byte[] sensorData);
     public static event SensorDataEventPythonHandler? SensorDataEventPython;
-
-    /// <summary>(Optional) Provide a boolean response for the integrated app healthcheck.  If used, any value other than "true" will signify the app is in a failed state and should be terminated.</summary>
+    public delegate void SensorDataSpilledEventPythonHandler(byte[] sensorDataHeader, string payloadPath, long payloadLength);
+    public static event SensorDataSpilledEventPythonHandler? SensorDataSpilledEventPython;
+    public delegate void ShutdownEventPythonHandler();
+    /// <summary>Raised by Shutdown before the client stops, so the Python wrapper can release resources it owns (e.g. sensor data worker processes)</summary>
+    public static event ShutdownEventPythonHandler? ShutdownEventPython;
+
+    /// <summary>(Optional) SensorData messages larger than this many bytes have their payload written to SensorDataSpillDirectory and are routed to SensorDataSpilledEventPython instead of being copied into a byte array.  0 disables spilling.</summary>
+    public static long SensorDataSpillThresholdBytes { get; set; } = 0;
+    /// <summary>(Optional) Directory spilled SensorData payloads are written to.  Defaults to 'tmp/sensordata' under the xfer root directory.</summary>
+    public static string? SensorDataSpillDirectory { get; set; } = null;
+    internal static string? _defaultSensorDataSpillDirectory = null;
+
+    /// <summary>(Optional) Provide a boolean response for the integrated app healthcheck.  If used, any value other than "true" will signify the app is in a failed state and should be terminated.  Evaluated in the background by Health.HealthMonitor; see Health.RegisterCheck for registering additional checks.</summary>
     public delegate bool IsAppHealthyDelegate();
     public static IsAppHealthyDelegate? IsAppHealthy;
 
@@ -73,6 +85,16 @@ public class Client {
     /// Stops the SDK Client and disposes of all resources
     /// </summary>
     public static void Shutdown() {
+        if (ShutdownEventPython is not null) {
+            foreach (ShutdownEventPythonHandler handler in ShutdownEventPython.GetInvocationList().Cast<ShutdownEventPythonHandler>()) {
+                try {
+                    handler();
+                } catch (Exception ex) {
+                    Console.WriteLine($"Exception in shutdown handler: {ex.Message}");
+                }
+            }
+        }
+
         _globalCancellationTokenSource.Cancel();
         if (_client is not null && _grpcHost is not null)
             _grpcHost.StopAsync().Wait();
@@ -146,6 +168,8 @@ public class Client {
             services.AddSingleton<Core.IMessageHandler<MessageFormats.HostServices.Position.PositionResponse>, MessageHandler<MessageFormats.HostServices.Position.PositionResponse>>();
             services.AddSingleton<Core.IMessageHandler<MessageFormats.HostServices.Link.LinkResponse>, MessageHandler<MessageFormats.HostServices.Link.LinkResponse>>();
             services.AddHostedService<ServiceCallback>();
+            services.AddHostedService<Health.HealthMonitor>();
+            services.AddHostedService<Link.TransferTracker>();
         }).ConfigureLogging((logging) => {
             logging.AddProvider(new Microsoft.Extensions.Logging.SpaceFX.Logger.HostSvcLoggerProvider());
             logging.AddSimpleConsole(options => {
@@ -212,10 +236,10 @@ public class Client {
         /// <param name="fullMessage"></param>
         public void MessageReceived(T message, MessageFormats.Common.DirectToApp fullMessage) {
             using (var scope = _serviceProvider.CreateScope()) {
-                _logger.LogDebug($"Receieved message type '{typeof(T).Name}'");
+                if (_logger.IsEnabled(LogLevel.Debug)) _logger.LogDebug($"Receieved message type '{typeof(T).Name}'");
 
                 if (message == null || EqualityComparer<T>.Default.Equals(message, default)) {
-                    _logger.LogDebug("Received empty message '{messageType}' from '{appId}'.  Discarding message.", typeof(T).Name, fullMessage.SourceAppId);
+                    if (_logger.IsEnabled(LogLevel.Debug)) _logger.LogDebug("Received empty message '{messageType}' from '{appId}'.  Discarding message.", typeof(T).Name, fullMessage.SourceAppId);
                     return;
                 }
 
@@ -237,9 +261,9 @@ public class Client {
                         break;
                     case string messageType when messageType.Equals(typeof(MessageFormats.HostServices.Sensor.SensorData).Name, StringComparison.CurrentCultureIgnoreCase):
                         MessageEventRouter(message: message as MessageFormats.HostServices.Sensor.SensorData, sourceAppId: fullMessage.SourceAppId, eventHandler: SensorDataEvent);
-                        if (message != null && message is MessageFormats.HostServices.Sensor.SensorData) {
-                            _logger.LogDebug($"Routing message type '{typeof(T).Name}' to Python event handler");
-                            SensorDataEventPython?.Invoke(message.ToByteArray());
+                        if (message != null && message is MessageFormats.HostServices.Sensor.SensorData sensorData) {
+                            if (_logger.IsEnabled(LogLevel.Debug)) _logger.LogDebug($"Routing message type '{typeof(T).Name}' to Python event handler");
+                            SensorDataPythonRouter(sensorData);
                         }
                         break;
                     case string messageType when messageType.Equals(typeof(MessageFormats.HostServices.Sensor.SensorsAvailableResponse).Name, StringComparison.CurrentCultureIgnoreCase):
@@ -255,13 +279,75 @@ public class Client {
             }
         }
 
+        private void SensorDataPythonRouter(MessageFormats.HostServices.Sensor.SensorData sensorData) {
+            // The Python wrapper only registers these while it has sensor data subscribers, so nothing is copied or spilled otherwise
+            SensorDataEventPythonHandler? sensorDataHandler = SensorDataEventPython;
+            SensorDataSpilledEventPythonHandler? spilledHandler = SensorDataSpilledEventPython;
+            if (sensorDataHandler is null && spilledHandler is null) return;
+
+            if (spilledHandler is not null && SensorDataSpillThresholdBytes > 0 && sensorData.CalculateSize() > SensorDataSpillThresholdBytes) {
+                (byte[] sensorDataHeader, string payloadPath, long payloadLength)? spilled = null;
+                try {
+                    spilled = SpillSensorData(sensorData);
+                } catch (Exception ex) {
+                    _logger.LogError(ex, "Failed to spill SensorData (trackingId: '{trackingId}').  Routing it to Python in memory instead.", sensorData.ResponseHeader?.TrackingId);
+                }
+
+                if (spilled is not null) {
+                    spilledHandler.Invoke(spilled.Value.sensorDataHeader, spilled.Value.payloadPath, spilled.Value.payloadLength);
+                    return;
+                }
+            }
+
+            sensorDataHandler?.Invoke(sensorData.ToByteArray());
+        }
+
+        /// <summary>
+        /// Writes the SensorData payload straight from its ByteString to a file and returns the payload's path along with the
+        /// serialized message minus the payload, so large frames aren't copied into a byte array and again into Python bytes.
+        /// The Python handler is responsible for deleting the file.
+        /// </summary>
+        private (byte[] sensorDataHeader, string payloadPath, long payloadLength) SpillSensorData(MessageFormats.HostServices.Sensor.SensorData sensorData) {
+            string? spillDirectory = string.IsNullOrWhiteSpace(SensorDataSpillDirectory) ? _defaultSensorDataSpillDirectory : SensorDataSpillDirectory;
+            if (spillDirectory is null) throw new InvalidOperationException("No SensorDataSpillDirectory is set and the xfer root directory could not be resolved at startup");
+            Directory.CreateDirectory(spillDirectory);
+
+            string payloadPath = Path.Combine(spillDirectory, $"{Guid.NewGuid()}.bin");
+            ByteString payload = sensorData.Data?.Value ?? ByteString.Empty;
+
+            using (FileStream payloadStream = new(payloadPath, FileMode.CreateNew, FileAccess.Write, FileShare.Read)) {
+                payload.WriteTo(payloadStream);
+            }
+
+            // Clone shares the immutable ByteString rather than copying it, and the payload is swapped out before serializing
+            MessageFormats.HostServices.Sensor.SensorData sensorDataHeader = sensorData.Clone();
+            if (sensorData.Data is not null) sensorDataHeader.Data = new Google.Protobuf.WellKnownTypes.Any() { TypeUrl = sensorData.Data.TypeUrl };
+
+            if (_logger.IsEnabled(LogLevel.Debug)) _logger.LogDebug("Spilled SensorData payload of {payloadLength} bytes to '{payloadPath}' (trackingId: '{trackingId}')", payload.Length, payloadPath, sensorData.ResponseHeader?.TrackingId);
+
+            return (sensorDataHeader.ToByteArray(), payloadPath, payload.Length);
+        }
+
         private void MessageEventRouter<V>(V? message, string sourceAppId, EventHandler<V>? eventHandler) where V : Google.Protobuf.IMessage, new() {
             if (eventHandler == null || message == null) return;
             using (var scope = _serviceProvider.CreateScope()) {
 
                 foreach (Delegate handler in eventHandler.GetInvocationList()) {
-                    Task.Factory.StartNew(
-                        () => handler.DynamicInvoke(sourceAppId, message));
+                    if (!Diagnostics.TrackCallbacks) {
+                        Task.Factory.StartNew(() => handler.DynamicInvoke(sourceAppId, message));
+                        continue;
+                    }
+
+                    Diagnostics.CallbackStats callbackStats = Diagnostics.StatsFor<V>(handler);
+                    Diagnostics.CallbackStarted(callbackStats);
+                    Task.Factory.StartNew(() => {
+                        Stopwatch stopwatch = Stopwatch.StartNew();
+                        try {
+                            handler.DynamicInvoke(sourceAppId, message);
+                        } finally {
+                            Diagnostics.CallbackFinished(callbackStats, stopwatch.Elapsed);
+                        }
+                    });
                 }
             }
         }
@@ -279,29 +365,24 @@ public class Client {
         }
 
         public bool IsHealthy() {
-            if (IsAppHealthy == null) {
-                _logger.LogTrace("No AppHealthCheck event handler registered. Returning default value of 'true'.");
-                return true;
-            }
-
-            _logger.LogTrace("Received Health Check request from cluster. Triggering IsAppHealthy event handler.");
-            try {
-                bool isHealthy = IsAppHealthy();
-                _logger.LogDebug($"IsAppHealthy returned '{isHealthy}'.");
-                if (!isHealthy) {
-                    _logger.LogCritical("IsAppHealthy returned 'false' and is unhealthy. Check logs for more details.");
-                }
-                return isHealthy;
-            } catch (Exception ex) {
-                _logger.LogError(ex, "Exception calling IsAppHealthy. Setting response to false.");
-                return false;
-            }
+            // Health checks (including IsAppHealthy) are evaluated by Health.HealthMonitor in the background.  The probe only reads the cached result.
+            _logger.LogTrace("Received Health Check request from cluster. Returning cached health check results.");
+            return Health.IsHealthy();
         }
 
         protected override Task ExecuteAsync(CancellationToken stoppingToken) {
             return Task.Run(() => {
                 using (var scope = _serviceProvider.CreateScope()) {
                     _appId = _client.GetAppID().Result;
+
+                    // Resolved once here so spilling sensor data doesn't block the message handling thread on it
+                    try {
+                        var (_, _, root_directory) = Core.GetXFerDirectories().Result;
+                        _defaultSensorDataSpillDirectory = Path.Combine(root_directory, "tmp", "sensordata");
+                    } catch (Exception ex) {
+                        _logger.LogWarning(ex, "Unable to resolve the xfer root directory.  SensorData will only be spilled if SensorDataSpillDirectory is set.");
+                    }
+
                     SPACEFX_CLIENT = _client;
                 }
             });
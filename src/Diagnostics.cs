@@ -0,0 +1,134 @@
+using System.Collections.Concurrent;
+using System.Reflection;
+
+namespace Microsoft.Azure.SpaceFx.SDK;
+
+/// <summary>
+/// Timing statistics for the event handlers the SDK dispatches messages to, so a slow handler can be identified
+/// instead of only showing up as thread growth or timeouts elsewhere.
+/// </summary>
+public class Diagnostics {
+    private static ILogger? _logger = null;
+    private static ILogger Logger {
+        get {
+            if (Client._grpcHost is null) throw new Exception("Client is not provisioned.  Please deploy the client before trying to run this");
+            if (_logger is null) {
+                _logger = Client._grpcHost.Services.GetRequiredService<ILoggerFactory>().CreateLogger(typeof(Diagnostics));
+            }
+            return _logger;
+        }
+    }
+
+    /// <summary>Upper bound (in milliseconds) of each histogram bucket.  The last bucket counts everything slower.</summary>
+    public static readonly double[] BucketUpperBoundsMs = { 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, double.PositiveInfinity };
+
+    public class CallbackStats {
+        public string Name { get; init; } = "";
+        public long Count { get; internal set; }
+        public long SlowCount { get; internal set; }
+        public long InFlight { get; internal set; }
+        public double TotalMs { get; internal set; }
+        public double MaxMs { get; internal set; }
+        public long[] BucketCounts { get; init; } = new long[BucketUpperBoundsMs.Length];
+        public double MeanMs => Count == 0 ? 0 : TotalMs / Count;
+
+        internal CallbackStats Snapshot() {
+            lock (this) {
+                return new CallbackStats() {
+                    Name = Name,
+                    Count = Count,
+                    SlowCount = SlowCount,
+                    InFlight = InFlight,
+                    TotalMs = TotalMs,
+                    MaxMs = MaxMs,
+                    BucketCounts = (long[]) BucketCounts.Clone()
+                };
+            }
+        }
+    }
+
+    private static readonly ConcurrentDictionary<string, CallbackStats> _callbackStats = new();
+
+    // Stats for each handler method, per message type, so dispatching a message doesn't rebuild the handler's name to find them
+    private static class HandlerStats<V> {
+        internal static readonly ConcurrentDictionary<MethodInfo, CallbackStats> ByMethod = new();
+    }
+
+    /// <summary>Time every event handler call and collect its CallbackStats.  Disabled by default, since it adds work to every message dispatch.</summary>
+    public static bool TrackCallbacks { get; set; } = false;
+
+    /// <summary>Handler calls that take longer than this are logged as warnings.  Defaults to 1 second.</summary>
+    public static TimeSpan SlowCallbackThreshold { get; set; } = TimeSpan.FromSeconds(1);
+
+    /// <summary>Send the duration of slow handler calls to hostsvc-logging as telemetry.  Disabled by default.</summary>
+    public static bool EmitTelemetry { get; set; } = false;
+
+    /// <summary>
+    /// Returns a snapshot of the timing statistics for every handler that has been called
+    /// </summary>
+    public static List<CallbackStats> GetCallbackStats() {
+        return _callbackStats.Values.Select(stats => stats.Snapshot()).OrderBy(stats => stats.Name).ToList();
+    }
+
+    /// <summary>
+    /// Clears the timing statistics.  Handlers that are running keep being tracked.
+    /// </summary>
+    public static void ResetCallbackStats() {
+        foreach (CallbackStats stats in _callbackStats.Values) {
+            lock (stats) {
+                stats.Count = 0;
+                stats.SlowCount = 0;
+                stats.TotalMs = 0;
+                stats.MaxMs = 0;
+                Array.Clear(stats.BucketCounts);
+            }
+        }
+    }
+
+    internal static CallbackStats StatsFor<V>(Delegate handler) {
+        return HandlerStats<V>.ByMethod.GetOrAdd(handler.Method, (method) => _callbackStats.GetOrAdd(CallbackName(typeof(V), method), (name) => new CallbackStats() { Name = name }));
+    }
+
+    private static string CallbackName(Type messageType, MethodInfo method) {
+        return $"{messageType.Name}:{method.DeclaringType?.FullName}.{method.Name}";
+    }
+
+    internal static void CallbackStarted(CallbackStats stats) {
+        lock (stats) {
+            stats.InFlight++;
+        }
+    }
+
+    internal static void CallbackFinished(CallbackStats stats, TimeSpan elapsed) {
+        string name = stats.Name;
+        double elapsedMs = elapsed.TotalMilliseconds;
+        bool isSlow = elapsed > SlowCallbackThreshold;
+        long inFlight;
+
+        lock (stats) {
+            stats.InFlight--;
+            stats.Count++;
+            stats.TotalMs += elapsedMs;
+            stats.MaxMs = Math.Max(stats.MaxMs, elapsedMs);
+            stats.BucketCounts[BucketIndex(elapsedMs)]++;
+            if (isSlow) stats.SlowCount++;
+            inFlight = stats.InFlight;
+        }
+
+        if (!isSlow) return;
+
+        Logger.LogWarning("Callback '{name}' took {elapsedMs} ms, which is over the slow callback threshold of {threshold}.  {inFlight} call(s) still in flight.", name, elapsedMs, SlowCallbackThreshold, inFlight);
+
+        if (EmitTelemetry) {
+            Logging.SendTelemetry(metricName: $"slow_callback_ms:{name}", metricValue: (int) elapsedMs)
+                .ContinueWith(task => Logger.LogWarning(task.Exception, "Failed to send slow callback telemetry for '{name}'", name), TaskContinuationOptions.OnlyOnFaulted);
+        }
+    }
+
+    private static int BucketIndex(double elapsedMs) {
+        for (int i = 0; i < BucketUpperBoundsMs.Length; i++) {
+            if (elapsedMs <= BucketUpperBoundsMs[i]) return i;
+        }
+        return BucketUpperBoundsMs.Length - 1;
+    }
+}
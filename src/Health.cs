@@ -0,0 +1,200 @@
+using System.Collections.Concurrent;
+using System.Diagnostics;
+
+namespace Microsoft.Azure.SpaceFx.SDK;
+
+/// <summary>
+/// Evaluates the app's health checks on a background schedule so cluster health probes are answered from a cached result
+/// instead of calling into the app (and, for Python apps, across the pythonnet boundary) on every probe.
+/// </summary>
+public class Health {
+    internal const string APP_HEALTH_CHECK_NAME = "IsAppHealthy";
+    private static ILogger? _logger = null;
+    private static ILogger Logger {
+        get {
+            if (Client._grpcHost is null) throw new Exception("Client is not provisioned.  Please deploy the client before trying to run this");
+            if (_logger is null) {
+                _logger = Client._grpcHost.Services.GetRequiredService<ILoggerFactory>().CreateLogger(typeof(Health));
+            }
+            return _logger;
+        }
+    }
+
+    public class HealthCheckResult {
+        public string Name { get; init; } = "";
+        public bool IsHealthy { get; init; }
+        public string Message { get; init; } = "";
+        public TimeSpan Duration { get; init; }
+        public DateTime LastChecked { get; init; }
+    }
+
+    private class HealthCheck {
+        internal string Name { get; init; } = "";
+        internal Func<bool> Check { get; init; } = () => true;
+        internal TimeSpan? Timeout { get; init; }
+        internal Task<bool>? InFlight { get; set; }
+        internal DateTime InFlightSince { get; set; }
+    }
+
+    private static readonly ConcurrentDictionary<string, HealthCheck> _checks = new(StringComparer.InvariantCultureIgnoreCase);
+    private static readonly ConcurrentDictionary<string, HealthCheckResult> _results = new(StringComparer.InvariantCultureIgnoreCase);
+
+    /// <summary>How often the registered health checks are evaluated.  Defaults to 5 seconds.</summary>
+    public static TimeSpan CheckInterval { get; set; } = TimeSpan.FromSeconds(5);
+
+    /// <summary>How old a cached result can be before the app is reported as unhealthy.  Defaults to 30 seconds.</summary>
+    public static TimeSpan StalenessThreshold { get; set; } = TimeSpan.FromSeconds(30);
+
+    /// <summary>How long a health check can run before it's considered failed, unless the check was registered with its own timeout.  Defaults to 10 seconds.</summary>
+    public static TimeSpan DefaultCheckTimeout { get; set; } = TimeSpan.FromSeconds(10);
+
+    /// <summary>Send each check's duration to hostsvc-logging as a telemetry metric.  Disabled by default.</summary>
+    public static bool EmitTelemetry { get; set; } = false;
+
+    /// <summary>
+    /// Registers a health check to be evaluated in the background.  Registering a check with an existing name replaces it.
+    /// </summary>
+    /// <param name="name">Unique name of the health check</param>
+    /// <param name="check">Function returning true when healthy.  Exceptions are treated as unhealthy.</param>
+    /// <param name="timeout">How long the check can run before it's considered failed.  Defaults to DefaultCheckTimeout</param>
+    public static void RegisterCheck(string name, Func<bool> check, TimeSpan? timeout = null) {
+        if (string.IsNullOrWhiteSpace(name)) throw new ArgumentException("Health check name is required", nameof(name));
+        if (check is null) throw new ArgumentNullException(nameof(check));
+
+        _checks[name] = new HealthCheck() { Name = name, Check = check, Timeout = timeout };
+        _results.TryRemove(name, out _);
+    }
+
+    /// <summary>
+    /// Removes a previously registered health check
+    /// </summary>
+    public static bool UnregisterCheck(string name) {
+        _results.TryRemove(name, out _);
+        return _checks.TryRemove(name, out _);
+    }
+
+    /// <summary>
+    /// Returns the cached result of each health check
+    /// </summary>
+    public static List<HealthCheckResult> GetResults() {
+        return _results.Values.OrderBy(result => result.Name).ToList();
+    }
+
+    /// <summary>
+    /// Returns the cached health of the app.  The app is unhealthy if any check failed, or if any result is older than StalenessThreshold.
+    /// Checks that haven't completed their first evaluation yet are ignored.
+    /// </summary>
+    public static bool IsHealthy() {
+        DateTime staleBefore = DateTime.UtcNow.Subtract(StalenessThreshold);
+
+        foreach (HealthCheckResult result in _results.Values) {
+            if (!result.IsHealthy) {
+                Logger.LogCritical("Health check '{name}' is unhealthy: '{message}'.  Check logs for more details.", result.Name, result.Message);
+                return false;
+            }
+
+            if (result.LastChecked < staleBefore) {
+                Logger.LogCritical("Health check '{name}' was last evaluated at '{lastChecked}', which is older than the staleness threshold of '{threshold}'.", result.Name, result.LastChecked, StalenessThreshold);
+                return false;
+            }
+        }
+
+        return true;
+    }
+
+    /// <summary>
+    /// Evaluates every registered health check once and caches the results
+    /// </summary>
+    internal static async Task RunChecks(CancellationToken cancellationToken) {
+        // The legacy IsAppHealthy delegate is evaluated as a regular check so it gets the same timeout and caching
+        if (Client.IsAppHealthy is not null) {
+            _checks.GetOrAdd(APP_HEALTH_CHECK_NAME, (name) => new HealthCheck() { Name = name, Check = () => Client.IsAppHealthy?.Invoke() ?? true });
+        } else if (_checks.TryRemove(APP_HEALTH_CHECK_NAME, out _)) {
+            _results.TryRemove(APP_HEALTH_CHECK_NAME, out _);
+        }
+
+        HealthCheckResult[] results = await Task.WhenAll(_checks.Values.Select(healthCheck => EvaluateCheck(healthCheck, cancellationToken)));
+
+        foreach (HealthCheckResult result in results) {
+            // Skip results for checks that were unregistered while they were running
+            if (!_checks.ContainsKey(result.Name)) continue;
+            _results[result.Name] = result;
+
+            if (EmitTelemetry) {
+                Logging.SendTelemetry(metricName: $"health_check_{result.Name}_duration_ms", metricValue: (int) result.Duration.TotalMilliseconds)
+                    .ContinueWith(task => Logger.LogWarning(task.Exception, "Failed to send duration telemetry for health check '{name}'", result.Name), TaskContinuationOptions.OnlyOnFaulted);
+            }
+        }
+    }
+
+    private static async Task<HealthCheckResult> EvaluateCheck(HealthCheck healthCheck, CancellationToken cancellationToken) {
+        TimeSpan timeout = healthCheck.Timeout ?? DefaultCheckTimeout;
+
+        // A check that blew through its timeout last time is still running.  Don't stack another invocation on top of it.
+        if (healthCheck.InFlight is not null && !healthCheck.InFlight.IsCompleted) {
+            return new HealthCheckResult() {
+                Name = healthCheck.Name,
+                IsHealthy = false,
+                Message = $"Previous evaluation is still running after {DateTime.UtcNow - healthCheck.InFlightSince}",
+                Duration = DateTime.UtcNow - healthCheck.InFlightSince,
+                LastChecked = DateTime.UtcNow
+            };
+        }
+
+        bool isHealthy;
+        string message = "";
+        Stopwatch stopwatch = Stopwatch.StartNew();
+        healthCheck.InFlightSince = DateTime.UtcNow;
+        healthCheck.InFlight = Task.Run(healthCheck.Check);
+
+        try {
+            isHealthy = await healthCheck.InFlight.WaitAsync(timeout, cancellationToken);
+            if (!isHealthy) message = "Health check returned 'false'";
+        } catch (TimeoutException) {
+            isHealthy = false;
+            message = $"Health check timed out after {timeout}";
+        } catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested) {
+            throw;
+        } catch (Exception ex) {
+            Logger.LogError(ex, "Exception calling health check '{name}'. Setting result to false.", healthCheck.Name);
+            isHealthy = false;
+            message = ex.Message;
+        }
+
+        stopwatch.Stop();
+
+        Logger.LogTrace("Health check '{name}' returned '{isHealthy}' in {duration} ms", healthCheck.Name, isHealthy, stopwatch.Elapsed.TotalMilliseconds);
+
+        return new HealthCheckResult() {
+            Name = healthCheck.Name,
+            IsHealthy = isHealthy,
+            Message = message,
+            Duration = stopwatch.Elapsed,
+            LastChecked = DateTime.UtcNow
+        };
+    }
+
+    public class HealthMonitor : BackgroundService {
+        private readonly ILogger<HealthMonitor> _logger;
+
+        public HealthMonitor(ILogger<HealthMonitor> logger) {
+            _logger = logger;
+        }
+
+        protected override async Task ExecuteAsync(CancellationToken stoppingToken) {
+            _logger.LogDebug("Starting health monitor.  Interval: '{interval}'", CheckInterval);
+
+            while (!stoppingToken.IsCancellationRequested) {
+                try {
+                    await RunChecks(stoppingToken);
+                    await Task.Delay(CheckInterval, stoppingToken);
+                } catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested) {
+                    break;
+                } catch (Exception ex) {
+                    _logger.LogError(ex, "Unexpected exception evaluating health checks");
+                    await Task.Delay(CheckInterval, stoppingToken).ContinueWith(_ => { });
+                }
+            }
+        }
+    }
+}
@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using Microsoft.Azure.SpaceFx.MessageFormats.HostServices.Link;
 
 namespace Microsoft.Azure.SpaceFx.SDK;
@@ -17,51 +18,261 @@ public class Link {
 
     private static readonly string TARGET_SERVICE_APP_ID = $"hostsvc-{MessageFormats.Common.HostServices.Link}".ToLower();
 
+    /// <summary>How long the transfer tracker waits before the first status re-query of a transfer that hasn't completed.  Doubles after each re-query, up to MaxStatusQueryInterval.</summary>
+    public static TimeSpan InitialStatusQueryInterval { get; set; } = TimeSpan.FromSeconds(1);
+
+    /// <summary>Upper bound for the status re-query backoff.  Defaults to 5 minutes.</summary>
+    public static TimeSpan MaxStatusQueryInterval { get; set; } = TimeSpan.FromMinutes(5);
+
+    /// <summary>
+    /// A file handed to hostsvc-link that hasn't necessarily completed yet.  Downlinks can stay Pending until the next ground contact,
+    /// so transfers are held by a single shared tracker instead of each one polling for its response.
+    /// </summary>
+    public class LinkTransfer {
+        private readonly TaskCompletionSource<LinkResponse> _completion = new(TaskCreationOptions.RunContinuationsAsynchronously);
+        private readonly List<Action<LinkResponse>> _progressCallbacks = new();
+
+        public LinkRequest LinkRequest { get; }
+        public string TrackingId => LinkRequest.RequestHeader.TrackingId;
+        /// <summary>Where the file was placed in the outbox for hostsvc-link to pick up</summary>
+        public string OutboxFile { get; }
+        public DateTime Started { get; } = DateTime.UtcNow;
+        public DateTime Deadline { get; }
+        /// <summary>The most recent LinkResponse heard for this transfer, Pending or final</summary>
+        public LinkResponse? LastResponse { get; private set; }
+        public int ResponsesHeard { get; private set; }
+        /// <summary>True once the file has been seen to leave the outbox, meaning hostsvc-link has picked it up</summary>
+        public bool LeftOutbox { get; internal set; }
+        /// <summary>Completes with the final (non-Pending) LinkResponse, or faults with a TimeoutException at the Deadline, or an OperationCanceledException if the client shuts down first</summary>
+        public Task<LinkResponse> Completion => _completion.Task;
+        public bool IsCompleted => _completion.Task.IsCompleted;
+
+        internal TimeSpan StatusQueryInterval;
+        internal DateTime NextStatusQuery;
+
+        internal LinkTransfer(LinkRequest linkRequest, string outboxFile, TimeSpan maxWait) {
+            LinkRequest = linkRequest;
+            OutboxFile = outboxFile;
+            Deadline = Started.Add(maxWait);
+            StatusQueryInterval = InitialStatusQueryInterval;
+            NextStatusQuery = Started.Add(StatusQueryInterval);
+        }
+
+        /// <summary>
+        /// Calls callback with each Pending LinkResponse heard for this transfer
+        /// </summary>
+        public void OnProgress(Action<LinkResponse> callback) {
+            lock (_progressCallbacks) {
+                _progressCallbacks.Add(callback);
+            }
+        }
+
+        /// <summary>
+        /// Calls callback once the transfer completes, successfully or not.  Called immediately if it already has.
+        /// </summary>
+        public void OnCompleted(Action<LinkTransfer> callback) {
+            Completion.ContinueWith((_) => {
+                try {
+                    callback(this);
+                } catch (Exception ex) {
+                    Logger.LogError(ex, "Completion callback for link transfer failed (trackingId: '{trackingId}')", TrackingId);
+                }
+            }, TaskScheduler.Default);
+        }
+
+        internal void ResponseReceived(LinkResponse response) {
+            List<Action<LinkResponse>> progressCallbacks;
+            lock (_progressCallbacks) {
+                LastResponse = response;
+                ResponsesHeard++;
+                progressCallbacks = _progressCallbacks.ToList();
+            }
+
+            if (response.ResponseHeader.Status != MessageFormats.Common.StatusCodes.Pending) {
+                _completion.TrySetResult(response);
+                return;
+            }
+
+            foreach (Action<LinkResponse> callback in progressCallbacks) {
+                try {
+                    callback(response);
+                } catch (Exception ex) {
+                    Logger.LogError(ex, "Progress callback for link transfer failed (trackingId: '{trackingId}')", TrackingId);
+                }
+            }
+        }
+
+        internal void TimedOut() {
+            _completion.TrySetException(new TimeoutException($"Timed out waiting for a response from {TARGET_SERVICE_APP_ID}"));
+        }
+
+        internal void Stopped() {
+            _completion.TrySetException(new OperationCanceledException($"The client shut down before a response was heard from {TARGET_SERVICE_APP_ID}"));
+        }
+    }
+
+    private static readonly ConcurrentDictionary<string, LinkTransfer> _transfers = new();
+    private static readonly SemaphoreSlim _trackerSignal = new(0);
+    private static volatile bool _trackerStopped = false;
+
+    /// <summary>
+    /// Returns the transfers that are waiting for a final LinkResponse
+    /// </summary>
+    public static List<LinkTransfer> GetTransfers() {
+        return _transfers.Values.OrderBy(transfer => transfer.Started).ToList();
+    }
+
+    private static void TrackTransfer(LinkTransfer transfer) {
+        _transfers[transfer.TrackingId] = transfer;
+
+        // The client is shutting down and the tracker has already failed the outstanding transfers
+        if (_trackerStopped && _transfers.TryRemove(transfer.TrackingId, out _)) {
+            transfer.Stopped();
+            return;
+        }
+
+        // Let the tracker recalculate when it next needs to wake up
+        _trackerSignal.Release();
+    }
+
+    private static void TrackedLinkResponseEventHandler(object? _, LinkResponse eventHandlerResponse) {
+        if (!_transfers.TryGetValue(eventHandlerResponse.ResponseHeader.TrackingId, out LinkTransfer? transfer)) return;
+
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
+
+        transfer.ResponseReceived(eventHandlerResponse);
+        if (transfer.IsCompleted) _transfers.TryRemove(transfer.TrackingId, out _);
+    }
+
+    /// <summary>
+    /// Single loop shared by every outstanding transfer, run as a hosted service so it stops with the client.  Responses complete their
+    /// transfer as soon as they arrive, so the loop only wakes for the next deadline or status re-query.  hostsvc-link has no status query
+    /// message, so a re-query checks whether the file has left the outbox; re-queries back off exponentially so a transfer waiting hours
+    /// for a ground contact costs a handful of checks.  Transfers still outstanding when the client stops fail with an OperationCanceledException.
+    /// </summary>
+    public class TransferTracker : BackgroundService {
+        private readonly ILogger<TransferTracker> _logger;
+
+        public TransferTracker(ILogger<TransferTracker> logger) {
+            _logger = logger;
+        }
+
+        protected override async Task ExecuteAsync(CancellationToken stoppingToken) {
+            Client.LinkResponseEvent += TrackedLinkResponseEventHandler;
+
+            try {
+                while (!stoppingToken.IsCancellationRequested) {
+                    try {
+                        await _trackerSignal.WaitAsync(CheckTransfers(), stoppingToken);
+                    } catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested) {
+                        break;
+                    } catch (Exception ex) {
+                        _logger.LogError(ex, "Link transfer tracker failed.  Retrying in {interval}", InitialStatusQueryInterval);
+                        await Task.Delay(InitialStatusQueryInterval, stoppingToken).ContinueWith(_ => { });
+                    }
+                }
+            } finally {
+                _trackerStopped = true;
+                Client.LinkResponseEvent -= TrackedLinkResponseEventHandler;
+
+                foreach (LinkTransfer transfer in _transfers.Values) {
+                    _transfers.TryRemove(transfer.TrackingId, out _);
+                    transfer.Stopped();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Times out and re-queries the transfers that are due, and returns how long until the next one is
+        /// </summary>
+        private TimeSpan CheckTransfers() {
+            DateTime now = DateTime.UtcNow;
+            TimeSpan nextWake = MaxStatusQueryInterval;
+
+            foreach (LinkTransfer transfer in _transfers.Values) {
+                if (transfer.IsCompleted) {
+                    _transfers.TryRemove(transfer.TrackingId, out _);
+                    continue;
+                }
+
+                if (now >= transfer.Deadline) {
+                    _logger.LogError("Timed out waiting for '{messageType}'.  Deadline: '{deadline}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(LinkResponse), transfer.Deadline, transfer.TrackingId, transfer.LinkRequest.RequestHeader.CorrelationId);
+                    _transfers.TryRemove(transfer.TrackingId, out _);
+                    transfer.TimedOut();
+                    continue;
+                }
+
+                if (now >= transfer.NextStatusQuery) {
+                    QueryTransferStatus(transfer);
+                    transfer.StatusQueryInterval = TimeSpan.FromTicks(Math.Min(transfer.StatusQueryInterval.Ticks * 2, MaxStatusQueryInterval.Ticks));
+                    transfer.NextStatusQuery = now.Add(transfer.StatusQueryInterval);
+                }
+
+                nextWake = new[] { nextWake, transfer.Deadline - now, transfer.NextStatusQuery - now }.Min();
+            }
+
+            return nextWake < TimeSpan.Zero ? TimeSpan.Zero : nextWake;
+        }
+    }
+
+    private static void QueryTransferStatus(LinkTransfer transfer) {
+        if (transfer.LeftOutbox || File.Exists(transfer.OutboxFile)) return;
+
+        transfer.LeftOutbox = true;
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("File '{file}' has left the outbox and is with '{appId}'.  Last status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}')", transfer.OutboxFile, TARGET_SERVICE_APP_ID, transfer.LastResponse?.ResponseHeader.Status, transfer.TrackingId, transfer.LinkRequest.RequestHeader.CorrelationId);
+    }
+
     public static Task<MessageFormats.HostServices.Link.LinkResponse> SendFileToApp(string destinationAppId, string file, bool overwriteDestinationFile = false, int? responseTimeoutSecs = null) {
-        MessageFormats.HostServices.Link.LinkRequest linkRequest = new() {
-            RequestHeader = new() {
-                TrackingId = Guid.NewGuid().ToString()
-            },
-            LinkType = MessageFormats.HostServices.Link.LinkRequest.Types.LinkType.App2App,
-            DestinationAppId = destinationAppId,
-            FileName = System.IO.Path.GetFileName(file),
-            Overwrite = overwriteDestinationFile
-        };
+        return SendLinkRequest(BuildLinkRequest(MessageFormats.HostServices.Link.LinkRequest.Types.LinkType.App2App, destinationAppId, file, overwriteDestinationFile), file: file, responseTimeoutSecs: responseTimeoutSecs);
+    }
 
-        return SendLinkRequest(linkRequest, file: file, responseTimeoutSecs: responseTimeoutSecs);
+    public static Task<LinkTransfer> StartFileToApp(string destinationAppId, string file, bool overwriteDestinationFile = false, int? responseTimeoutSecs = null) {
+        return StartLinkRequest(BuildLinkRequest(MessageFormats.HostServices.Link.LinkRequest.Types.LinkType.App2App, destinationAppId, file, overwriteDestinationFile), file: file, responseTimeoutSecs: responseTimeoutSecs);
     }
 
     public static Task<MessageFormats.HostServices.Link.LinkResponse> DownlinkFile(string destinationAppId, string file, bool overwriteDestinationFile = false, int? responseTimeoutSecs = null) {
-        MessageFormats.HostServices.Link.LinkRequest linkRequest = new() {
-            RequestHeader = new() {
-                TrackingId = Guid.NewGuid().ToString()
-            },
-            LinkType = MessageFormats.HostServices.Link.LinkRequest.Types.LinkType.Downlink,
-            DestinationAppId = destinationAppId,
-            FileName = System.IO.Path.GetFileName(file),
-            Overwrite = overwriteDestinationFile
-        };
+        return SendLinkRequest(BuildLinkRequest(MessageFormats.HostServices.Link.LinkRequest.Types.LinkType.Downlink, destinationAppId, file, overwriteDestinationFile), file: file, responseTimeoutSecs: responseTimeoutSecs);
+    }
 
-        return SendLinkRequest(linkRequest, file: file, responseTimeoutSecs: responseTimeoutSecs);
+    public static Task<LinkTransfer> StartDownlinkFile(string destinationAppId, string file, bool overwriteDestinationFile = false, int? responseTimeoutSecs = null) {
+        return StartLinkRequest(BuildLinkRequest(MessageFormats.HostServices.Link.LinkRequest.Types.LinkType.Downlink, destinationAppId, file, overwriteDestinationFile), file: file, responseTimeoutSecs: responseTimeoutSecs);
     }
 
     public static Task<MessageFormats.HostServices.Link.LinkResponse> CrosslinkFile(string destinationAppId, string file, bool overwriteDestinationFile = false, int? responseTimeoutSecs = null) {
-        MessageFormats.HostServices.Link.LinkRequest linkRequest = new() {
+        return SendLinkRequest(BuildLinkRequest(MessageFormats.HostServices.Link.LinkRequest.Types.LinkType.Crosslink, destinationAppId, file, overwriteDestinationFile), file: file, responseTimeoutSecs: responseTimeoutSecs);
+    }
+
+    public static Task<LinkTransfer> StartCrosslinkFile(string destinationAppId, string file, bool overwriteDestinationFile = false, int? responseTimeoutSecs = null) {
+        return StartLinkRequest(BuildLinkRequest(MessageFormats.HostServices.Link.LinkRequest.Types.LinkType.Crosslink, destinationAppId, file, overwriteDestinationFile), file: file, responseTimeoutSecs: responseTimeoutSecs);
+    }
+
+    private static MessageFormats.HostServices.Link.LinkRequest BuildLinkRequest(MessageFormats.HostServices.Link.LinkRequest.Types.LinkType linkType, string destinationAppId, string file, bool overwriteDestinationFile) {
+        return new() {
             RequestHeader = new() {
-                TrackingId = Guid.NewGuid().ToString()
+                TrackingId = Utils.NewTrackingId()
             },
-            LinkType = MessageFormats.HostServices.Link.LinkRequest.Types.LinkType.Crosslink,
+            LinkType = linkType,
             DestinationAppId = destinationAppId,
             FileName = System.IO.Path.GetFileName(file),
             Overwrite = overwriteDestinationFile
         };
-
-        return SendLinkRequest(linkRequest, file: file, responseTimeoutSecs: responseTimeoutSecs);
     }
 
     public static Task<MessageFormats.HostServices.Link.LinkResponse> SendLinkRequest(MessageFormats.HostServices.Link.LinkRequest linkRequest, string file, int? responseTimeoutSecs = null) => Task.Run(async () => {
-        MessageFormats.HostServices.Link.LinkResponse? response = null;
+        LinkTransfer transfer = await StartLinkRequest(linkRequest, file: file, responseTimeoutSecs: responseTimeoutSecs);
+
+        MessageFormats.HostServices.Link.LinkResponse response = await transfer.Completion;
+
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(LinkResponse), response.ResponseHeader.Status, linkRequest.RequestHeader.TrackingId, linkRequest.RequestHeader.CorrelationId, response.ResponseHeader.Status);
 
+        return response;
+    });
+
+    /// <summary>
+    /// Hands a file to hostsvc-link and returns as soon as the request is sent.  The returned LinkTransfer completes when a final
+    /// (non-Pending) LinkResponse is heard, or faults with a TimeoutException once responseTimeoutSecs have passed (or an OperationCanceledException if the client shuts down first).
+    /// </summary>
+    public static Task<LinkTransfer> StartLinkRequest(MessageFormats.HostServices.Link.LinkRequest linkRequest, string file, int? responseTimeoutSecs = null) => Task.Run(async () => {
         bool targetServiceOnline = false;
 
         if (!File.Exists(file)) {
@@ -69,31 +280,33 @@ public class Link {
             throw new FileNotFoundException($"File '{file}' not found.  Check path");
         }
 
-        if (string.IsNullOrWhiteSpace(linkRequest.RequestHeader.TrackingId)) linkRequest.RequestHeader.TrackingId = Guid.NewGuid().ToString();
+        if (string.IsNullOrWhiteSpace(linkRequest.RequestHeader.TrackingId)) linkRequest.RequestHeader.TrackingId = Utils.NewTrackingId();
         if (string.IsNullOrWhiteSpace(linkRequest.RequestHeader.CorrelationId)) linkRequest.RequestHeader.CorrelationId = linkRequest.RequestHeader.TrackingId;
 
-        var (inbox_directory, outbox_directory, root_directory) = Core.GetXFerDirectories().Result;
+        var (inbox_directory, outbox_directory, root_directory) = await Core.GetXFerDirectories();
+        string outboxFile = file;
 
         if (!file.StartsWith(outbox_directory)) {
-            Logger.LogDebug("Moving '{file}' to outbox directory '{outbox}' (trackingId: '{trackingId}' / correlationId: '{correlationId}')", file, outbox_directory, linkRequest.RequestHeader.TrackingId, linkRequest.RequestHeader.CorrelationId);
+            if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Moving '{file}' to outbox directory '{outbox}' (trackingId: '{trackingId}' / correlationId: '{correlationId}')", file, outbox_directory, linkRequest.RequestHeader.TrackingId, linkRequest.RequestHeader.CorrelationId);
             if (string.IsNullOrWhiteSpace(linkRequest.Subdirectory)) {
-                File.Copy(file, Path.Combine(outbox_directory, System.IO.Path.GetFileName(file)), overwrite: true);
+                outboxFile = Path.Combine(outbox_directory, System.IO.Path.GetFileName(file));
             } else {
                 Directory.CreateDirectory(Path.Combine(outbox_directory, linkRequest.Subdirectory));
-                File.Copy(file, Path.Combine(outbox_directory, linkRequest.Subdirectory, System.IO.Path.GetFileName(file)), overwrite: true);
+                outboxFile = Path.Combine(outbox_directory, linkRequest.Subdirectory, System.IO.Path.GetFileName(file));
             }
+            File.Copy(file, outboxFile, overwrite: true);
         } else {
             linkRequest.Subdirectory = System.IO.Path.GetDirectoryName(file) ?? "";
             linkRequest.Subdirectory = linkRequest.Subdirectory.Replace(outbox_directory, ""); // Calculate the subdirectory name by removing the outbox directory name
-            Logger.LogDebug("File '{file}' is in a subdirectory within outbox directory '{outbox}' of '{subdir}' (trackingId: '{trackingId}' / correlationId: '{correlationId}')", file, outbox_directory, linkRequest.Subdirectory, linkRequest.RequestHeader.TrackingId, linkRequest.RequestHeader.CorrelationId);
+            if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("File '{file}' is in a subdirectory within outbox directory '{outbox}' of '{subdir}' (trackingId: '{trackingId}' / correlationId: '{correlationId}')", file, outbox_directory, linkRequest.Subdirectory, linkRequest.RequestHeader.TrackingId, linkRequest.RequestHeader.CorrelationId);
         }
 
         linkRequest.FileName = System.IO.Path.GetFileName(file);
 
 
-        Logger.LogDebug("Waiting for service '{service_app_id}' to come online", TARGET_SERVICE_APP_ID);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for service '{service_app_id}' to come online", TARGET_SERVICE_APP_ID);
         // Wait for the service to come online
-        targetServiceOnline = Utils.WaitForService(appId: TARGET_SERVICE_APP_ID, responseTimeoutSecs: responseTimeoutSecs).Result;
+        targetServiceOnline = await Utils.WaitForService(appId: TARGET_SERVICE_APP_ID, responseTimeoutSecs: responseTimeoutSecs);
 
         if (!targetServiceOnline) {
             Logger.LogError("Service '{service_app_id}' is not online and not available to handle the message request.  No heartbeat was received within {responseTimeoutSecs} (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, responseTimeoutSecs, linkRequest.RequestHeader.TrackingId, linkRequest.RequestHeader.CorrelationId);
@@ -102,43 +315,19 @@ public class Link {
             throw new InvalidOperationException($"Service '{TARGET_SERVICE_APP_ID}' is not online and not available to handle the message request.");
         }
 
-        Logger.LogDebug("Service '{service_app_id}' is online", TARGET_SERVICE_APP_ID);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Service '{service_app_id}' is online", TARGET_SERVICE_APP_ID);
 
-        void LinkResponseEventHandler(object? _, MessageFormats.HostServices.Link.LinkResponse eventHandlerResponse) {
-            if (eventHandlerResponse.ResponseHeader.TrackingId == linkRequest.RequestHeader.TrackingId) {
-                Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
-
-                if (eventHandlerResponse.ResponseHeader.Status != MessageFormats.Common.StatusCodes.Pending) {
-                    response = eventHandlerResponse;
-                    Client.LinkResponseEvent -= LinkResponseEventHandler; // Remove myself for next time
-                }
-            }
-        }
-
-        Client.LinkResponseEvent += LinkResponseEventHandler;
+        TimeSpan maxWait = TimeSpan.FromSeconds(responseTimeoutSecs ?? Client.DefaultMessageResponseTimeout.TotalSeconds);
+        LinkTransfer transfer = new(linkRequest, outboxFile, maxWait);
+        TrackTransfer(transfer);
 
 #pragma warning disable CS4014
-        Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", linkRequest.GetType().Name, TARGET_SERVICE_APP_ID, linkRequest.RequestHeader.TrackingId, linkRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", linkRequest.GetType().Name, TARGET_SERVICE_APP_ID, linkRequest.RequestHeader.TrackingId, linkRequest.RequestHeader.CorrelationId);
         Client.DirectToApp(appId: TARGET_SERVICE_APP_ID, message: linkRequest);
 #pragma warning restore CS4014
 
-        TimeSpan maxWait = TimeSpan.FromSeconds(responseTimeoutSecs ?? Client.DefaultMessageResponseTimeout.TotalSeconds);
-        DateTime responseDeadline = DateTime.UtcNow.Add(maxWait);
-
-        Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(LinkResponse), maxWait, linkRequest.RequestHeader.TrackingId, linkRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Tracking '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(LinkResponse), maxWait, linkRequest.RequestHeader.TrackingId, linkRequest.RequestHeader.CorrelationId);
 
-        // Start loop until we hear a response
-        while (response is null && DateTime.UtcNow <= responseDeadline) {
-            await Task.Delay(((int) Client.DefaultPollingTime.TotalMilliseconds));
-        }
-
-        if (response == null) {
-            Logger.LogError("Timed out waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(LinkResponse), maxWait, linkRequest.RequestHeader.TrackingId, linkRequest.RequestHeader.CorrelationId);
-            throw new TimeoutException($"Timed out waiting for a response from {TARGET_SERVICE_APP_ID}");
-        }
-
-        Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(LinkResponse), response.ResponseHeader.Status, linkRequest.RequestHeader.TrackingId, linkRequest.RequestHeader.CorrelationId, response.ResponseHeader.Status);
-
-        return response;
+        return transfer;
     });
 }
@@ -15,29 +15,32 @@ public class Logging {
         }
     }
 
-    public static Task<MessageFormats.Common.LogMessageResponse> SendLogMessage(string logMessage, MessageFormats.Common.LogMessage.Types.LOG_LEVEL logLevel = MessageFormats.Common.LogMessage.Types.LOG_LEVEL.Info, int? responseTimeoutSecs = null, bool? waitForResponse = false) {
-        MessageFormats.Common.LogMessage logMessageRequest = new() {
-            RequestHeader = new() {
-                TrackingId = Guid.NewGuid().ToString(),
-            },
-            Message = logMessage,
-            LogLevel = logLevel
-        };
-
-
-        return SendLogMessage(logMessageRequest, responseTimeoutSecs, waitForResponse);
+    public static async Task<MessageFormats.Common.LogMessageResponse> SendLogMessage(string logMessage, MessageFormats.Common.LogMessage.Types.LOG_LEVEL logLevel = MessageFormats.Common.LogMessage.Types.LOG_LEVEL.Info, int? responseTimeoutSecs = null, bool? waitForResponse = false) {
+        // The request never leaves this method, so it's rented from a pool instead of allocated per call
+        MessageFormats.Common.LogMessage logMessageRequest = MessagePool<MessageFormats.Common.LogMessage>.Rent();
+        logMessageRequest.RequestHeader ??= new();
+        logMessageRequest.RequestHeader.TrackingId = Utils.NewTrackingId();
+        logMessageRequest.Message = logMessage;
+        logMessageRequest.LogLevel = logLevel;
+
+        try {
+            return await SendLogMessage(logMessageRequest, responseTimeoutSecs, waitForResponse);
+        } finally {
+            // The inner send has removed its response handler by the time it completes, so nothing can read the request after this
+            MessagePool<MessageFormats.Common.LogMessage>.Return(logMessageRequest);
+        }
     }
 
     public static Task<MessageFormats.Common.LogMessageResponse> SendLogMessage(MessageFormats.Common.LogMessage logMessage, int? responseTimeoutSecs = null, bool? waitForResponse = false) => Task.Run(() => {
         bool targetServiceOnline = false;
 
         if (logMessage.RequestHeader is null) logMessage.RequestHeader = new();
-        if (string.IsNullOrWhiteSpace(logMessage.RequestHeader.TrackingId)) logMessage.RequestHeader.TrackingId = Guid.NewGuid().ToString();
+        if (string.IsNullOrWhiteSpace(logMessage.RequestHeader.TrackingId)) logMessage.RequestHeader.TrackingId = Utils.NewTrackingId();
         if (string.IsNullOrWhiteSpace(logMessage.RequestHeader.CorrelationId)) logMessage.RequestHeader.CorrelationId = logMessage.RequestHeader.TrackingId;
 
         MessageFormats.Common.LogMessageResponse response = SpaceFx.Core.Utils.ResponseFromRequest(logMessage, new MessageFormats.Common.LogMessageResponse());
 
-        Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId);
 
         // Wait for the service to come online
         targetServiceOnline = Utils.WaitForService(appId: TARGET_SERVICE_APP_ID, responseTimeoutSecs: responseTimeoutSecs).Result;
@@ -49,45 +52,51 @@ public class Logging {
             throw new InvalidOperationException($"Service '{TARGET_SERVICE_APP_ID}' is not online and not available to handle the message request.");
         }
 
-        Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId);
 
-        Logger.LogDebug("WaitForResponse = '{wait_for_response}' (trackingId: '{trackingId}' / correlationId: '{correlationId}')", waitForResponse, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId);
-        // Only wire up a callback if we're waiting for a response
-        if (waitForResponse == true) {
-            void LogMessageResponseEventHandler(object? _, MessageFormats.Common.LogMessageResponse eventHandlerResponse) {
-                if (eventHandlerResponse.ResponseHeader.TrackingId == logMessage.RequestHeader.TrackingId) {
-                    Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
-                    response = eventHandlerResponse;
-                    Client.LogMessageResponseEvent -= LogMessageResponseEventHandler; // Remove the callback so it's not called for future iterations
-                }
-            }
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("WaitForResponse = '{wait_for_response}' (trackingId: '{trackingId}' / correlationId: '{correlationId}')", waitForResponse, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId);
+        // Matched against a copy of the tracking id so the handler never reads the request, which may be pooled and reused once this returns
+        string trackingId = logMessage.RequestHeader.TrackingId;
 
-            Client.LogMessageResponseEvent += LogMessageResponseEventHandler;
+        void LogMessageResponseEventHandler(object? _, MessageFormats.Common.LogMessageResponse eventHandlerResponse) {
+            if (eventHandlerResponse.ResponseHeader.TrackingId == trackingId) {
+                if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
+                response = eventHandlerResponse;
+                Client.LogMessageResponseEvent -= LogMessageResponseEventHandler; // Remove the callback so it's not called for future iterations
+            }
         }
 
-        Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", logMessage.GetType().Name, TARGET_SERVICE_APP_ID, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId);
+        // Only wire up a callback if we're waiting for a response
+        if (waitForResponse == true) Client.LogMessageResponseEvent += LogMessageResponseEventHandler;
 
-        Client.DirectToApp(appId: TARGET_SERVICE_APP_ID, message: logMessage).Wait();
+        try {
+            if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", logMessage.GetType().Name, TARGET_SERVICE_APP_ID, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId);
 
-        // Only wait for a response if we're expecting one
-        if (waitForResponse == true) {
-            TimeSpan maxWait = TimeSpan.FromSeconds(responseTimeoutSecs ?? Client.DefaultMessageResponseTimeout.TotalSeconds);
-            DateTime responseDeadline = DateTime.UtcNow.Add(maxWait);
+            Client.DirectToApp(appId: TARGET_SERVICE_APP_ID, message: logMessage).Wait();
 
-            Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(LogMessageResponse), maxWait, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId);
+            // Only wait for a response if we're expecting one
+            if (waitForResponse == true) {
+                TimeSpan maxWait = TimeSpan.FromSeconds(responseTimeoutSecs ?? Client.DefaultMessageResponseTimeout.TotalSeconds);
+                DateTime responseDeadline = DateTime.UtcNow.Add(maxWait);
 
-            // Start loop until we hear a response
-            while (response.ResponseHeader.Status == MessageFormats.Common.StatusCodes.Unknown && DateTime.UtcNow <= responseDeadline) {
-                Task.Delay(((int) Client.DefaultPollingTime.TotalMilliseconds)).Wait();
-            }
+                if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(LogMessageResponse), maxWait, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId);
 
-            if (response == null) {
-                Logger.LogError("Timed out waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(LogMessageResponse), maxWait, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId);
-                throw new TimeoutException($"Timed out waiting for a response from {TARGET_SERVICE_APP_ID}");
+                // Start loop until we hear a response
+                while (response.ResponseHeader.Status == MessageFormats.Common.StatusCodes.Unknown && DateTime.UtcNow <= responseDeadline) {
+                    Task.Delay(((int) Client.DefaultPollingTime.TotalMilliseconds)).Wait();
+                }
+
+                if (response == null) {
+                    Logger.LogError("Timed out waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(LogMessageResponse), maxWait, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId);
+                    throw new TimeoutException($"Timed out waiting for a response from {TARGET_SERVICE_APP_ID}");
+                }
             }
+        } finally {
+            // Already removed if a response was heard, but not on a timeout or a failed send
+            if (waitForResponse == true) Client.LogMessageResponseEvent -= LogMessageResponseEventHandler;
         }
 
-        Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(LogMessageResponse), response.ResponseHeader.Status, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId, response.ResponseHeader.Status);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(LogMessageResponse), response.ResponseHeader.Status, logMessage.RequestHeader.TrackingId, logMessage.RequestHeader.CorrelationId, response.ResponseHeader.Status);
 
         return response;
     });
@@ -96,12 +105,12 @@ public class Logging {
         bool targetServiceOnline = false;
 
         if (telemetryMessage.RequestHeader is null) telemetryMessage.RequestHeader = new();
-        if (string.IsNullOrWhiteSpace(telemetryMessage.RequestHeader.TrackingId)) telemetryMessage.RequestHeader.TrackingId = Guid.NewGuid().ToString();
+        if (string.IsNullOrWhiteSpace(telemetryMessage.RequestHeader.TrackingId)) telemetryMessage.RequestHeader.TrackingId = Utils.NewTrackingId();
         if (string.IsNullOrWhiteSpace(telemetryMessage.RequestHeader.CorrelationId)) telemetryMessage.RequestHeader.CorrelationId = telemetryMessage.RequestHeader.TrackingId;
 
         MessageFormats.Common.TelemetryMetricResponse response = SpaceFx.Core.Utils.ResponseFromRequest(telemetryMessage, new MessageFormats.Common.TelemetryMetricResponse());
 
-        Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
 
         // Wait for the service to come online
         targetServiceOnline = Utils.WaitForService(appId: TARGET_SERVICE_APP_ID, responseTimeoutSecs: responseTimeoutSecs).Result;
@@ -113,73 +122,83 @@ public class Logging {
             throw new InvalidOperationException($"Service '{TARGET_SERVICE_APP_ID}' is not online and not available to handle the message request.");
         }
 
-        Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
 
-        Logger.LogDebug("WaitForResponse = '{wait_for_response}' (trackingId: '{trackingId}' / correlationId: '{correlationId}')", waitForResponse, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("WaitForResponse = '{wait_for_response}' (trackingId: '{trackingId}' / correlationId: '{correlationId}')", waitForResponse, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
 
 
-        // Only wire up a callback if we're waiting for a response
-        if (waitForResponse == true) {
-            void TelemetryResponseEventHandler(object? _, MessageFormats.Common.TelemetryMetricResponse eventHandlerResponse) {
-                if (eventHandlerResponse.ResponseHeader.TrackingId == telemetryMessage.RequestHeader.TrackingId) {
-                    Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
+        // Matched against a copy of the tracking id so the handler never reads the request, which may be pooled and reused once this returns
+        string trackingId = telemetryMessage.RequestHeader.TrackingId;
 
-                    response = eventHandlerResponse;
-                    Client.TelemetryMetricResponseEvent -= TelemetryResponseEventHandler; // Remove the callback so it's not called for future iterations
-                }
-            }
+        void TelemetryResponseEventHandler(object? _, MessageFormats.Common.TelemetryMetricResponse eventHandlerResponse) {
+            if (eventHandlerResponse.ResponseHeader.TrackingId == trackingId) {
+                if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
 
-            Client.TelemetryMetricResponseEvent += TelemetryResponseEventHandler;
+                response = eventHandlerResponse;
+                Client.TelemetryMetricResponseEvent -= TelemetryResponseEventHandler; // Remove the callback so it's not called for future iterations
+            }
         }
 
-        Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", telemetryMessage.GetType().Name, TARGET_SERVICE_APP_ID, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
+        // Only wire up a callback if we're waiting for a response
+        if (waitForResponse == true) Client.TelemetryMetricResponseEvent += TelemetryResponseEventHandler;
 
-        await Client.DirectToApp(appId: TARGET_SERVICE_APP_ID, message: telemetryMessage);
+        try {
+            if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", telemetryMessage.GetType().Name, TARGET_SERVICE_APP_ID, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
 
-        // Only wait for a response if we're expecting one
-        if (waitForResponse == true) {
+            await Client.DirectToApp(appId: TARGET_SERVICE_APP_ID, message: telemetryMessage);
 
-            TimeSpan maxWait = TimeSpan.FromSeconds(responseTimeoutSecs ?? Client.DefaultMessageResponseTimeout.TotalSeconds);
-            DateTime responseDeadline = DateTime.UtcNow.Add(maxWait);
+            // Only wait for a response if we're expecting one
+            if (waitForResponse == true) {
 
-            Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(TelemetryMetricResponse), maxWait, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
+                TimeSpan maxWait = TimeSpan.FromSeconds(responseTimeoutSecs ?? Client.DefaultMessageResponseTimeout.TotalSeconds);
+                DateTime responseDeadline = DateTime.UtcNow.Add(maxWait);
 
-            // Loop until we've received a response or we've timed out
-            for (; (response == null || response.ResponseHeader.Status == MessageFormats.Common.StatusCodes.Unknown) && DateTime.UtcNow <= responseDeadline; await Task.Delay((int) Client.DefaultPollingTime.TotalMilliseconds)) ;
+                if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(TelemetryMetricResponse), maxWait, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
 
-            if (response == null) {
-                Logger.LogError("Timed out waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(TelemetryMetricResponse), maxWait, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
-                throw new TimeoutException($"Timed out waiting for a response from {TARGET_SERVICE_APP_ID}");
+                // Loop until we've received a response or we've timed out
+                for (; (response == null || response.ResponseHeader.Status == MessageFormats.Common.StatusCodes.Unknown) && DateTime.UtcNow <= responseDeadline; await Task.Delay((int) Client.DefaultPollingTime.TotalMilliseconds)) ;
+
+                if (response == null) {
+                    Logger.LogError("Timed out waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(TelemetryMetricResponse), maxWait, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
+                    throw new TimeoutException($"Timed out waiting for a response from {TARGET_SERVICE_APP_ID}");
+                }
             }
+        } finally {
+            // Already removed if a response was heard, but not on a timeout or a failed send
+            if (waitForResponse == true) Client.TelemetryMetricResponseEvent -= TelemetryResponseEventHandler;
         }
 
-        Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(TelemetryMetricResponse), response.ResponseHeader.Status, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId, response.ResponseHeader.Status);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(TelemetryMetricResponse), response.ResponseHeader.Status, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId, response.ResponseHeader.Status);
 
         return response;
     });
 
-    public static Task<MessageFormats.Common.TelemetryMetricResponse> SendTelemetry(string metricName, int metricValue, int? responseTimeoutSecs = null, bool? waitForResponse = false) {
-        MessageFormats.Common.TelemetryMetric telemetryMessage = new() {
-            RequestHeader = new() {
-                TrackingId = Guid.NewGuid().ToString(),
-            },
-            MetricName = metricName,
-            MetricValue = metricValue
-        };
-
-        return SendTelemetry(telemetryMessage: telemetryMessage, responseTimeoutSecs: responseTimeoutSecs, waitForResponse: waitForResponse);
+    public static async Task<MessageFormats.Common.TelemetryMetricResponse> SendTelemetry(string metricName, int metricValue, int? responseTimeoutSecs = null, bool? waitForResponse = false) {
+        // The request never leaves this method, so it's rented from a pool instead of allocated per call
+        MessageFormats.Common.TelemetryMetric telemetryMessage = MessagePool<MessageFormats.Common.TelemetryMetric>.Rent();
+        telemetryMessage.RequestHeader ??= new();
+        telemetryMessage.RequestHeader.TrackingId = Utils.NewTrackingId();
+        telemetryMessage.MetricName = metricName;
+        telemetryMessage.MetricValue = metricValue;
+
+        try {
+            return await SendTelemetry(telemetryMessage: telemetryMessage, responseTimeoutSecs: responseTimeoutSecs, waitForResponse: waitForResponse);
+        } finally {
+            // The inner send has removed its response handler by the time it completes, so nothing can read the request after this
+            MessagePool<MessageFormats.Common.TelemetryMetric>.Return(telemetryMessage);
+        }
     }
 
     public static Task<MessageFormats.Common.TelemetryMultiMetricResponse> SendMultiTelemetry(MessageFormats.Common.TelemetryMultiMetric telemetryMessage, int? responseTimeoutSecs = null, bool? waitForResponse = false) => Task.Run(async () => {
         bool targetServiceOnline = false;
 
         if (telemetryMessage.RequestHeader is null) telemetryMessage.RequestHeader = new();
-        if (string.IsNullOrWhiteSpace(telemetryMessage.RequestHeader.TrackingId)) telemetryMessage.RequestHeader.TrackingId = Guid.NewGuid().ToString();
+        if (string.IsNullOrWhiteSpace(telemetryMessage.RequestHeader.TrackingId)) telemetryMessage.RequestHeader.TrackingId = Utils.NewTrackingId();
         if (string.IsNullOrWhiteSpace(telemetryMessage.RequestHeader.CorrelationId)) telemetryMessage.RequestHeader.CorrelationId = telemetryMessage.RequestHeader.TrackingId;
 
         MessageFormats.Common.TelemetryMultiMetricResponse response = SpaceFx.Core.Utils.ResponseFromRequest(telemetryMessage, new MessageFormats.Common.TelemetryMultiMetricResponse());
 
-        Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
 
         // Wait for the service to come online
         targetServiceOnline = Utils.WaitForService(appId: TARGET_SERVICE_APP_ID, responseTimeoutSecs: responseTimeoutSecs).Result;
@@ -191,16 +210,16 @@ public class Logging {
             throw new InvalidOperationException($"Service '{TARGET_SERVICE_APP_ID}' is not online and not available to handle the message request.");
         }
 
-        Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
 
-        Logger.LogDebug("WaitForResponse = '{wait_for_response}' (trackingId: '{trackingId}' / correlationId: '{correlationId}')", waitForResponse, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("WaitForResponse = '{wait_for_response}' (trackingId: '{trackingId}' / correlationId: '{correlationId}')", waitForResponse, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
 
 
         // Only wire up a callback if we're waiting for a response
         if (waitForResponse == true) {
             void TelemetryResponseEventHandler(object? _, MessageFormats.Common.TelemetryMultiMetricResponse eventHandlerResponse) {
                 if (eventHandlerResponse.ResponseHeader.TrackingId == telemetryMessage.RequestHeader.TrackingId) {
-                    Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
+                    if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
 
                     response = eventHandlerResponse;
                     Client.TelemetryMultiMetricResponseEvent -= TelemetryResponseEventHandler; // Remove the callback so it's not called for future iterations
@@ -210,7 +229,7 @@ public class Logging {
             Client.TelemetryMultiMetricResponseEvent += TelemetryResponseEventHandler;
         }
 
-        Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", telemetryMessage.GetType().Name, TARGET_SERVICE_APP_ID, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", telemetryMessage.GetType().Name, TARGET_SERVICE_APP_ID, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
 
         await Client.DirectToApp(appId: TARGET_SERVICE_APP_ID, message: telemetryMessage);
 
@@ -220,7 +239,7 @@ public class Logging {
             TimeSpan maxWait = TimeSpan.FromSeconds(responseTimeoutSecs ?? Client.DefaultMessageResponseTimeout.TotalSeconds);
             DateTime responseDeadline = DateTime.UtcNow.Add(maxWait);
 
-            Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(TelemetryMultiMetricResponse), maxWait, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
+            if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(TelemetryMultiMetricResponse), maxWait, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId);
 
             // Loop until we've received a response or we've timed out
             for (; (response == null || response.ResponseHeader.Status == MessageFormats.Common.StatusCodes.Unknown) && DateTime.UtcNow <= responseDeadline; await Task.Delay((int) Client.DefaultPollingTime.TotalMilliseconds)) ;
@@ -231,10 +250,104 @@ public class Logging {
             }
         }
 
-        Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(TelemetryMultiMetricResponse), response.ResponseHeader.Status, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId, response.ResponseHeader.Status);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(TelemetryMultiMetricResponse), response.ResponseHeader.Status, telemetryMessage.RequestHeader.TrackingId, telemetryMessage.RequestHeader.CorrelationId, response.ResponseHeader.Status);
 
         return response;
     });
 
+    /// <summary>Maximum number of messages a batch send has in flight to hostsvc-logging at once.</summary>
+    public static int MaxConcurrentBatchSends { get; set; } = 32;
+
+    public class BatchSendResult {
+        public int Requested { get; init; }
+        public int Sent { get; internal set; }
+        public int Failed { get; internal set; }
+        public List<string> Errors { get; } = new();
+        public TimeSpan Duration { get; internal set; }
+    }
+
+    /// <summary>
+    /// Sends many log messages to hostsvc-logging.  The service's heartbeat is checked once for the whole batch and the messages
+    /// are sent with up to MaxConcurrentBatchSends requests in flight.  Responses are not waited for.
+    /// </summary>
+    public static Task<BatchSendResult> SendLogMessages(IEnumerable<MessageFormats.Common.LogMessage> logMessages, int? responseTimeoutSecs = null) => SendBatch(logMessages.Cast<IMessage>().ToList(), responseTimeoutSecs);
+
+    /// <summary>
+    /// Sends a batch of length-delimited LogMessages (as written by Python's spacefx.logging.send_log_messages) to hostsvc-logging.
+    /// Lets Python cross into .NET once per batch instead of once per message.
+    /// </summary>
+    public static Task<BatchSendResult> SendLogMessages(byte[] delimitedLogMessages, int? responseTimeoutSecs = null) => SendBatch(ParseDelimited(delimitedLogMessages, MessageFormats.Common.LogMessage.Parser), responseTimeoutSecs);
+
+    /// <summary>
+    /// Sends many telemetry metrics to hostsvc-logging.  See SendLogMessages.
+    /// </summary>
+    public static Task<BatchSendResult> SendTelemetryBatch(IEnumerable<MessageFormats.Common.TelemetryMetric> telemetryMessages, int? responseTimeoutSecs = null) => SendBatch(telemetryMessages.Cast<IMessage>().ToList(), responseTimeoutSecs);
+
+    /// <summary>
+    /// Sends a batch of length-delimited TelemetryMetrics (as written by Python's spacefx.logging.send_telemetry_batch) to hostsvc-logging.
+    /// </summary>
+    public static Task<BatchSendResult> SendTelemetryBatch(byte[] delimitedTelemetryMessages, int? responseTimeoutSecs = null) => SendBatch(ParseDelimited(delimitedTelemetryMessages, MessageFormats.Common.TelemetryMetric.Parser), responseTimeoutSecs);
+
+    private static List<IMessage> ParseDelimited<V>(byte[] delimitedMessages, MessageParser<V> parser) where V : IMessage<V> {
+        List<IMessage> messages = new();
+        using (MemoryStream stream = new(delimitedMessages, writable: false)) {
+            while (stream.Position < stream.Length) {
+                messages.Add(parser.ParseDelimitedFrom(stream));
+            }
+        }
+        return messages;
+    }
+
+    private static Task<BatchSendResult> SendBatch(List<IMessage> messages, int? responseTimeoutSecs) => Task.Run(async () => {
+        BatchSendResult result = new() { Requested = messages.Count };
+        if (messages.Count == 0) return result;
 
+        DateTime started = DateTime.UtcNow;
+
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for service '{service_app_id}' to come online to send a batch of {count} messages", TARGET_SERVICE_APP_ID, messages.Count);
+
+        // Wait for the service to come online once for the whole batch
+        bool targetServiceOnline = await Utils.WaitForService(appId: TARGET_SERVICE_APP_ID, responseTimeoutSecs: responseTimeoutSecs);
+
+        if (!targetServiceOnline) {
+            Logger.LogError("Service '{service_app_id}' is not online and not available to handle the message request.  No heartbeat was received within {responseTimeoutSecs}", TARGET_SERVICE_APP_ID, responseTimeoutSecs);
+            throw new InvalidOperationException($"Service '{TARGET_SERVICE_APP_ID}' is not online and not available to handle the message request.");
+        }
+
+        using SemaphoreSlim sendSlots = new(Math.Max(1, MaxConcurrentBatchSends));
+        object resultLock = new();
+
+        async Task SendOne(IMessage message) {
+            // The per-message request header is filled in here rather than by the caller, so Python doesn't generate a UUID per record
+            MessageFormats.Common.RequestHeader requestHeader = message switch {
+                MessageFormats.Common.LogMessage logMessage => logMessage.RequestHeader ??= new(),
+                MessageFormats.Common.TelemetryMetric telemetryMetric => telemetryMetric.RequestHeader ??= new(),
+                _ => new()
+            };
+            if (string.IsNullOrWhiteSpace(requestHeader.TrackingId)) requestHeader.TrackingId = Utils.NewTrackingId();
+            if (string.IsNullOrWhiteSpace(requestHeader.CorrelationId)) requestHeader.CorrelationId = requestHeader.TrackingId;
+
+            await sendSlots.WaitAsync();
+            try {
+                await Client.DirectToApp(appId: TARGET_SERVICE_APP_ID, message: message);
+                lock (resultLock) result.Sent++;
+            } catch (Exception ex) {
+                Logger.LogError(ex, "Failed to send '{messageType}' to '{appId}' (trackingId: '{trackingId}')", message.GetType().Name, TARGET_SERVICE_APP_ID, requestHeader.TrackingId);
+                lock (resultLock) {
+                    result.Failed++;
+                    result.Errors.Add($"{requestHeader.TrackingId}: {ex.Message}");
+                }
+            } finally {
+                sendSlots.Release();
+            }
+        }
+
+        await Task.WhenAll(messages.Select(SendOne));
+
+        result.Duration = DateTime.UtcNow - started;
+
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Sent batch of {count} messages to '{appId}' in {duration}.  Sent: {sent}  Failed: {failed}", result.Requested, TARGET_SERVICE_APP_ID, result.Duration, result.Sent, result.Failed);
+
+        return result;
+    });
 }
@@ -14,23 +14,28 @@ public class Position {
             return _logger;
         }
     }
-    public static Task<MessageFormats.HostServices.Position.PositionResponse> LastKnownPosition(int? responseTimeoutSecs = null) {
-        MessageFormats.HostServices.Position.PositionRequest positionRequest = new() {
-            RequestHeader = new() {
-                TrackingId = Guid.NewGuid().ToString()
-            }
-        };
-        return LastKnownPosition(positionRequest, responseTimeoutSecs);
+    public static async Task<MessageFormats.HostServices.Position.PositionResponse> LastKnownPosition(int? responseTimeoutSecs = null) {
+        // The request never leaves this method, so it's rented from a pool instead of allocated per call
+        MessageFormats.HostServices.Position.PositionRequest positionRequest = MessagePool<MessageFormats.HostServices.Position.PositionRequest>.Rent();
+        positionRequest.RequestHeader ??= new();
+        positionRequest.RequestHeader.TrackingId = Utils.NewTrackingId();
+
+        try {
+            return await LastKnownPosition(positionRequest, responseTimeoutSecs);
+        } finally {
+            // LastKnownPosition has removed its response handler by the time it completes, so nothing can read the request after this
+            MessagePool<MessageFormats.HostServices.Position.PositionRequest>.Return(positionRequest);
+        }
     }
 
     public static Task<MessageFormats.HostServices.Position.PositionResponse> LastKnownPosition(MessageFormats.HostServices.Position.PositionRequest positionRequest, int? responseTimeoutSecs = null) => Task.Run(async () => {
         MessageFormats.HostServices.Position.PositionResponse? response = null;
         bool targetServiceOnline = false;
 
-        if (string.IsNullOrWhiteSpace(positionRequest.RequestHeader.TrackingId)) positionRequest.RequestHeader.TrackingId = Guid.NewGuid().ToString();
+        if (string.IsNullOrWhiteSpace(positionRequest.RequestHeader.TrackingId)) positionRequest.RequestHeader.TrackingId = Utils.NewTrackingId();
         if (string.IsNullOrWhiteSpace(positionRequest.RequestHeader.CorrelationId)) positionRequest.RequestHeader.CorrelationId = positionRequest.RequestHeader.TrackingId;
 
-        Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, positionRequest.RequestHeader.TrackingId, positionRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, positionRequest.RequestHeader.TrackingId, positionRequest.RequestHeader.CorrelationId);
 
         // Wait for the service to come online
         targetServiceOnline = Utils.WaitForService(appId: TARGET_SERVICE_APP_ID, responseTimeoutSecs: responseTimeoutSecs).Result;
@@ -42,13 +47,16 @@ public class Position {
             throw new InvalidOperationException($"Service '{TARGET_SERVICE_APP_ID}' is not online and not available to handle the message request.");
         }
 
-        Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, positionRequest.RequestHeader.TrackingId, positionRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, positionRequest.RequestHeader.TrackingId, positionRequest.RequestHeader.CorrelationId);
 
 
+        // Matched against a copy of the tracking id so the handler never reads the request, which may be pooled and reused once this returns
+        string trackingId = positionRequest.RequestHeader.TrackingId;
+
         // Create an in-line callback function to get the response for this message
         void PositionResponseEventHandler(object? _, MessageFormats.HostServices.Position.PositionResponse eventHandlerResponse) {
-            if (eventHandlerResponse.ResponseHeader.TrackingId == positionRequest.RequestHeader.TrackingId) {
-                Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
+            if (eventHandlerResponse.ResponseHeader.TrackingId == trackingId) {
+                if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
 
                 response = eventHandlerResponse;
                 Client.PositionResponseEvent -= PositionResponseEventHandler; // Remove myself for next time
@@ -58,20 +66,23 @@ public class Position {
         // Register the temporary in-line function
         Client.PositionResponseEvent += PositionResponseEventHandler;
 
-        Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", positionRequest.GetType().Name, TARGET_SERVICE_APP_ID, positionRequest.RequestHeader.TrackingId, positionRequest.RequestHeader.CorrelationId);
-
-
-        await Client.DirectToApp(TARGET_SERVICE_APP_ID, positionRequest);
+        TimeSpan maxWait = TimeSpan.FromSeconds(responseTimeoutSecs ?? Client.DefaultMessageResponseTimeout.TotalSeconds);
+        try {
+            if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", positionRequest.GetType().Name, TARGET_SERVICE_APP_ID, positionRequest.RequestHeader.TrackingId, positionRequest.RequestHeader.CorrelationId);
 
+            await Client.DirectToApp(TARGET_SERVICE_APP_ID, positionRequest);
 
-        TimeSpan maxWait = TimeSpan.FromSeconds(responseTimeoutSecs ?? Client.DefaultMessageResponseTimeout.TotalSeconds);
-        DateTime responseDeadline = DateTime.UtcNow.Add(maxWait);
+            DateTime responseDeadline = DateTime.UtcNow.Add(maxWait);
 
-        Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(PositionResponse), maxWait, positionRequest.RequestHeader.TrackingId, positionRequest.RequestHeader.CorrelationId);
+            if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(PositionResponse), maxWait, positionRequest.RequestHeader.TrackingId, positionRequest.RequestHeader.CorrelationId);
 
-        // Start loop until we hear a response
-        while (response is null && DateTime.UtcNow <= responseDeadline) {
-            await Task.Delay(((int) Client.DefaultPollingTime.TotalMilliseconds));
+            // Start loop until we hear a response
+            while (response is null && DateTime.UtcNow <= responseDeadline) {
+                await Task.Delay(((int) Client.DefaultPollingTime.TotalMilliseconds));
+            }
+        } finally {
+            // Already removed if a response was heard, but not on a timeout or a failed send
+            Client.PositionResponseEvent -= PositionResponseEventHandler;
         }
 
         if (response == null) {
@@ -79,7 +90,7 @@ public class Position {
             throw new TimeoutException($"Timed out waiting for a response from {TARGET_SERVICE_APP_ID}");
         }
 
-        Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(PositionResponse), response.ResponseHeader.Status, positionRequest.RequestHeader.TrackingId, positionRequest.RequestHeader.CorrelationId, response.ResponseHeader.Status);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(PositionResponse), response.ResponseHeader.Status, positionRequest.RequestHeader.TrackingId, positionRequest.RequestHeader.CorrelationId, response.ResponseHeader.Status);
 
         return response;
     });
@@ -19,7 +19,7 @@ public class Sensor {
     public static Task<MessageFormats.HostServices.Sensor.SensorsAvailableResponse> GetAvailableSensors(int? responseTimeoutSecs = null) {
         MessageFormats.HostServices.Sensor.SensorsAvailableRequest sensorsAvailableRequest = new() {
             RequestHeader = new() {
-                TrackingId = Guid.NewGuid().ToString()
+                TrackingId = Utils.NewTrackingId()
             }
         };
 
@@ -30,10 +30,10 @@ public class Sensor {
         MessageFormats.HostServices.Sensor.SensorsAvailableResponse? response = null;
         bool targetServiceOnline = false;
 
-        if (string.IsNullOrWhiteSpace(sensorsAvailableRequest.RequestHeader.TrackingId)) sensorsAvailableRequest.RequestHeader.TrackingId = Guid.NewGuid().ToString();
+        if (string.IsNullOrWhiteSpace(sensorsAvailableRequest.RequestHeader.TrackingId)) sensorsAvailableRequest.RequestHeader.TrackingId = Utils.NewTrackingId();
         if (string.IsNullOrWhiteSpace(sensorsAvailableRequest.RequestHeader.CorrelationId)) sensorsAvailableRequest.RequestHeader.CorrelationId = sensorsAvailableRequest.RequestHeader.TrackingId;
 
-        Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, sensorsAvailableRequest.RequestHeader.TrackingId, sensorsAvailableRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, sensorsAvailableRequest.RequestHeader.TrackingId, sensorsAvailableRequest.RequestHeader.CorrelationId);
 
         // Wait for the service to come online
         targetServiceOnline = Utils.WaitForService(appId: TARGET_SERVICE_APP_ID, responseTimeoutSecs: responseTimeoutSecs).Result;
@@ -45,12 +45,12 @@ public class Sensor {
             throw new InvalidOperationException($"Service '{TARGET_SERVICE_APP_ID}' is not online and not available to handle the message request.");
         }
 
-        Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, sensorsAvailableRequest.RequestHeader.TrackingId, sensorsAvailableRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, sensorsAvailableRequest.RequestHeader.TrackingId, sensorsAvailableRequest.RequestHeader.CorrelationId);
 
 
         void SensorsAvailableResponseEventHandler(object? _, MessageFormats.HostServices.Sensor.SensorsAvailableResponse eventHandlerResponse) {
             if (eventHandlerResponse.ResponseHeader.TrackingId == sensorsAvailableRequest.RequestHeader.TrackingId) {
-                Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
+                if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
                 response = eventHandlerResponse;
                 Client.SensorsAvailableResponseEvent -= SensorsAvailableResponseEventHandler;
             }
@@ -59,14 +59,14 @@ public class Sensor {
         Client.SensorsAvailableResponseEvent += SensorsAvailableResponseEventHandler;
 
 #pragma warning disable CS4014
-        Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", sensorsAvailableRequest.GetType().Name, TARGET_SERVICE_APP_ID, sensorsAvailableRequest.RequestHeader.TrackingId, sensorsAvailableRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", sensorsAvailableRequest.GetType().Name, TARGET_SERVICE_APP_ID, sensorsAvailableRequest.RequestHeader.TrackingId, sensorsAvailableRequest.RequestHeader.CorrelationId);
         Client.DirectToApp(appId: TARGET_SERVICE_APP_ID, message: sensorsAvailableRequest);
 #pragma warning restore CS4014
 
         TimeSpan maxWait = TimeSpan.FromSeconds(responseTimeoutSecs ?? Client.DefaultMessageResponseTimeout.TotalSeconds);
         DateTime responseDeadline = DateTime.UtcNow.Add(maxWait);
 
-        Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(SensorsAvailableResponse), maxWait, sensorsAvailableRequest.RequestHeader.TrackingId, sensorsAvailableRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(SensorsAvailableResponse), maxWait, sensorsAvailableRequest.RequestHeader.TrackingId, sensorsAvailableRequest.RequestHeader.CorrelationId);
 
         // Start loop until we hear a response
         while (response is null && DateTime.UtcNow <= responseDeadline) {
@@ -79,7 +79,7 @@ public class Sensor {
             throw new TimeoutException($"Timed out waiting for a response from {TARGET_SERVICE_APP_ID}");
         }
 
-        Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(SensorsAvailableResponse), response.ResponseHeader.Status, sensorsAvailableRequest.RequestHeader.TrackingId, sensorsAvailableRequest.RequestHeader.CorrelationId, response.ResponseHeader.Status);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(SensorsAvailableResponse), response.ResponseHeader.Status, sensorsAvailableRequest.RequestHeader.TrackingId, sensorsAvailableRequest.RequestHeader.CorrelationId, response.ResponseHeader.Status);
 
         return response;
     });
@@ -87,7 +87,7 @@ public class Sensor {
     public static Task<MessageFormats.HostServices.Sensor.TaskingPreCheckResponse> SensorTaskingPreCheck(string sensorId, Any? requestData = null, Dictionary<string, string>? metaData = null, int? responseTimeoutSecs = null) {
         MessageFormats.HostServices.Sensor.TaskingPreCheckRequest sensorTaskingPreCheckRequest = new() {
             RequestHeader = new() {
-                TrackingId = Guid.NewGuid().ToString()
+                TrackingId = Utils.NewTrackingId()
             },
             SensorID = sensorId
         };
@@ -106,10 +106,10 @@ public class Sensor {
         MessageFormats.HostServices.Sensor.TaskingPreCheckResponse? response = null;
         bool targetServiceOnline = false;
 
-        if (string.IsNullOrWhiteSpace(taskingPreCheckRequest.RequestHeader.TrackingId)) taskingPreCheckRequest.RequestHeader.TrackingId = Guid.NewGuid().ToString();
+        if (string.IsNullOrWhiteSpace(taskingPreCheckRequest.RequestHeader.TrackingId)) taskingPreCheckRequest.RequestHeader.TrackingId = Utils.NewTrackingId();
         if (string.IsNullOrWhiteSpace(taskingPreCheckRequest.RequestHeader.CorrelationId)) taskingPreCheckRequest.RequestHeader.CorrelationId = taskingPreCheckRequest.RequestHeader.TrackingId;
 
-        Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, taskingPreCheckRequest.RequestHeader.TrackingId, taskingPreCheckRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, taskingPreCheckRequest.RequestHeader.TrackingId, taskingPreCheckRequest.RequestHeader.CorrelationId);
 
         // Wait for the service to come online
         targetServiceOnline = Utils.WaitForService(appId: TARGET_SERVICE_APP_ID, responseTimeoutSecs: responseTimeoutSecs).Result;
@@ -121,12 +121,12 @@ public class Sensor {
             throw new InvalidOperationException($"Service '{TARGET_SERVICE_APP_ID}' is not online and not available to handle the message request.");
         }
 
-        Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, taskingPreCheckRequest.RequestHeader.TrackingId, taskingPreCheckRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, taskingPreCheckRequest.RequestHeader.TrackingId, taskingPreCheckRequest.RequestHeader.CorrelationId);
 
 
         void TaskingPreCheckResponseEventHandler(object? _, MessageFormats.HostServices.Sensor.TaskingPreCheckResponse eventHandlerResponse) {
             if (eventHandlerResponse.ResponseHeader.TrackingId == taskingPreCheckRequest.RequestHeader.TrackingId) {
-                Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
+                if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
 
                 response = eventHandlerResponse;
                 Client.SensorsTaskingPreCheckResponseEvent -= TaskingPreCheckResponseEventHandler;
@@ -136,14 +136,14 @@ public class Sensor {
         Client.SensorsTaskingPreCheckResponseEvent += TaskingPreCheckResponseEventHandler;
 
 #pragma warning disable CS4014
-        Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", taskingPreCheckRequest.GetType().Name, TARGET_SERVICE_APP_ID, taskingPreCheckRequest.RequestHeader.TrackingId, taskingPreCheckRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", taskingPreCheckRequest.GetType().Name, TARGET_SERVICE_APP_ID, taskingPreCheckRequest.RequestHeader.TrackingId, taskingPreCheckRequest.RequestHeader.CorrelationId);
         Client.DirectToApp(appId: TARGET_SERVICE_APP_ID, message: taskingPreCheckRequest);
 #pragma warning restore CS4014
 
         TimeSpan maxWait = TimeSpan.FromSeconds(responseTimeoutSecs ?? Client.DefaultMessageResponseTimeout.TotalSeconds);
         DateTime responseDeadline = DateTime.UtcNow.Add(maxWait);
 
-        Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(TaskingPreCheckResponse), maxWait, taskingPreCheckRequest.RequestHeader.TrackingId, taskingPreCheckRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(TaskingPreCheckResponse), maxWait, taskingPreCheckRequest.RequestHeader.TrackingId, taskingPreCheckRequest.RequestHeader.CorrelationId);
 
         // Start loop until we hear a response
         while (response is null && DateTime.UtcNow <= responseDeadline) {
@@ -155,7 +155,7 @@ public class Sensor {
             throw new TimeoutException($"Timed out waiting for a response from {TARGET_SERVICE_APP_ID}");
         }
 
-        Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(TaskingPreCheckResponse), response.ResponseHeader.Status, taskingPreCheckRequest.RequestHeader.TrackingId, taskingPreCheckRequest.RequestHeader.CorrelationId, response.ResponseHeader.Status);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(TaskingPreCheckResponse), response.ResponseHeader.Status, taskingPreCheckRequest.RequestHeader.TrackingId, taskingPreCheckRequest.RequestHeader.CorrelationId, response.ResponseHeader.Status);
 
 
         return response;
@@ -164,7 +164,7 @@ public class Sensor {
     public static Task<MessageFormats.HostServices.Sensor.TaskingResponse> SensorTasking(string sensorId, Any? requestData = null, Dictionary<string, string>? metaData = null, int? responseTimeoutSecs = null) {
         MessageFormats.HostServices.Sensor.TaskingRequest sensorTaskingRequest = new() {
             RequestHeader = new() {
-                TrackingId = Guid.NewGuid().ToString(),
+                TrackingId = Utils.NewTrackingId(),
             },
             SensorID = sensorId
         };
@@ -181,10 +181,10 @@ public class Sensor {
         MessageFormats.HostServices.Sensor.TaskingResponse? response = null;
         bool targetServiceOnline = false;
 
-        if (string.IsNullOrWhiteSpace(taskingRequest.RequestHeader.TrackingId)) taskingRequest.RequestHeader.TrackingId = Guid.NewGuid().ToString();
+        if (string.IsNullOrWhiteSpace(taskingRequest.RequestHeader.TrackingId)) taskingRequest.RequestHeader.TrackingId = Utils.NewTrackingId();
         if (string.IsNullOrWhiteSpace(taskingRequest.RequestHeader.CorrelationId)) taskingRequest.RequestHeader.CorrelationId = taskingRequest.RequestHeader.TrackingId;
 
-        Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, taskingRequest.RequestHeader.TrackingId, taskingRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for service '{service_app_id}' to come online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, taskingRequest.RequestHeader.TrackingId, taskingRequest.RequestHeader.CorrelationId);
 
         // Wait for the service to come online
         targetServiceOnline = Utils.WaitForService(appId: TARGET_SERVICE_APP_ID, responseTimeoutSecs: responseTimeoutSecs).Result;
@@ -196,12 +196,12 @@ public class Sensor {
             throw new InvalidOperationException($"Service '{TARGET_SERVICE_APP_ID}' is not online and not available to handle the message request.");
         }
 
-        Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, taskingRequest.RequestHeader.TrackingId, taskingRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Service '{service_app_id}' is online (trackingId: '{trackingId}' / correlationId: '{correlationId}')", TARGET_SERVICE_APP_ID, taskingRequest.RequestHeader.TrackingId, taskingRequest.RequestHeader.CorrelationId);
 
 
         void TaskingResponseEventHandler(object? _, MessageFormats.HostServices.Sensor.TaskingResponse eventHandlerResponse) {
             if (eventHandlerResponse.ResponseHeader.TrackingId == taskingRequest.RequestHeader.TrackingId) {
-                Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
+                if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Message response received for '{messageType}'.  Status: '{status}' (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", eventHandlerResponse.GetType().Name, eventHandlerResponse.ResponseHeader.Status, eventHandlerResponse.ResponseHeader.TrackingId, eventHandlerResponse.ResponseHeader.CorrelationId, eventHandlerResponse.ResponseHeader.Status);
 
                 response = eventHandlerResponse;
                 Client.SensorsTaskingResponseEvent -= TaskingResponseEventHandler;
@@ -210,7 +210,7 @@ public class Sensor {
 
         Client.SensorsTaskingResponseEvent += TaskingResponseEventHandler;
 
-        Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", taskingRequest.GetType().Name, TARGET_SERVICE_APP_ID, taskingRequest.RequestHeader.TrackingId, taskingRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Sending '{messageType}' to '{appId}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", taskingRequest.GetType().Name, TARGET_SERVICE_APP_ID, taskingRequest.RequestHeader.TrackingId, taskingRequest.RequestHeader.CorrelationId);
 
 #pragma warning disable CS4014
         Client.DirectToApp(appId: TARGET_SERVICE_APP_ID, message: taskingRequest);
@@ -219,7 +219,7 @@ public class Sensor {
         TimeSpan maxWait = TimeSpan.FromSeconds(responseTimeoutSecs ?? Client.DefaultMessageResponseTimeout.TotalSeconds);
         DateTime responseDeadline = DateTime.UtcNow.Add(maxWait);
 
-        Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(TaskingResponse), maxWait, taskingRequest.RequestHeader.TrackingId, taskingRequest.RequestHeader.CorrelationId);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Waiting for '{messageType}'.  Deadline: '{timeout}'.  (trackingId: '{trackingId}' / correlationId: '{correlationId}')", nameof(TaskingResponse), maxWait, taskingRequest.RequestHeader.TrackingId, taskingRequest.RequestHeader.CorrelationId);
 
         // Start loop until we hear a response
         while (response is null && DateTime.UtcNow <= responseDeadline) {
@@ -231,7 +231,7 @@ public class Sensor {
             throw new TimeoutException($"Timed out waiting for a response from {TARGET_SERVICE_APP_ID}");
         }
 
-        Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(TaskingResponse), response.ResponseHeader.Status, taskingRequest.RequestHeader.TrackingId, taskingRequest.RequestHeader.CorrelationId, response.ResponseHeader.Status);
+        if (Logger.IsEnabled(LogLevel.Debug)) Logger.LogDebug("Returning '{messageType}' with status '{status}' to payload app (trackingId: '{trackingId}' / correlationId: '{correlationId}' / status: '{status}')", nameof(TaskingResponse), response.ResponseHeader.Status, taskingRequest.RequestHeader.TrackingId, taskingRequest.RequestHeader.CorrelationId, response.ResponseHeader.Status);
 
 
         return response;
@@ -0,0 +1,44 @@
+using System.Collections.Concurrent;
+using Google.Protobuf.Reflection;
+
+namespace Microsoft.Azure.SpaceFx.SDK;
+
+/// <summary>
+/// Pool of request messages for the convenience overloads that build a request, send it, and never hand it back to the caller.
+/// Returned messages are cleared field by field, so a rented message serializes exactly like a new one.  The RequestHeader is
+/// cleared in place rather than dropped, so it's reused too.
+/// </summary>
+internal static class MessagePool<T> where T : class, IMessage<T>, new() {
+    private const int MAX_POOLED_MESSAGES = 64;
+
+    private static readonly ConcurrentQueue<T> _pool = new();
+    private static int _pooledCount = 0;
+
+    public static T Rent() {
+        if (_pool.TryDequeue(out T? message)) {
+            Interlocked.Decrement(ref _pooledCount);
+            return message;
+        }
+        return new T();
+    }
+
+    public static void Return(T message) {
+        if (Interlocked.Increment(ref _pooledCount) > MAX_POOLED_MESSAGES) {
+            Interlocked.Decrement(ref _pooledCount);
+            return;
+        }
+
+        Clear(message);
+        _pool.Enqueue(message);
+    }
+
+    private static void Clear(IMessage message) {
+        foreach (FieldDescriptor field in message.Descriptor.Fields.InDeclarationOrder()) {
+            if (field.FieldType == FieldType.Message && !field.IsRepeated && !field.IsMap && field.MessageType == MessageFormats.Common.RequestHeader.Descriptor) {
+                if (field.Accessor.GetValue(message) is IMessage requestHeader) Clear(requestHeader);
+                continue;
+            }
+            field.Accessor.Clear(message);
+        }
+    }
+}
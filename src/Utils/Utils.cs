@@ -1,6 +1,35 @@
 namespace Microsoft.Azure.SpaceFx.SDK;
 
 public class Utils {
+    // Random per-process half followed by a counter half, so ids from different apps don't collide and ids from this process sort in the order they were made
+    private static readonly string _trackingIdPrefix = Guid.NewGuid().ToString("N")[..16];
+    private static long _trackingIdCounter = 0;
+
+    /// <summary>
+    /// Returns a new tracking id in the same 36 character format as Guid.NewGuid().ToString(), so anything that parses tracking ids as Guids still can.
+    /// Unique within the constellation of apps (random per-process half) and monotonic within this process (counter half), and cheaper than
+    /// Guid.NewGuid() for high-rate requests since there's no random number generation per id.
+    /// </summary>
+    public static string NewTrackingId() {
+        long counter = Interlocked.Increment(ref _trackingIdCounter);
+        return string.Create(36, counter, (span, value) => {
+            Span<char> hex = stackalloc char[32];
+            _trackingIdPrefix.AsSpan().CopyTo(hex);
+            value.TryFormat(hex[16..], out _, "x16");
+
+            // xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
+            hex[..8].CopyTo(span);
+            span[8] = '-';
+            hex[8..12].CopyTo(span[9..]);
+            span[13] = '-';
+            hex[12..16].CopyTo(span[14..]);
+            span[18] = '-';
+            hex[16..20].CopyTo(span[19..]);
+            span[23] = '-';
+            hex[20..].CopyTo(span[24..]);
+        });
+    }
+
     public static Task<bool> WaitForService(string appId, int? responseTimeoutSecs = null) => Task.Run(async () => {
         bool heardService = false;
         List<MessageFormats.Common.HeartBeatPulse> allServices;
@@ -53,6 +53,33 @@ public class LinkTests : IClassFixture<TestSharedContext> {
         SendFileToSubdirectory();
     }
 
+    [Fact]
+    public void StartFileTracksTransfer() {
+        Link.LinkTransfer? transfer = null;
+        MessageFormats.HostServices.Link.LinkResponse? linkResponse = null;
+
+        PrepInboxAndOutboxDirectories();
+
+        Console.WriteLine($"Starting transfer of file '{TEST_FILE}'...");
+
+        Task.Run(async () => {
+            transfer = await Link.StartFileToApp(destinationAppId: Client.APP_ID, file: TEST_FILE, overwriteDestinationFile: true);
+            linkResponse = await transfer.Completion;
+        });
+
+        DateTime maxTimeToWait = DateTime.Now.Add(TestSharedContext.MAX_TIMESPAN_TO_WAIT_FOR_MSG);
+
+        while (linkResponse == null && DateTime.Now <= maxTimeToWait) {
+            Thread.Sleep(100);
+        }
+
+        if (linkResponse == null || transfer == null) throw new TimeoutException($"Failed to hear {nameof(linkResponse)} after {TestSharedContext.MAX_TIMESPAN_TO_WAIT_FOR_MSG}.  Please check that {TARGET_SERVICE_APP_ID} is deployed");
+
+        Assert.Equal(Microsoft.Azure.SpaceFx.MessageFormats.Common.StatusCodes.Successful, linkResponse.ResponseHeader.Status);
+        Assert.True(transfer.IsCompleted);
+        Assert.DoesNotContain(Link.GetTransfers(), tracked => tracked.TrackingId == transfer.TrackingId);
+    }
+
     private void SendFileToSubdirectory() {
         DateTime maxTimeToWait = DateTime.Now.Add(TestSharedContext.MAX_TIMESPAN_TO_WAIT_FOR_MSG);
         MessageFormats.HostServices.Link.LinkResponse? linkResponse = null;
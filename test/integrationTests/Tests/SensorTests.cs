@@ -114,4 +114,45 @@ public class SensorTests : IClassFixture<TestSharedContext> {
         #endregion
 
     }
+
+    [Fact]
+    public void SensorDataIsOnlySpilledForPythonSubscribers() {
+        string spillDirectory = Path.Combine(Path.GetTempPath(), $"sensordata-spill-test-{Guid.NewGuid()}");
+        var handler = new Client.MessageHandler<SensorData>(Microsoft.Extensions.Logging.Abstractions.NullLogger<Client.MessageHandler<SensorData>>.Instance, new Microsoft.Extensions.DependencyInjection.ServiceCollection().BuildServiceProvider());
+        var directToApp = new MessageFormats.Common.DirectToApp() { SourceAppId = TARGET_SERVICE_APP_ID };
+        var sensorData = new SensorData() {
+            ResponseHeader = new MessageFormats.Common.ResponseHeader() { TrackingId = Guid.NewGuid().ToString(), Status = MessageFormats.Common.StatusCodes.Successful },
+            SensorID = TEST_SENSOR_ID,
+            Data = new Any() { TypeUrl = "type.googleapis.com/test.Payload", Value = ByteString.CopyFrom(new byte[4096]) }
+        };
+
+        (SensorData header, string payloadPath, long payloadLength)? spilled = null;
+        void SpilledHandler(byte[] sensorDataHeader, string payloadPath, long payloadLength) {
+            spilled = (SensorData.Parser.ParseFrom(sensorDataHeader), payloadPath, payloadLength);
+        }
+
+        Client.SensorDataSpillThresholdBytes = 1024;
+        Client.SensorDataSpillDirectory = spillDirectory;
+        try {
+            Console.WriteLine("Routing SensorData with no Python subscriber...");
+            handler.MessageReceived(sensorData, directToApp);
+            Assert.False(Directory.Exists(spillDirectory) && Directory.EnumerateFiles(spillDirectory).Any(), "SensorData was spilled with no Python subscriber");
+
+            Console.WriteLine("Routing SensorData with a Python subscriber...");
+            Client.SensorDataSpilledEventPython += SpilledHandler;
+            handler.MessageReceived(sensorData, directToApp);
+
+            Assert.NotNull(spilled);
+            Assert.Equal(sensorData.Data.Value.Length, spilled.Value.payloadLength);
+            Assert.Equal(sensorData.Data.Value.ToByteArray(), File.ReadAllBytes(spilled.Value.payloadPath));
+            Assert.Equal(sensorData.Data.TypeUrl, spilled.Value.header.Data.TypeUrl);
+            Assert.True(spilled.Value.header.Data.Value.IsEmpty);
+            Assert.Equal(sensorData.ResponseHeader.TrackingId, spilled.Value.header.ResponseHeader.TrackingId);
+        } finally {
+            Client.SensorDataSpilledEventPython -= SpilledHandler;
+            Client.SensorDataSpillThresholdBytes = 0;
+            Client.SensorDataSpillDirectory = null;
+            if (Directory.Exists(spillDirectory)) Directory.Delete(spillDirectory, recursive: true);
+        }
+    }
 }
@@ -44,4 +44,51 @@ public class ServicesHeardTests : IClassFixture<TestSharedContext> {
 
         Assert.True(TestSharedContext.HEALTH_CHECK_RECEIVED);
     }
+
+    [Fact]
+    public void RegisteredHealthCheckIsCached() {
+        const string checkName = "integrationTestCheck";
+        bool checkCalled = false;
+        DateTime maxTimeToWait = DateTime.Now.Add(Health.CheckInterval * 3);
+
+        Health.RegisterCheck(checkName, () => {
+            checkCalled = true;
+            return true;
+        }, timeout: TimeSpan.FromSeconds(2));
+
+        Health.HealthCheckResult? result = null;
+        while (result == null && DateTime.Now <= maxTimeToWait) {
+            Thread.Sleep(100);
+            result = Health.GetResults().FirstOrDefault(_result => _result.Name == checkName);
+        }
+
+        Health.UnregisterCheck(checkName);
+
+        if (result == null) throw new TimeoutException($"Failed to hear a cached result for health check '{checkName}' after {Health.CheckInterval * 3}.");
+
+        Console.WriteLine($"Health check '{checkName}' returned '{result.IsHealthy}' in {result.Duration.TotalMilliseconds} ms");
+
+        Assert.True(checkCalled);
+        Assert.True(result.IsHealthy);
+        Assert.True(Health.IsHealthy());
+    }
+
+    [Fact]
+    public void TrackingIdsAreUniqueAndOrdered() {
+        List<string> trackingIds = Enumerable.Range(0, 1000).Select(_ => Utils.NewTrackingId()).ToList();
+
+        Assert.Equal(trackingIds.Count, trackingIds.Distinct().Count());
+        Assert.Equal(trackingIds, trackingIds.OrderBy(trackingId => trackingId, StringComparer.Ordinal));
+
+        // Tracking ids used to be Guids, so they must still be in Guid.ToString()'s format
+        Assert.All(trackingIds, trackingId => {
+            Assert.True(Guid.TryParseExact(trackingId, "D", out Guid parsed));
+            Assert.Equal(trackingId, parsed.ToString());
+        });
+
+        // Concurrent callers still get unique ids
+        System.Collections.Concurrent.ConcurrentBag<string> concurrentIds = new();
+        Parallel.For(0, 10000, _ => concurrentIds.Add(Utils.NewTrackingId()));
+        Assert.Equal(concurrentIds.Count, concurrentIds.Distinct().Count());
+    }
 }
@@ -1,17 +1,23 @@
 import logging
+import math
 import os
 import sys
+import tempfile
 import time
+from multiprocessing import shared_memory
 
 root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
 sys.path.append(root_dir)
 
 import spacefx
 
+from spacefx.protos.position.Position_pb2 import PositionResponse
 from spacefx.protos.sensor.Sensor_pb2 import SensorData
 from spacefx.protos.common.Common_pb2 import StatusCodes
 
-logger = spacefx.logger(level=logging.INFO)
+# Replaced with the SpaceFx logger in main().  Sensor data worker processes re-import this module, and creating the
+# SpaceFx logger here would start the .NET runtime in each of them
+logger = logging.getLogger("integrationTest")
 
 
 def process_sensor_data(sensor_data: SensorData):
@@ -21,6 +27,197 @@ def process_sensor_data(sensor_data: SensorData):
     logger.info(f"Data: {sensor_data.data}")
 
 
+def process_sensor_data_in_worker(sensor_data: SensorData):
+    # Runs in a sensor data worker process, which should never have loaded the SDK
+    return sensor_data.sensorID, len(sensor_data.data.value), "spacefx._sdk_client" in sys.modules
+
+
+def sensor_process_pool():
+    logger.info("----SENSOR PROCESS POOL: START-----")
+    message_count = 200
+    results = []
+
+    # Created directly rather than through subscribe_to_sensor_data so live sensor data doesn't mix with the test messages.
+    # The ring is small enough that the larger messages don't fit and are sent to the workers directly
+    pool = spacefx.sensor.SensorDataProcessPool(callback_function=process_sensor_data_in_worker, processes=4, ordered=True,
+                                                result_callback=results.append, ring_size_bytes=16 * 1024)
+    shm_name = pool._shm.name
+
+    logger.info(f"Pushing {message_count} messages through the pool...")
+    for i in range(message_count):
+        sensor_data = SensorData(sensorID=f"process_pool_test_{i}")
+        sensor_data.data.value = bytes(i * 100)
+        pool.submit(sensor_data.SerializeToString())
+
+    pool.shutdown(wait=True)
+
+    expected = [(f"process_pool_test_{i}", i * 100, False) for i in range(message_count)]
+    assert results == expected, f"Expected {message_count} results in order, heard {len(results)}: {results[:5]}..."
+
+    worker_callback_name = spacefx.diagnostics.callback_name("SensorData", process_sensor_data_in_worker)
+    worker_stats = [entry for entry in spacefx.diagnostics.get_callback_stats() if entry["name"] == worker_callback_name]
+    assert worker_stats and worker_stats[0]["count"] >= message_count, f"Worker callback timings were not recorded: {worker_stats}"
+
+    try:
+        shared_memory.SharedMemory(name=shm_name).close()
+        raise AssertionError(f"Shared memory '{shm_name}' was not unlinked by shutdown")
+    except FileNotFoundError:
+        pass
+
+    logger.info(f"All {message_count} messages processed in order and shared memory '{shm_name}' released")
+    logger.info("----SENSOR PROCESS POOL: END-----")
+
+
+def sensor_data_spill():
+    logger.info("----SENSOR DATA SPILL: START-----")
+    test_sensor_id = f"spill_test_{os.getpid()}"
+    payload = os.urandom(64 * 1024)
+    received = {}
+    pool_results = []
+
+    def on_sensor_data(sensor_data: SensorData):
+        if sensor_data.sensorID == test_sensor_id:
+            received["sensor_data"] = sensor_data.data.value
+
+    def on_sensor_data_handle(handle):
+        if isinstance(handle, spacefx.sensor.SensorDataHandle) and handle.header.sensorID == test_sensor_id:
+            received["handle"] = bytes(handle.data)
+
+    spacefx.sensor.subscribe_to_sensor_data(callback_function=on_sensor_data)
+    spacefx.sensor.subscribe_to_sensor_data(callback_function=on_sensor_data_handle, lazy=True)
+    pool = spacefx.sensor.subscribe_to_sensor_data(callback_function=process_sensor_data_in_worker, execution_mode="process", processes=1,
+                                                   result_callback=lambda result: pool_results.append(result) if result[0] == test_sensor_id else None)
+
+    # Stands in for the client app, which writes the payload to a file and raises the spilled event with the rest of the message
+    payload_path = os.path.join(tempfile.mkdtemp(), "payload.bin")
+    with open(payload_path, "wb") as payload_file:
+        payload_file.write(payload)
+    header = SensorData(sensorID=test_sensor_id)
+    header.data.type_url = "type.googleapis.com/test.Payload"
+
+    logger.info(f"Routing a spilled payload of {len(payload)} bytes...")
+    spacefx.sensor._sensor_data_spill_handler(header.SerializeToString(), payload_path, len(payload))
+
+    pool.shutdown(wait=True)
+    deadline = time.time() + 10
+    while (len(received) < 2 or os.path.exists(payload_path)) and time.time() < deadline:
+        time.sleep(0.1)
+
+    assert received.get("sensor_data") == payload, "Thread subscriber did not receive the spilled payload"
+    assert received.get("handle") == payload, "Lazy subscriber did not receive the spilled payload"
+    assert pool_results == [(test_sensor_id, len(payload), False)], f"Process pool did not read the spilled payload: {pool_results}"
+    assert not os.path.exists(payload_path), f"Spilled payload '{payload_path}' was not deleted"
+    os.rmdir(os.path.dirname(payload_path))
+
+    logger.info("Spilled payload delivered to every subscriber and deleted")
+    logger.info("----SENSOR DATA SPILL: END-----")
+
+
+def slow_diagnostics_callback(seconds: float):
+    time.sleep(seconds)
+
+
+def nested_diagnostics_callback() -> int:
+    spacefx.diagnostics.timed_call("diagnostics_test:inner", time.sleep, 0.01)
+    # The outer call must still be in flight after the inner call returns
+    return next((entry["in_flight"] for entry in spacefx.diagnostics.get_callback_stats() if entry["name"] == "diagnostics_test:outer"), 0)
+
+
+def diagnostics_service():
+    logger.info("----DIAGNOSTICS: START-----")
+    spacefx.diagnostics.configure(slow_callback_threshold_seconds=0.2)
+    spacefx.diagnostics.reset_callback_stats()
+
+    try:
+        logger.info("Timing a fast and a slow callback...")
+        spacefx.diagnostics.timed_call("diagnostics_test:fast", time.sleep, 0.01)
+        spacefx.diagnostics.timed_call("diagnostics_test:slow", time.sleep, 0.5)
+        stats = {entry["name"]: entry for entry in spacefx.diagnostics.get_callback_stats() if entry["source"] == "python"}
+        assert stats["diagnostics_test:fast"]["count"] == 1 and stats["diagnostics_test:fast"]["slow_count"] == 0, stats["diagnostics_test:fast"]
+        assert stats["diagnostics_test:slow"]["count"] == 1 and stats["diagnostics_test:slow"]["slow_count"] == 1, stats["diagnostics_test:slow"]
+
+        logger.info("Timing a nested callback...")
+        outer_in_flight = spacefx.diagnostics.timed_call("diagnostics_test:outer", nested_diagnostics_callback)
+        assert outer_in_flight == 1, f"Expected the outer callback to be in flight during the inner callback, heard {outer_in_flight}"
+
+        logger.info("Profiling a slow callback...")
+        spacefx.diagnostics.enable_profiler(interval_seconds=0.02)
+        assert spacefx.diagnostics.is_profiler_enabled()
+        spacefx.diagnostics.timed_call("diagnostics_test:profiled", slow_diagnostics_callback, 0.5)
+        spacefx.diagnostics.disable_profiler()
+        assert not spacefx.diagnostics.is_profiler_enabled()
+
+        stacks = spacefx.diagnostics.get_slow_callback_stacks().get("diagnostics_test:profiled", [])
+        assert stacks and "slow_diagnostics_callback" in stacks[0][0], f"Profiler did not sample the slow callback: {stacks}"
+        sample_count = sum(samples for _, samples in stacks)
+
+        logger.info("Checking the disabled profiler doesn't sample...")
+        spacefx.diagnostics.timed_call("diagnostics_test:profiled", slow_diagnostics_callback, 0.5)
+        stacks = spacefx.diagnostics.get_slow_callback_stacks().get("diagnostics_test:profiled", [])
+        assert sum(samples for _, samples in stacks) == sample_count, "Profiler kept sampling after it was disabled"
+    finally:
+        spacefx.diagnostics.disable_profiler()
+        spacefx.diagnostics.configure(slow_callback_threshold_seconds=1.0)
+
+    logger.info("----DIAGNOSTICS: END-----")
+
+
+def health_check_result(name: str, timeout_seconds: float = 10):
+    deadline = time.time() + timeout_seconds
+    while time.time() < deadline:
+        result = next((entry for entry in spacefx.health.get_health_report() if entry["name"] == name), None)
+        if result is not None:
+            return result
+        time.sleep(0.1)
+    raise TimeoutError(f"Failed to hear a cached result for health check '{name}' after {timeout_seconds} seconds")
+
+
+def slow_health_check() -> bool:
+    time.sleep(2)
+    return True
+
+
+def health_service():
+    logger.info("----HEALTH: START-----")
+    spacefx.health.configure(check_interval_seconds=0.5)
+
+    @spacefx.health.check
+    def integration_test_healthy() -> bool:
+        return True
+
+    try:
+        logger.info("Checking a decorated health check is reported...")
+        result = health_check_result("integration_test_healthy")
+        assert result["is_healthy"], result
+        assert spacefx.health.is_healthy(), spacefx.health.get_health_report()
+
+        logger.info("Checking a failing health check makes the app unhealthy...")
+        spacefx.health.register_check(lambda: False, name="integration_test_failing")
+        result = health_check_result("integration_test_failing")
+        assert not result["is_healthy"], result
+        assert not spacefx.health.is_healthy()
+
+        assert spacefx.health.unregister_check("integration_test_failing")
+        assert all(entry["name"] != "integration_test_failing" for entry in spacefx.health.get_health_report())
+        assert spacefx.health.is_healthy(), spacefx.health.get_health_report()
+
+        logger.info("Checking a health check that times out makes the app unhealthy...")
+        spacefx.health.register_check(slow_health_check, name="integration_test_timeout", timeout_seconds=0.2)
+        result = health_check_result("integration_test_timeout")
+        # Later evaluations report the first one as still running rather than starting another
+        assert not result["is_healthy"] and ("timed out" in result["message"] or "still running" in result["message"]), result
+        assert not spacefx.health.is_healthy()
+
+        assert spacefx.health.unregister_check("integration_test_timeout")
+        assert spacefx.health.is_healthy(), spacefx.health.get_health_report()
+    finally:
+        for name in ("integration_test_healthy", "integration_test_failing", "integration_test_timeout"):
+            spacefx.health.unregister_check(name)
+        spacefx.health.configure(check_interval_seconds=5)
+
+    logger.info("----HEALTH: END-----")
+
+
 def sensor_service():
     logger.info("----SENSOR SERVICE: START-----")
     spacefx.sensor.subscribe_to_sensor_data(callback_function=process_sensor_data)
@@ -70,6 +267,30 @@ def link_service():
     testfile = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sampleData", "astronaut.jpg")
     link_response = spacefx.link.send_file_to_app("spacesdk-client", testfile, overwrite_destination_file=True)
     logger.info(f"Result: {StatusCodes.Name(link_response.responseHeader.status)}")
+
+    logger.info("Starting a tracked transfer to app...")
+    link_transfer = spacefx.link.start_file_to_app("spacesdk-client", testfile, overwrite_destination_file=True,
+                                                   progress_callback=lambda response: logger.info(f"Transfer progress: {StatusCodes.Name(response.responseHeader.status)}"))
+    logger.info(f"Transfer Result: {StatusCodes.Name(link_transfer.result().responseHeader.status)}")
+
+    logger.info("Subscribing to the inbox...")
+    inbox_files = []
+    inbox_subscription = spacefx.link.subscribe_to_inbox(callback_function=inbox_files.append, patterns=["inbox_subscription_test_*.txt"])
+
+    logger.info("Writing a file into the inbox...")
+    inbox_test_file = os.path.join(xfer_directory['inbox'], f"inbox_subscription_test_{os.getpid()}.txt")
+    with open(inbox_test_file, "w") as test_file:
+        test_file.write("inbox subscription test")
+
+    deadline = time.time() + 30
+    while not inbox_files and time.time() < deadline:
+        time.sleep(0.25)
+    # Give a duplicate notification time to arrive before checking the file was reported exactly once
+    time.sleep(1)
+    inbox_subscription.stop()
+    os.remove(inbox_test_file)
+    logger.info(f"Inbox files heard: {inbox_files}")
+    assert inbox_files == [inbox_test_file], f"Expected '{inbox_test_file}' to be reported exactly once, heard {inbox_files}"
     logger.info("----LINK SERVICE: END-----")
 
 
@@ -84,6 +305,18 @@ def logging_service():
         logger.debug("Trigger log #%s" % i)
 
     logger.info("Successfully triggered 1000 logs to the logging service")
+
+    logger.info("Sending a batch of 1000 logs to the logging service...")
+    batch_result = spacefx.logging.send_log_messages(["Batched log #%s" % i for i in range(1000)])
+    logger.info(f"Batch Result: {batch_result.sent} sent, {batch_result.failed} failed")
+    assert batch_result.requested == 1000, f"Expected 1000 log messages in the batch, got {batch_result.requested}"
+    assert batch_result.sent == 1000 and batch_result.failed == 0, f"Expected all 1000 log messages to be sent: {batch_result}"
+
+    logger.info("Sending a batch of 100 telemetry metrics to the logging service...")
+    telemetry_batch_result = spacefx.logging.send_telemetry_batch([("test_batch_metric", i) for i in range(100)])
+    logger.info(f"Telemetry Batch Result: {telemetry_batch_result.sent} sent, {telemetry_batch_result.failed} failed")
+    assert telemetry_batch_result.requested == 100, f"Expected 100 telemetry metrics in the batch, got {telemetry_batch_result.requested}"
+    assert telemetry_batch_result.sent == 100 and telemetry_batch_result.failed == 0, f"Expected all 100 telemetry metrics to be sent: {telemetry_batch_result}"
     logger.info("----LOGGING SERVICE: END-----")
 
 
@@ -93,10 +326,37 @@ def position_service():
     current_pos = spacefx.position.request_position()
     logger.info(f"Status: {StatusCodes.Name(current_pos.responseHeader.status)}")
     logger.info(f"Current position: {current_pos.position.point}")
+
+    logger.info("Querying the position cache")
+    with spacefx.position.PositionCache(poll_interval_seconds=0.5) as position_cache:
+        time.sleep(2)
+        # hostsvc-position returns NOT_FOUND until it's been sent a position, so the cache stays empty
+        cached_positions = position_cache.positions_at([time.time()])
+        logger.info(f"Cached position: {cached_positions.points[0]}")
+
+    logger.info("Interpolating known positions")
+    # x = t^2 is reproduced exactly by Hermite (including the edge segments), and y = 10t by linear interpolation
+    for interpolation, expected in (("hermite", {1000.5: 0.25, 1001.5: 2.25, 1003.5: 12.25}), ("linear", {1000.5: 0.5, 1001.5: 2.5, 1003.5: 12.5})):
+        position_cache = spacefx.position.PositionCache(interpolation=interpolation)
+        for t in range(5):
+            sample = PositionResponse()
+            sample.responseHeader.status = StatusCodes.SUCCESSFUL
+            sample.position.positionTime.FromNanoseconds((1000 + t) * 1_000_000_000)
+            sample.position.point.x, sample.position.point.y = t * t, 10 * t
+            sample.position.attitude.k = 1
+            position_cache.add_sample(sample)
+
+        interpolated = position_cache.positions_at(list(expected.keys()))
+        for (timestamp, expected_x), point in zip(expected.items(), interpolated.points):
+            assert math.isclose(point[0], expected_x, abs_tol=1e-9), f"{interpolation} x at {timestamp}: expected {expected_x}, got {point[0]}"
+            assert math.isclose(point[1], 10 * (timestamp - 1000), abs_tol=1e-9), f"{interpolation} y at {timestamp}: expected {10 * (timestamp - 1000)}, got {point[1]}"
+        logger.info(f"{interpolation} positions match: {interpolated.points[:, 0]}")
     logger.info("----POSITION SERVICE: END-----")
 
 
 def main():
+    global logger
+    logger = spacefx.logger(level=logging.INFO)
 
     print("Building SpaceFX Client")
     spacefx.client.build()
@@ -118,8 +378,12 @@ def main():
     for _, appId in enumerate(services_online):
         logger.info(f"    AppID: {appId.AppId}")
 
+    diagnostics_service()
+    health_service()
     position_service()
     sensor_service()
+    sensor_process_pool()
+    sensor_data_spill()
     link_service()
     logging_service()
     logger.info("---------------------------")